@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.messages import constants as messages
-from django_q.tasks import async_task
+
+from utils.tasks import async_task
 
 from .auth import refresh_tokens
 from .models import AccessToken, ActionDocument
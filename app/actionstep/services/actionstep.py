@@ -9,8 +9,11 @@ from actionstep.constants import ActionType, Participant
 from actionstep.models import ActionDocument
 from core.models import Issue
 from core.models.issue import CaseTopic
+from core.services.issue_cache import invalidate_issue_cache
+from core.services.workload import update_paralegal_workloads
 from slack.services import send_slack_message
 from utils.sentry import WithSentryCapture
+from utils.tasks import task_options
 
 from .pdf import create_pdf
 
@@ -31,6 +34,9 @@ ACTION_TYPE_LOOKUP = {
 }
 
 
+# Not retried: the steps after the PDF upload aren't idempotent, so each retry
+# would upload another copy of the files.
+@task_options(lane="integrations", timeout=5 * 60)
 def _send_issue_actionstep(issue_pk: str):
     """
     Send a issue to Actionstep.
@@ -93,6 +99,7 @@ def _send_issue_actionstep(issue_pk: str):
             participant_id=owner_data["id"],
         )
         Issue.objects.filter(pk=issue_pk).update(fileref=fileref_name)
+        invalidate_issue_cache([issue_pk])
         action_id = action_data["id"]
         client_id = participant_data["id"]
         api.participants.set_action_participant(action_id, client_id, Participant.CLIENT)
@@ -118,6 +125,8 @@ def _send_issue_actionstep(issue_pk: str):
 
     logger.info("Marking Actionstep integration complete for Issue<%s>", issue.id)
     Issue.objects.filter(pk=issue.pk).update(is_case_sent=True, actionstep_id=action_id)
+    # Updates don't send post_save, so the cached case header is cleared here.
+    invalidate_issue_cache([issue.pk])
 
     # Try send a Slack message
     logging.info("Notifying Slack of Actionstep integration for Issue<%s>", issue_pk)
@@ -135,6 +144,7 @@ def _send_issue_actionstep(issue_pk: str):
 send_issue_actionstep = WithSentryCapture(_send_issue_actionstep)
 
 
+@task_options(lane="bulk", max_attempts=3, timeout=5 * 60)
 def _upload_action_document(doc_pk: str):
     """
     Send a issue to Actionstep.
@@ -157,6 +167,7 @@ def _upload_action_document(doc_pk: str):
 upload_action_document = WithSentryCapture(_upload_action_document)
 
 
+@task_options(lane="bulk", timeout=15 * 60)
 def _sync_paralegals():
     # from actionstep.services.actionstep import _sync_paralegals;_sync_paralegals()
     issues = Issue.objects.filter(
@@ -203,6 +214,12 @@ def _sync_paralegals():
                         User.objects.filter(pk=user.pk).update(last_name=last)
 
                 Issue.objects.filter(pk=issue.pk).update(paralegal=user)
+                update_paralegal_workloads([issue.paralegal_id, user.pk])
+                # The paralegal's name may have been filled in too, which is shown in
+                # the header of each of their cases.
+                invalidate_issue_cache(
+                    Issue.objects.filter(paralegal=user).values_list("pk", flat=True)
+                )
 
 
 sync_paralegals = WithSentryCapture(_sync_paralegals)
@@ -2,10 +2,10 @@ import logging
 
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from django_q.tasks import async_task
 
 from actionstep.models import ActionDocument
 from actionstep.services.actionstep import upload_action_document
+from utils.tasks import async_task
 
 logger = logging.getLogger(__name__)
 
@@ -5,6 +5,7 @@ import pytest
 from actionstep.services.actionstep import _send_issue_actionstep
 from core.factories import ClientFactory, IssueFactory, TenancyFactory
 from core.models.issue import Issue
+from core.services.issue_cache import get_issue_version
 
 
 @pytest.mark.django_db
@@ -111,8 +112,12 @@ def test_issue_actionstep(mock_api, mock_send_slack_message):
     mock_api.reset_mock()
 
     # Test when issue has no action
+    version = get_issue_version(issue.pk)
     _send_issue_actionstep(issue.pk)
     res_issue = Issue.objects.get(pk=issue.id)
     assert mock_api.return_value.actions.create.call_count == 1
     assert mock_api.return_value.files.upload.call_count == 1
     assert res_issue.is_case_sent
+    assert res_issue.fileref == action["reference"]
+    # The cached case header is rebuilt with the new fileref.
+    assert get_issue_version(issue.pk) != version
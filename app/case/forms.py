@@ -3,6 +3,7 @@ from django.forms.fields import BooleanField
 
 from accounts.models import User
 from core.models import Issue, IssueNote
+from core.services.search import search_issues
 
 
 class ParalegalNoteForm(forms.ModelForm):
@@ -54,9 +55,11 @@ class IssueSearchForm(forms.ModelForm):
             "is_open",
         ]
 
+    q = forms.CharField(label="Search", required=False, max_length=256)
+
     def search(self, issue_qs):
         for k, v in self.data.items():
-            if k not in self.fields:
+            if k not in self.fields or k == "q":
                 continue
 
             if type(self.fields[k]) is BooleanField:
@@ -69,8 +72,14 @@ class IssueSearchForm(forms.ModelForm):
             if is_field_valid:
                 issue_qs = issue_qs.filter(**{k: filter_value})
 
+        if self.get_query():
+            issue_qs = search_issues(issue_qs, self.get_query())
+
         return issue_qs
 
+    def get_query(self):
+        return self.data.get("q", "").strip()[:256]
+
 
 class IssueProgressForm(forms.ModelForm):
     class Meta:
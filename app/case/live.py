@@ -0,0 +1,209 @@
+"""
+Live updates for open case pages, as server-sent events.
+
+Postgres triggers NOTIFY the case_events channel when an issue or note changes,
+see core migration 0035. Each async web worker holds one LISTEN connection and
+fans notifications out to the event streams of the pages that are open, which
+then fetch the updated parts of the page with htmx.
+
+Event streams are long-lived, so they are served by a separate ASGI app, see
+clerk.asgi, rather than by the sync web workers.
+"""
+
+import asyncio
+import json
+import logging
+from http.cookies import SimpleCookie
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+import psycopg2
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.db import close_old_connections, connections
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "case_events"
+EVENTS_PATH = "/case/live/events/"
+# seconds between comments sent to keep idle streams open through proxies
+KEEPALIVE_INTERVAL = 25
+# seconds to wait before reconnecting a lost LISTEN connection
+RECONNECT_DELAY = 5
+# Events buffered for a slow client before they are dropped.
+MAX_QUEUED_EVENTS = 100
+
+
+class CaseEventListener:
+    """
+    Listens for case events on a dedicated Postgres connection, driven by the
+    event loop, and passes them on to subscribers.
+    """
+
+    def __init__(self):
+        self.conn = None
+        self.loop = None
+        self.subscribers = {}
+
+    def subscribe(self, issue_pk=None) -> asyncio.Queue:
+        """
+        Returns a queue of events for an issue, or for every issue.
+        """
+        self.ensure_listening()
+        queue = asyncio.Queue(maxsize=MAX_QUEUED_EVENTS)
+        self.subscribers[queue] = issue_pk
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.pop(queue, None)
+
+    def dispatch(self, payload: str):
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Invalid case event %s", payload)
+            return
+
+        for queue, issue_pk in self.subscribers.items():
+            if issue_pk and issue_pk != event.get("issue"):
+                continue
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                pass  # The page can catch up when it is reloaded.
+
+    def ensure_listening(self):
+        if self.conn is not None:
+            return
+
+        self.loop = asyncio.get_event_loop()
+        try:
+            params = connections["default"].get_connection_params()
+            conn = psycopg2.connect(**params)
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+        except psycopg2.Error:
+            logger.exception("Could not LISTEN for case events")
+            self.loop.call_later(RECONNECT_DELAY, self.ensure_listening)
+            return
+
+        self.conn = conn
+        self.loop.add_reader(conn.fileno(), self.on_readable)
+
+    def on_readable(self):
+        try:
+            self.conn.poll()
+        except (psycopg2.Error, OSError):
+            logger.exception("Lost LISTEN connection for case events")
+            self.close()
+            self.loop.call_later(RECONNECT_DELAY, self.ensure_listening)
+            return
+
+        while self.conn.notifies:
+            self.dispatch(self.conn.notifies.pop(0).payload)
+
+    def close(self):
+        if self.conn is not None:
+            self.loop.remove_reader(self.conn.fileno())
+            try:
+                self.conn.close()
+            except psycopg2.Error:
+                pass
+
+        self.conn = None
+
+
+listener = CaseEventListener()
+
+
+async def case_events_app(scope, receive, send):
+    """
+    ASGI app which streams case events to a signed in superuser.
+    Pass ?issue=<pk> to only receive events for one issue.
+    """
+    headers = get_cors_headers(scope)
+    if not await is_superuser(scope):
+        await send({"type": "http.response.start", "status": 403, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    query = parse_qs(scope["query_string"].decode())
+    issue_pk = query.get("issue", [None])[0]
+    queue = listener.subscribe(issue_pk)
+    disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+    try:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": headers
+                + [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                    # Don't let nginx buffer the stream.
+                    (b"x-accel-buffering", b"no"),
+                ],
+            }
+        )
+        while not disconnected.done():
+            try:
+                event = await asyncio.wait_for(queue.get(), KEEPALIVE_INTERVAL)
+                body = format_event(event)
+            except asyncio.TimeoutError:
+                body = b": keepalive\n\n"
+
+            await send({"type": "http.response.body", "body": body, "more_body": True})
+    finally:
+        listener.unsubscribe(queue)
+        disconnected.cancel()
+
+
+def format_event(event) -> bytes:
+    return f"event: {event['kind']}\ndata: {json.dumps(event)}\n\n".encode()
+
+
+async def wait_for_disconnect(receive):
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+@sync_to_async
+def is_superuser(scope) -> bool:
+    """
+    Whether the request's session belongs to an active superuser.
+    """
+    cookies = SimpleCookie()
+    for name, value in scope["headers"]:
+        if name == b"cookie":
+            cookies.load(value.decode("latin-1"))
+
+    session_cookie = cookies.get(settings.SESSION_COOKIE_NAME)
+    if not session_cookie:
+        return False
+
+    close_old_connections()
+    try:
+        session_store = import_string(settings.SESSION_ENGINE + ".SessionStore")
+        user = get_user(SimpleNamespace(session=session_store(session_cookie.value)))
+        return user.is_active and user.is_superuser
+    finally:
+        close_old_connections()
+
+
+def get_cors_headers(scope):
+    """
+    Allow pages on other origins, eg. the dev server, to open event streams.
+    """
+    for name, value in scope["headers"]:
+        if name == b"origin" and value.decode() in settings.CASE_EVENTS_ALLOWED_ORIGINS:
+            return [
+                (b"access-control-allow-origin", value),
+                (b"access-control-allow-credentials", b"true"),
+            ]
+
+    return []
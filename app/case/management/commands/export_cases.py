@@ -0,0 +1,40 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from case.forms import IssueSearchForm
+from core.models import Issue
+from core.services.export import CSV, EXPORT_FORMATS, stream_export
+
+
+class Command(BaseCommand):
+    help = "Export cases and client demographics as CSV or JSON lines"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=EXPORT_FORMATS.keys(), default=CSV)
+        parser.add_argument("--output", help="File to write to, defaults to stdout")
+        # Same filters as the case list, see IssueSearchForm.
+        parser.add_argument("--topic")
+        parser.add_argument("--stage")
+        parser.add_argument("--outcome")
+        parser.add_argument("--is-open", choices=["True", "False"])
+        parser.add_argument("--provided-legal-services", choices=["True", "False"])
+        parser.add_argument("--q", help="Text search")
+
+    def handle(self, *args, **kwargs):
+        filters = [
+            "topic",
+            "stage",
+            "outcome",
+            "is_open",
+            "provided_legal_services",
+            "q",
+        ]
+        data = {k: kwargs[k] for k in filters if kwargs[k] is not None}
+        issue_qs = IssueSearchForm(data).search(Issue.objects.order_by("created_at"))
+        chunks = stream_export(issue_qs, kwargs["format"])
+        if kwargs["output"]:
+            with open(kwargs["output"], "w", newline="") as f:
+                f.writelines(chunks)
+        else:
+            sys.stdout.writelines(chunks)
@@ -0,0 +1,110 @@
+import html
+import re
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from case.views.case import NOTES_PER_PAGE
+from core.factories import IssueFactory, PersonFactory, TenancyFactory, UserFactory
+from core.models import IssueNote
+
+
+@pytest.mark.django_db
+def test_case_detail_context_queries(client):
+    """
+    Ensure the case detail context is loaded in a fixed number of queries,
+    and the notes feed is cached until a note is added.
+    """
+    cache.clear()
+    issue = IssueFactory()
+    TenancyFactory(client=issue.client, landlord=PersonFactory(), agent=PersonFactory())
+    user = UserFactory(is_superuser=True)
+    for _ in range(3):
+        IssueNote.objects.create(issue=issue, creator=user, note_type="PARALEGAL")
+
+    client.force_login(user)
+    url = f"/case/cases/{issue.pk}/progress/"
+    first = get_case_queries(client, url)
+    assert sum("core_issuenote" in sql for sql in first) == 1
+    assert sum("core_tenancy" in sql for sql in first) == 1
+    # Landlord and agent are loaded with the tenancy.
+    assert not any('FROM "core_person"' in sql for sql in first)
+
+    # The feed is served from the cache.
+    assert not any("core_issuenote" in sql for sql in get_case_queries(client, url))
+
+    # Adding a note rebuilds the feed.
+    response = client.post(
+        f"/case/cases/{issue.pk}/progress/htmx/paralegal/",
+        {"text": "Called the landlord"},
+    )
+    assert b"Called the landlord" in response.content
+    response = client.get(url)
+    assert b"Called the landlord" in response.content
+
+
+@pytest.mark.django_db
+def test_case_notes_feed_paginated(client):
+    """
+    Ensure the notes feed is loaded a page at a time, and a new note's response
+    only has the new note.
+    """
+    cache.clear()
+    issue = IssueFactory()
+    user = UserFactory(is_superuser=True)
+    start = timezone.now() - timedelta(days=1)
+    for idx in range(NOTES_PER_PAGE + 2):
+        IssueNote.objects.create(
+            issue=issue,
+            creator=user,
+            note_type="PARALEGAL",
+            text=f"Entry {idx:02}",
+            created_at=start + timedelta(minutes=idx),
+        )
+
+    client.force_login(user)
+    response = client.get(f"/case/cases/{issue.pk}/progress/")
+    assert response.content.count(b"Entry ") == NOTES_PER_PAGE
+    assert b"Entry 11" in response.content
+    next_url = re.search(rb'hx-get="([^"]+/notes/[^"]+)"', response.content)
+    response = client.get(html.unescape(next_url.group(1).decode()))
+    assert response.content.count(b"Entry ") == 2
+    assert b"Entry 00" in response.content
+    assert b"hx-trigger" not in response.content
+
+    response = client.post(
+        f"/case/cases/{issue.pk}/progress/htmx/paralegal/", {"text": "Entry new"}
+    )
+    assert response.content.count(b"Entry ") == 1
+    assert b"afterbegin:#case-feed" in response.content
+
+
+@pytest.mark.django_db
+def test_case_header_cache_cleared_on_user_change(client):
+    """
+    Ensure the cached case header shows the paralegal's new name once they're renamed.
+    """
+    cache.clear()
+    paralegal = UserFactory(first_name="Alex", last_name="Smith")
+    issue = IssueFactory(paralegal=paralegal)
+    client.force_login(UserFactory(is_superuser=True))
+    url = f"/case/cases/{issue.pk}/progress/"
+    assert b"Alex Smith" in client.get(url).content
+
+    paralegal.last_name = "Jones"
+    paralegal.save()
+    response = client.get(url)
+    assert b"Alex Jones" in response.content
+    assert b"Alex Smith" not in response.content
+
+
+def get_case_queries(client, url):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+
+    assert response.status_code == 200
+    return [q["sql"] for q in ctx.captured_queries if '"core_' in q["sql"]]
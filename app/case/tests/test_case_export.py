@@ -0,0 +1,44 @@
+import csv
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+
+from core.factories import ClientFactory, IssueFactory, TenancyFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_case_export_streams_filtered_cases(client, tmp_path):
+    """
+    Ensure cases are exported with client demographics and their latest tenancy,
+    using the case list's search filters.
+    """
+    jane = ClientFactory(weekly_income=500, employment_status=["WORKING_PART_TIME"])
+    TenancyFactory(client=jane, postcode="3065")
+    repairs_issue = IssueFactory(client=jane, topic="REPAIRS")
+    IssueFactory(topic="EVICTION")
+    client.force_login(UserFactory(is_superuser=True))
+
+    response = client.get("/case/cases/export/?topic=REPAIRS")
+    assert response.status_code == 200
+    assert response.streaming
+    content = b"".join(response.streaming_content).decode()
+    rows = list(csv.DictReader(io.StringIO(content)))
+    assert len(rows) == 1
+    assert rows[0]["id"] == str(repairs_issue.pk)
+    assert rows[0]["weekly_income"] == "500"
+    assert rows[0]["employment_status"] == "WORKING_PART_TIME"
+    assert rows[0]["tenancy_postcode"] == "3065"
+
+    response = client.get("/case/cases/export/?format=jsonl")
+    content = b"".join(response.streaming_content).decode()
+    rows = [json.loads(line) for line in content.splitlines()]
+    assert {r["topic"] for r in rows} == {"REPAIRS", "EVICTION"}
+
+    output = tmp_path / "cases.jsonl"
+    call_command(
+        "export_cases", "--format=jsonl", "--topic=EVICTION", f"--output={output}"
+    )
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [r["topic"] for r in rows] == ["EVICTION"]
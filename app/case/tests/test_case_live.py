@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import pytest
+
+from case.live import CaseEventListener, case_events_app, format_event
+from core.factories import IssueFactory, UserFactory
+
+
+def test_case_events_dispatched_to_subscribers():
+    """
+    Ensure case events are passed to the streams subscribed to their issue,
+    or to every issue.
+    """
+    listener = CaseEventListener()
+    listener.ensure_listening = lambda: None
+    all_queue = listener.subscribe()
+    issue_queue = listener.subscribe("abc")
+    other_queue = listener.subscribe("xyz")
+
+    listener.dispatch(json.dumps({"issue": "abc", "kind": "note", "op": "INSERT"}))
+    listener.dispatch("not json")
+    assert all_queue.qsize() == 1
+    assert issue_queue.qsize() == 1
+    assert other_queue.qsize() == 0
+
+    # Unsubscribed streams get nothing.
+    listener.unsubscribe(all_queue)
+    listener.dispatch(json.dumps({"issue": "xyz", "kind": "issue", "op": "UPDATE"}))
+    assert all_queue.qsize() == 1
+    assert other_queue.get_nowait()["kind"] == "issue"
+
+
+def test_case_events_dropped_for_slow_streams():
+    listener = CaseEventListener()
+    listener.ensure_listening = lambda: None
+    queue = listener.subscribe()
+    for _ in range(queue.maxsize + 1):
+        listener.dispatch(json.dumps({"issue": "abc", "kind": "issue", "op": "UPDATE"}))
+
+    assert queue.full()
+
+
+def test_format_event():
+    event = {"issue": "abc", "kind": "note", "op": "INSERT"}
+    body = format_event(event).decode()
+    assert body.startswith("event: note\ndata: ")
+    assert body.endswith("\n\n")
+    assert json.loads(body.split("data: ")[1]) == event
+
+
+def test_case_events_require_login():
+    """
+    Ensure the event stream isn't opened without a session.
+    """
+    sent = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "path": "/case/live/events/", "headers": []}
+    asyncio.run(case_events_app(scope, receive, send))
+    assert sent[0]["status"] == 403
+
+
+@pytest.mark.django_db
+def test_case_list_row(client):
+    """
+    Ensure an updated case's row can be reloaded into the case list.
+    """
+    issue = IssueFactory(fileref="R0123")
+    client.force_login(UserFactory(is_superuser=True))
+    response = client.get(f"/case/cases/{issue.pk}/htmx/row/")
+    assert response.status_code == 200
+    assert f'id="issue-row-{issue.pk}"' in response.content.decode()
+    assert b"R0123" in response.content
+
+    response = client.get(f"/case/cases/{issue.pk}/htmx/header/?active=progress")
+    assert response.status_code == 200
+    assert b'id="case-detail-header"' in response.content
@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from core.factories import IssueFactory
+from core.models import Issue
+from utils.pagination import get_approximate_count, get_keyset_page
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_pages_forwards_and_back():
+    """
+    Ensure cursors walk through every issue exactly once, newest first,
+    including issues created at the same time.
+    """
+    now = timezone.now()
+    for idx in range(7):
+        created_at = now - timedelta(days=idx // 2)
+        IssueFactory(created_at=created_at, is_open=True)
+
+    IssueFactory(is_open=False)
+    issues = Issue.objects.filter(is_open=True)
+    expected = list(issues.order_by("-created_at", "-id"))
+
+    first = get_keyset_page(issues, None, per_page=3)
+    assert list(first) == expected[:3]
+    assert first.has_next() and not first.has_previous()
+    second = get_keyset_page(issues, first.next_cursor(), per_page=3)
+    assert list(second) == expected[3:6]
+    assert second.has_next() and second.has_previous()
+    third = get_keyset_page(issues, second.next_cursor(), per_page=3)
+    assert list(third) == expected[6:]
+    assert not third.has_next() and third.has_previous()
+
+    back = get_keyset_page(issues, third.previous_cursor(), per_page=3)
+    assert list(back) == expected[3:6]
+    back = get_keyset_page(issues, back.previous_cursor(), per_page=3)
+    assert list(back) == expected[:3]
+    assert not back.has_previous()
+
+    # Bad cursors start from the first page.
+    assert list(get_keyset_page(issues, "not-a-cursor", per_page=3)) == expected[:3]
+    assert get_approximate_count(issues) == 7
@@ -0,0 +1,147 @@
+"""
+Query plan regression tests for the case list and paralegal views.
+Seeds a realistic number of issues, then checks that Postgres uses an index,
+rather than a sequential scan, for every query the views make on core_issue.
+"""
+
+from urllib.parse import urlencode
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.factories import ClientFactory, UserFactory
+
+NUM_ISSUES = 100_000
+NUM_PARALEGALS = 50
+
+CASE_LIST_SEARCHES = [
+    {},
+    {"is_open": "True"},
+    {"is_open": "True", "topic": "REPAIRS"},
+    {"topic": "EVICTION"},
+    {"stage": "ADVICE"},
+    {"outcome": "SUCCESS"},
+    {"is_open": "False", "provided_legal_services": "True"},
+]
+
+
+@pytest.mark.django_db
+def test_case_list_uses_indexes(client):
+    """
+    Ensure every case list search, and the pages after it, is served by an index.
+    """
+    seed_issues()
+    client.force_login(UserFactory(is_superuser=True))
+    for search in CASE_LIST_SEARCHES:
+        url = "/case/cases/?" + urlencode(search)
+        response = assert_view_uses_indexes(client, url)
+        next_qs = response.context["next_qs"]
+        assert next_qs, url
+        assert_view_uses_indexes(client, "/case/cases/" + next_qs)
+
+    # Text searches use the search indexes.
+    assert_view_uses_indexes(client, "/case/cases/?q=smith")
+    # Reviews due use the next review index.
+    assert_view_uses_indexes(client, "/case/cases/?reviews=due")
+
+
+@pytest.mark.django_db
+def test_paralegal_detail_uses_indexes(client):
+    """
+    Ensure a paralegal's case load is served by an index.
+    The paralegal list reads ParalegalWorkload rather than core_issue.
+    """
+    paralegal_ids = seed_issues()
+    client.force_login(UserFactory(is_superuser=True))
+    assert_view_uses_indexes(client, f"/case/paralegals/{paralegal_ids[0]}/")
+
+
+def assert_view_uses_indexes(client, url):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+
+    assert response.status_code == 200, url
+    issue_queries = [
+        q["sql"]
+        for q in ctx.captured_queries
+        if "core_issue" in q["sql"] and not q["sql"].startswith("EXPLAIN")
+    ]
+    assert issue_queries, url
+    for sql in issue_queries:
+        scans = get_issue_scans(sql)
+        msg = f"{url} scans core_issue with {scans}:\n{sql}"
+        assert scans, msg
+        assert "Seq Scan" not in scans, msg
+
+    return response
+
+
+def get_issue_scans(sql):
+    """
+    Returns the types of plan nodes which read core_issue in the query's plan.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan = cursor.fetchone()[0]
+
+    scans = []
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        nodes += node.get("Plans", [])
+        is_issue_table = node.get("Relation Name") == "core_issue"
+        is_issue_index = node.get("Index Name", "").startswith("core_issue")
+        if is_issue_table or is_issue_index:
+            scans.append(node["Node Type"])
+
+    return scans
+
+
+def seed_issues():
+    """
+    Inserts NUM_ISSUES issues spread over 4 years, one in ten of them open,
+    assigned to NUM_PARALEGALS paralegals. Returns the paralegal ids.
+    """
+    issue_client = ClientFactory()
+    paralegal_ids = [UserFactory().pk for _ in range(NUM_PARALEGALS)]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO core_issue (
+                id, created_at, modified_at, topic, stage, outcome, outcome_notes,
+                provided_legal_services, fileref, answers, client_id, paralegal_id,
+                is_open, is_alert_sent, is_case_sent, search_text
+            )
+            SELECT
+                md5(i::text)::uuid,
+                now() - i * interval '20 minutes',
+                now(),
+                (ARRAY['REPAIRS', 'RENT_REDUCTION', 'EVICTION', 'OTHER'])[1 + i %% 4],
+                (ARRAY['SUBMITTED', 'ENGAGED', 'ADVICE', 'POST_CASE'])[1 + i %% 7 %% 4],
+                CASE WHEN i %% 10 = 0 THEN NULL ELSE (ARRAY[
+                    'UNKNOWN', 'UNRESPONSIVE', 'OUT_OF_SCOPE', 'SUCCESS', 'UNSUCCESSFUL',
+                    'REFERRED', 'ESCALATION', 'DROPPED_OUT', 'RESOLVED_EARLY'
+                ])[1 + i %% 9] END,
+                '',
+                i %% 3 = 0,
+                '',
+                '{}',
+                %(client_id)s,
+                (%(paralegal_ids)s)[1 + i %% %(num_paralegals)s],
+                i %% 10 = 0,
+                true,
+                true,
+                ''
+            FROM generate_series(1, %(num_issues)s) AS i
+            """,
+            {
+                "client_id": issue_client.pk,
+                "paralegal_ids": paralegal_ids,
+                "num_paralegals": NUM_PARALEGALS,
+                "num_issues": NUM_ISSUES,
+            },
+        )
+        cursor.execute("ANALYZE core_issue")
+
+    return paralegal_ids
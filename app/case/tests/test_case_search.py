@@ -0,0 +1,37 @@
+import pytest
+
+from case.forms import IssueSearchForm
+from core.factories import ClientFactory, IssueFactory, TenancyFactory
+from core.models import Issue
+from core.services.search import update_issue_search
+
+
+@pytest.mark.django_db
+def test_case_search_ranks_matching_issues():
+    """
+    Ensure issues can be found by client details, fileref, address and answers,
+    including misspelled names, with the best matches first.
+    """
+    jane = ClientFactory(first_name="Jane", last_name="Citizen", email="jane@example.com")
+    TenancyFactory(client=jane, address="12 Smith Street", suburb="Fitzroy")
+    jane_issue = IssueFactory(
+        client=jane, fileref="R0123", answers={"DEFECT": ["Mould in the bathroom"]}
+    )
+    other = ClientFactory(first_name="Bob", last_name="Smith", email="bob@example.com")
+    other_issue = IssueFactory(client=other, fileref="E0456", answers={})
+    update_issue_search(Issue.objects.all())
+
+    assert search("Jane Citizen") == [jane_issue]
+    assert search("Jane Citizn") == [jane_issue]
+    assert search("jane@example.com") == [jane_issue]
+    assert search("R0123") == [jane_issue]
+    assert search("Fitzroy") == [jane_issue]
+    assert search("mould bathroom") == [jane_issue]
+    # Name matches rank above address matches.
+    assert search("Smith") == [other_issue, jane_issue]
+    assert search("nobody") == []
+
+
+def search(query):
+    form = IssueSearchForm({"q": query})
+    return list(form.search(Issue.objects.all()))
@@ -12,12 +12,26 @@ urlpatterns = [
     ),
     # Cases
     path("cases/", views.case.case_list_view, name="case-list"),
+    path("cases/export/", views.export.case_export_view, name="case-export"),
+    path(
+        "cases/<uuid:pk>/htmx/row/", views.case.case_list_row_view, name="case-list-row"
+    ),
     path("cases/<uuid:pk>/", views.case.case_detail_view, name="case-detail"),
+    path(
+        "cases/<uuid:pk>/htmx/header/",
+        views.case.case_detail_header_view,
+        name="case-detail-header",
+    ),
     path(
         "cases/<uuid:pk>/progress/",
         views.case.case_detail_progress_view,
         name="case-detail-progress",
     ),
+    path(
+        "cases/<uuid:pk>/progress/htmx/notes/",
+        views.case.case_detail_notes_view,
+        name="case-detail-notes",
+    ),
     path(
         "cases/<uuid:pk>/progress/htmx/progress/",
         views.case.case_detail_progress_form_view,
@@ -33,5 +47,8 @@ urlpatterns = [
         views.case.case_detail_review_note_form_view,
         name="case-detail-review-form",
     ),
+    # Background tasks
+    path("tasks/", views.tasks.task_list_view, name="task-list"),
+    path("tasks/stats/", views.tasks.task_stats_view, name="task-stats"),
     path("", views.case.root_view, name="case-root"),
 ]
@@ -1 +1 @@
-from . import case, paralegal
+from . import case, export, paralegal, tasks
@@ -1,11 +1,13 @@
 from urllib.parse import urlencode
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
+from django.db.models import Prefetch
 from django.http import Http404
 from django.shortcuts import redirect, render
 from django.utils.datastructures import MultiValueDict
+from django.utils.functional import SimpleLazyObject
 from django.views.decorators.http import require_http_methods
 
 from case.forms import (
@@ -14,12 +16,19 @@ from case.forms import (
     ParalegalNoteForm,
     ReviewNoteForm,
 )
-from core.models import Issue, IssueNote
+from core.models import Issue, IssueNote, Tenancy
 from core.models.issue_note import NoteType
+from core.services.issue_cache import FRAGMENT_TIMEOUT, get_issue_version
+from core.services.review import get_reviews_due
+from utils.pagination import KeysetPage, get_approximate_count, get_keyset_page
 
 from django.contrib.auth.decorators import user_passes_test
 from .auth import is_superuser
 
+SEARCH_RESULTS = 50
+NOTES_PER_PAGE = 10
+REVIEWS_DUE_RESULTS = 100
+
 
 def root_view(request):
     return redirect("case-list")
@@ -32,17 +41,52 @@ def root_view(request):
 def case_list_view(request):
     form = IssueSearchForm(request.GET)
     issue_qs = Issue.objects.select_related("client", "paralegal")
-    issues = form.search(issue_qs).order_by("-created_at").all()
-    page, next_qs, prev_qs = _get_page(request, issues, per_page=14)
+    issues = form.search(issue_qs)
+    is_reviews_due = request.GET.get("reviews") == "due"
+    if is_reviews_due:
+        # Show the most overdue reviews, rather than paging by date.
+        issues = get_reviews_due(issues)
+        page = KeysetPage(
+            list(issues[:REVIEWS_DUE_RESULTS]), has_next=False, has_previous=False
+        )
+        next_qs, prev_qs = None, None
+    elif form.get_query():
+        # Show the best matches for a text search, rather than paging by date.
+        page = KeysetPage(
+            list(issues[:SEARCH_RESULTS]), has_next=False, has_previous=False
+        )
+        next_qs, prev_qs = None, None
+    else:
+        page, next_qs, prev_qs = _get_page(request, issues, per_page=14)
+
     context = {
         "issue_page": page,
+        "issue_count": get_approximate_count(issues),
         "form": form,
         "next_qs": next_qs,
         "prev_qs": prev_qs,
+        "is_reviews_due": is_reviews_due,
+        "case_events_url": settings.CASE_EVENTS_URL,
     }
     return render(request, "case/case_list.html", context)
 
 
+# FIXME: Permissions
+@login_required
+@user_passes_test(is_superuser, login_url="/")
+@require_http_methods(["GET"])
+def case_list_row_view(request, pk):
+    """
+    Returns a case's row in the case list, when the case is updated.
+    """
+    try:
+        issue = Issue.objects.select_related("client", "paralegal").get(pk=pk)
+    except Issue.DoesNotExist:
+        raise Http404()
+
+    return render(request, "case/htmx/_case_list_row.html", {"issue": issue})
+
+
 # FIXME: Permissions
 @login_required
 @user_passes_test(is_superuser, login_url="/")
@@ -58,10 +102,9 @@ def case_detail_view(request, pk):
 @require_http_methods(["GET"])
 def case_detail_progress_view(request, pk):
     context = _get_case_detail_context(request, pk)
-    notes = _get_issue_notes(pk)
     context = {
         **context,
-        "notes": notes,
+        "note_page": _get_note_page(request, pk),
         "progress_form": IssueProgressForm(instance=context["issue"]),
         "case_review_form": ReviewNoteForm(),
         "paralegal_notes_form": ParalegalNoteForm(),
@@ -74,21 +117,23 @@ def case_detail_progress_view(request, pk):
 @user_passes_test(is_superuser, login_url="/")
 @require_http_methods(["POST"])
 def case_detail_review_note_form_view(request, pk):
-    context = _get_case_detail_context(request, pk)
+    issue = _get_issue(pk)
     default_data = {
-        "issue": context["issue"],
+        "issue": issue,
         "creator": request.user,
         "note_type": NoteType.REVIEW,
     }
     form_data = _add_form_data(request.POST, default_data)
     form = ReviewNoteForm(form_data)
-    notes = None
+    new_note = None
     if form.is_valid():
-        form.save()
-        notes = _get_issue_notes(pk)
+        new_note = form.save()
         messages.success(request, "Note created")
+        # Cleared for the next note.
+        form = ReviewNoteForm()
 
-    context = {**context, "form": form, "htmx_notes": notes}
+    # Only the new note is sent, and added to the top of the notes feed.
+    context = {"issue": issue, "form": form, "new_note": new_note}
     return render(request, "case/htmx/_case_review_note_form.html", context)
 
 
@@ -97,21 +142,23 @@ def case_detail_review_note_form_view(request, pk):
 @user_passes_test(is_superuser, login_url="/")
 @require_http_methods(["POST"])
 def case_detail_paralegal_note_form_view(request, pk):
-    context = _get_case_detail_context(request, pk)
+    issue = _get_issue(pk)
     default_data = {
-        "issue": context["issue"],
+        "issue": issue,
         "creator": request.user,
         "note_type": NoteType.PARALEGAL,
     }
     form_data = _add_form_data(request.POST, default_data)
     form = ParalegalNoteForm(form_data)
-    notes = None
+    new_note = None
     if form.is_valid():
-        form.save()
-        notes = _get_issue_notes(pk)
+        new_note = form.save()
         messages.success(request, "Note created")
+        # Cleared for the next note.
+        form = ParalegalNoteForm()
 
-    context = {**context, "form": form, "htmx_notes": notes}
+    # Only the new note is sent, and added to the top of the notes feed.
+    context = {"issue": issue, "form": form, "new_note": new_note}
     return render(request, "case/htmx/_case_paralegal_note_form.html", context)
 
 
@@ -130,24 +177,73 @@ def case_detail_progress_form_view(request, pk):
     return render(request, "case/htmx/_case_progress_form.html", context)
 
 
-def _get_issue_notes(pk):
-    return (
-        IssueNote.objects.filter(issue=pk)
-        .select_related("creator")
-        .order_by("-created_at")
-        .all()
+# FIXME: Permissions
+@login_required
+@user_passes_test(is_superuser, login_url="/")
+@require_http_methods(["GET"])
+def case_detail_notes_view(request, pk):
+    """
+    Returns the next page of the notes feed, as it is scrolled.
+    """
+    context = {"issue": _get_issue(pk), "note_page": _get_note_page(request, pk)}
+    return render(request, "case/htmx/_case_feed_page.html", context)
+
+
+# FIXME: Permissions
+@login_required
+@user_passes_test(is_superuser, login_url="/")
+@require_http_methods(["GET"])
+def case_detail_header_view(request, pk):
+    """
+    Returns the case detail header, when the case is updated.
+    """
+    context = _get_case_detail_context(request, pk)
+    context["active"] = request.GET.get("active")
+    return render(request, "case/_case_detail_header.html", context)
+
+
+def _get_note_page(request, pk):
+    """
+    Returns a page of the issue's notes, newest first. The page is lazy, so no query
+    is run when the notes feed is served from the cache.
+    """
+    notes = IssueNote.objects.filter(issue=pk).select_related("creator")
+    return SimpleLazyObject(
+        lambda: get_keyset_page(notes, request.GET.get("cursor"), NOTES_PER_PAGE)
     )
 
 
+def _get_issue(pk):
+    try:
+        # FIXME: Who has access to this?
+        return Issue.objects.get(pk=pk)
+    except Issue.DoesNotExist:
+        raise Http404()
+
+
 def _get_case_detail_context(request, pk):
+    """
+    Returns the context shared by every case detail page and form, in two queries:
+    the issue with its client and paralegal, and the client's tenancies with their
+    landlord and agent.
+    """
+    tenancies = Tenancy.objects.select_related("landlord", "agent").order_by(
+        "-created_at"
+    )
     try:
         # FIXME: Who has access to this?
-        issue = Issue.objects.select_related("client").get(pk=pk)
+        issue = (
+            Issue.objects.select_related("client", "paralegal")
+            .prefetch_related(
+                Prefetch("client__tenancy_set", queryset=tenancies, to_attr="tenancies")
+            )
+            .get(pk=pk)
+        )
     except Issue.DoesNotExist:
         raise Http404()
 
     # FIXME: Assume only only tenancy but that's not how the models work.
-    tenancy = issue.client.tenancy_set.first()
+    tenancy = issue.client.tenancies[0] if issue.client.tenancies else None
 
     if issue.actionstep_id:
         actionstep_url = _get_actionstep_url(issue.actionstep_id)
@@ -158,18 +254,26 @@ def _get_case_detail_context(request, pk):
         "issue": issue,
         "tenancy": tenancy,
         "actionstep_url": actionstep_url,
+        # Cached fragments of the page are keyed on the issue's version.
+        "case_version": get_issue_version(issue.pk),
+        "fragment_timeout": FRAGMENT_TIMEOUT,
+        "case_events_url": settings.CASE_EVENTS_URL,
     }
 
 
 def _get_page(request, items, per_page):
-    page_number = request.GET.get("page", 1) or 1
-    paginator = Paginator(items, per_page=per_page)
-    page = paginator.get_page(page_number)
-    next_page_num = page.next_page_number() if page.has_next() else paginator.num_pages
-    prev_page_num = page.previous_page_number() if page.has_previous() else 1
-    get_query = {k: v for k, v in request.GET.items()}
-    next_qs = "?" + urlencode({**get_query, "page": next_page_num})
-    prev_qs = "?" + urlencode({**get_query, "page": prev_page_num})
+    """
+    Returns a page of items, newest first, and query strings for the next and
+    previous pages, which keep the current search filters.
+    """
+    page = get_keyset_page(items, request.GET.get("cursor"), per_page)
+    get_query = {k: v for k, v in request.GET.items() if k != "cursor"}
+    next_qs, prev_qs = None, None
+    if page.has_next():
+        next_qs = "?" + urlencode({**get_query, "cursor": page.next_cursor()})
+    if page.has_previous():
+        prev_qs = "?" + urlencode({**get_query, "cursor": page.previous_cursor()})
+
     return page, next_qs, prev_qs
 
 
@@ -0,0 +1,31 @@
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods
+
+from case.forms import IssueSearchForm
+from core.models import Issue
+from core.services.export import CSV, EXPORT_FORMATS, stream_export
+
+from .auth import is_superuser
+
+
+@login_required
+@user_passes_test(is_superuser, login_url="/")
+@require_http_methods(["GET"])
+def case_export_view(request):
+    """
+    Streams every case matching the case list's search filters, as CSV or JSON lines.
+    """
+    export_format = request.GET.get("format", CSV)
+    if export_format not in EXPORT_FORMATS:
+        return HttpResponseBadRequest(f"Unknown export format {export_format}")
+
+    issue_qs = IssueSearchForm(request.GET).search(Issue.objects.order_by("created_at"))
+    response = StreamingHttpResponse(
+        stream_export(issue_qs, export_format),
+        content_type=EXPORT_FORMATS[export_format],
+    )
+    filename = f"cases-{timezone.now():%Y-%m-%d}.{export_format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
@@ -1,46 +1,36 @@
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count, Max, Q
 from django.http import Http404
 from django.shortcuts import render
 
 from accounts.models import User
 from case.forms import ParalegalDetailsForm
+from core.models import Issue, ParalegalWorkload
 
 from django.contrib.auth.decorators import user_passes_test
 from .auth import is_superuser
 
-PARALEGAL_CAPACITY = 4.0
-
 
 # FIXME: Permissions
 @login_required
 @user_passes_test(is_superuser, login_url="/")
 def paralegal_detail_view(request, pk):
     try:
-        paralegal = (
-            User.objects.filter(issue__isnull=False)
-            .prefetch_related("issue_set")
-            .distinct()
-            .annotate(
-                latest_issue_created_at=Max("issue__created_at"),
-                total_cases=Count("issue"),
-                open_cases=Count("issue", Q(issue__is_open=True)),
-                open_repairs=Count(
-                    "issue", Q(issue__is_open=True, issue__topic="REPAIRS")
-                ),
-                open_rent_reduction=Count(
-                    "issue", Q(issue__is_open=True, issue__topic="RENT_REDUCTION")
-                ),
-                open_eviction=Count(
-                    "issue", Q(issue__is_open=True, issue__topic="EVICTION")
-                ),
-            )
-            .get(pk=pk)
-        )
+        paralegal = User.objects.get(pk=pk)
     except User.DoesNotExist:
         raise Http404()
 
+    try:
+        workload = paralegal.workload
+    except ParalegalWorkload.DoesNotExist:
+        workload = ParalegalWorkload(paralegal=paralegal)
+
+    issues = (
+        Issue.objects.filter(paralegal=paralegal)
+        .select_related("client")
+        .order_by("-created_at")
+    )
+
     # FIXME: Permissions
     if request.method == "POST":
         form = ParalegalDetailsForm(request.POST, instance=paralegal)
@@ -50,7 +40,12 @@ def paralegal_detail_view(request, pk):
     else:
         form = ParalegalDetailsForm(instance=paralegal)
 
-    context = {"paralegal": paralegal, "form": form}
+    context = {
+        "paralegal": paralegal,
+        "workload": workload,
+        "issues": issues,
+        "form": form,
+    }
     return render(request, "case/paralegal_detail.html", context)
 
 
@@ -58,28 +53,10 @@ def paralegal_detail_view(request, pk):
 @login_required
 @user_passes_test(is_superuser, login_url="/")
 def paralegal_list_view(request):
-    paralegals = (
-        User.objects.filter(issue__isnull=False)
-        .prefetch_related("issue_set")
-        .distinct()
-        .annotate(
-            latest_issue_created_at=Max("issue__created_at"),
-            total_cases=Count("issue"),
-            open_cases=Count("issue", Q(issue__is_open=True)),
-            open_repairs=Count("issue", Q(issue__is_open=True, issue__topic="REPAIRS")),
-            open_rent_reduction=Count(
-                "issue", Q(issue__is_open=True, issue__topic="RENT_REDUCTION")
-            ),
-            open_eviction=Count(
-                "issue", Q(issue__is_open=True, issue__topic="EVICTION")
-            ),
-        )
-        .order_by("-latest_issue_created_at")
+    workloads = ParalegalWorkload.objects.select_related("paralegal").order_by(
+        "-latest_issue_created_at"
     )
-    for p in paralegals:
-        p.capacity = 100 * p.open_cases / PARALEGAL_CAPACITY
-
     context = {
-        "paralegals": paralegals,
+        "workloads": workloads,
     }
     return render(request, "case/paralegal_list.html", context)
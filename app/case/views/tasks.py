@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import JsonResponse
+from django.shortcuts import render
+from django.views.decorators.http import require_http_methods
+
+from taskqueue.stats import get_task_stats
+
+from .auth import is_superuser
+
+WINDOW_CHOICES = [15, 60, 6 * 60, 24 * 60]  # minutes
+DEFAULT_WINDOW = 60
+
+
+@login_required
+@user_passes_test(is_superuser, login_url="/")
+@require_http_methods(["GET"])
+def task_list_view(request):
+    window_mins = _get_window_mins(request)
+    context = {
+        "stats": get_task_stats(timedelta(minutes=window_mins)),
+        "window_mins": window_mins,
+        "window_choices": WINDOW_CHOICES,
+    }
+    return render(request, "case/task_list.html", context)
+
+
+@login_required
+@user_passes_test(is_superuser, login_url="/")
+@require_http_methods(["GET"])
+def task_stats_view(request):
+    window_mins = _get_window_mins(request)
+    stats = get_task_stats(timedelta(minutes=window_mins))
+    return JsonResponse(stats)
+
+
+def _get_window_mins(request) -> int:
+    try:
+        window_mins = int(request.GET.get("window", DEFAULT_WINDOW))
+    except ValueError:
+        window_mins = DEFAULT_WINDOW
+
+    return window_mins if window_mins in WINDOW_CHOICES else DEFAULT_WINDOW
@@ -0,0 +1,21 @@
+"""
+ASGI config for clerk project.
+Serves long-lived case event streams, see case.live, alongside the Django app.
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "clerk.settings")
+
+django_application = get_asgi_application()
+
+from case.live import EVENTS_PATH, case_events_app  # noqa: E402
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "http" and scope["path"] == EVENTS_PATH:
+        await case_events_app(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
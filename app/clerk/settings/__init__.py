@@ -8,6 +8,8 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 DEFAULT_FROM_EMAIL = "noreply@anikalegal.com"
 ALLOWED_HOSTS = []
+# Links to the site which are sent outside of a request, eg. to Slack.
+CLERK_BASE_URL = "http://localhost:8000"
 
 INSTALLED_APPS = [
     # Custom admin
@@ -18,6 +20,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.sitemaps",
+    "django.contrib.postgres",
     # Static files
     "whitenoise.runserver_nostatic",
     "django.contrib.staticfiles",
@@ -39,6 +42,7 @@ INSTALLED_APPS = [
     "case.apps.CaseConfig",
     "core.apps.CoreConfig",
     "caller.apps.CallerConfig",
+    "taskqueue.apps.TaskQueueConfig",
     # Wagtail
     "wagtail.contrib.forms",
     "wagtail.contrib.redirects",
@@ -69,6 +73,8 @@ MIDDLEWARE = [
     "social_django.middleware.SocialAuthExceptionMiddleware",
     "wagtail.contrib.redirects.middleware.RedirectMiddleware",
     "web.middleware.RedirectMiddleware",
+    "web.middleware.PrerenderMiddleware",
+    "web.middleware.PageCacheMiddleware",
 ]
 
 ROOT_URLCONF = "clerk.urls"
@@ -107,6 +113,20 @@ DATABASES = {
     }
 }
 
+# Cache shared by web and worker processes, created with ./manage.py createcachetable
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "django_cache",
+    },
+    # Renditions looked up by each process, see web.services.renditions
+    "renditions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "TIMEOUT": 60 * 60,
+        "OPTIONS": {"MAX_ENTRIES": 1000},
+    },
+}
+
 # Authentication
 AUTH_USER_MODEL = "accounts.User"
 LOGIN_URL = "login"
@@ -172,7 +192,13 @@ SHELL_PLUS = "ipython"
 # Static files
 STATIC_URL = "/static/"
 STATIC_ROOT = "/static/"
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+STATICFILES_STORAGE = "web.storage.StaticStorage"
+
+# Pre-rendered public pages, see web.services.prerender
+PRERENDER_ROOT = os.path.join(BASE_DIR, "prerendered")
+
+# Generated sitemaps, see web.services.sitemaps
+SITEMAP_ROOT = os.path.join(BASE_DIR, "sitemaps")
 
 # Wagtail
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
@@ -197,14 +223,35 @@ REST_FRAMEWORK = {
     )
 }
 
-ONE_HUNDRED_YEARS = 100 * 365 * 24 * 60 * 60  # seconds
+# Background tasks run in lanes: each lane is a separate queue served by its own
+# qcluster, started by ./manage.py qlanes. A lane's workers also take tasks from
+# more urgent lanes (lower priority number), but never from less urgent ones.
+TASK_LANES = {
+    "alerts": {"priority": 0, "workers": 1},  # Client-facing Slack alerts
+    "integrations": {"priority": 1, "workers": 1},  # Actionstep integrations
+    "bulk": {"priority": 2, "workers": 1},  # Document uploads and batch jobs
+}
+DEFAULT_TASK_LANE = "integrations"
+TASK_LANE = os.environ.get("TASK_LANE", DEFAULT_TASK_LANE)
+
+# seconds, tasks are killed if they run for longer than their timeout, which can be
+# set per task with utils.tasks.task_options, up to TASK_MAX_TIMEOUT.
+TASK_TIMEOUT = 60
+TASK_MAX_TIMEOUT = 15 * 60
+
 Q_CLUSTER = {
-    "name": "clerk",
-    "timeout": 60,  # seconds, tasks will be killed if they run for longer than this.
-    # NB: Django-Q retries *forever*, tasks need to be manually deleted to stop this
-    "retry": ONE_HUNDRED_YEARS,  # seconds, effectively never retry (this is a yucky hack.)
+    "name": TASK_LANE,  # Also the name of the lane's queue
+    "workers": TASK_LANES[TASK_LANE]["workers"],
+    "scheduler": TASK_LANE == DEFAULT_TASK_LANE,  # Only one lane runs schedules
+    "timeout": TASK_TIMEOUT,
+    # Failed tasks are retried with backoff by utils.tasks, not redelivered by Django-Q.
+    "ack_failures": True,
+    # seconds, a task which was killed for timing out is redelivered after this long.
+    "retry": TASK_MAX_TIMEOUT + 60,
     "save_limit": 250,  # number of tasks saved to broker
     "orm": "default",  # Use Django's ORM + database for broker
+    # Store tasks in Postgres like the ORM broker, but wake workers with LISTEN/NOTIFY.
+    "broker_class": "taskqueue.broker.PostgresBroker",
 }
 
 
@@ -232,11 +279,18 @@ LOGGING = {
 }
 
 
+# Live case updates, see case.live
+CASE_EVENTS_URL = "/case/live/events/"
+# Origins of pages which can open event streams, other than the events server's own.
+CASE_EVENTS_ALLOWED_ORIGINS = []
+
+
 # Slack message types
 class SlackMessage:
     ACTIONSTEP_CREATE = "actionstep-create"
     CLIENT_INTAKE = "client-intake"
     LANDING_FORM = "landing-form"
+    REVIEW_DUE = "review-due"
 
 
 SLACK_MESSAGE = SlackMessage
@@ -13,6 +13,10 @@ ALLOWED_HOSTS = ["*"]
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_ALL_ORIGINS = True
 
+# Live case updates are served by the events container, see case.live
+CASE_EVENTS_URL = "http://localhost:8001/case/live/events/"
+CASE_EVENTS_ALLOWED_ORIGINS = ["http://localhost:8000"]
+
 AWS_STORAGE_BUCKET_NAME = "anika-clerk-test"
 
 ADMIN_PREFIX = "local"
@@ -12,6 +12,7 @@ ALLOWED_HOSTS = [
     "127.0.0.1",
     "localhost",
 ]
+CLERK_BASE_URL = "https://test-clerk.anikalegal.com"
 
 EMAIL_PREFIX = "TEST"
 WEBMASTER_EMAIL = "webmaster@anikalegal.com"
@@ -33,6 +34,11 @@ SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
 AWS_STORAGE_BUCKET_NAME = "anika-clerk-test"
 
+# Pages are pre-rendered and sitemaps are built by the worker as well as the web
+# process, so the files are kept on a volume which both containers mount.
+PRERENDER_ROOT = "/var/lib/clerk/prerendered"
+SITEMAP_ROOT = "/var/lib/clerk/sitemaps"
+
 
 sentry_sdk.init(
     dsn=os.environ.get("RAVEN_DSN"),
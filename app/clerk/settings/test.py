@@ -9,10 +9,14 @@ ALLOWED_HOSTS = ["*"]
 DATABASES["default"]["name"] = "test"
 DEFAULT_FILE_STORAGE = "django.core.files.storage.FileSystemStorage"
 MEDIA_ROOT = os.path.join(BASE_DIR, "test_media")
+PRERENDER_ROOT = os.path.join(BASE_DIR, "test_prerendered")
+SITEMAP_ROOT = os.path.join(BASE_DIR, "test_sitemaps")
 
 # Use default, otherwise Whitenoise gets angry and fails to load static files.
 STATICFILES_STORAGE = "django.contrib.staticfiles.storage.StaticFilesStorage"
 
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
 # Django-q cluster should run synchronously
 Q_CLUSTER = {
     "name": "clerk",
@@ -1,10 +1,11 @@
 from django.contrib import admin
 from django.contrib.messages import constants as messages
-from django_q.tasks import async_task
 
 from actionstep.services.actionstep import send_issue_actionstep
+from core.services.search import search_issues
 from core.services.slack import send_issue_slack
 from utils.admin import admin_link, dict_to_json_html
+from utils.tasks import async_task
 
 from .models import Client, FileUpload, Issue, IssueNote, Person, Submission, Tenancy
 
@@ -71,9 +72,17 @@ class IssueAdmin(admin.ModelAdmin):
         "created_at",
     )
     list_filter = ("topic", "is_alert_sent", "is_case_sent")
+    search_fields = ("search_text",)
 
     list_select_related = ("client",)
 
+    def get_search_results(self, request, queryset, search_term):
+        # Use the case search index rather than scanning every issue.
+        if not search_term.strip():
+            return queryset, False
+
+        return search_issues(queryset, search_term.strip()), False
+
     def topic_pretty(self, sub):
         return sub.topic.replace("_", " ").title()
 
@@ -1,8 +1,34 @@
 from django.apps import AppConfig
+from django.db.utils import OperationalError, ProgrammingError
+
+SCHEDULES = [
+    {
+        "func": "core.services.workload.recompute_paralegal_workloads",
+        "schedule_type": "D",
+    },
+    {
+        "func": "core.services.rollup.update_issue_rollups",
+        "schedule_type": "I",
+        "minutes": 10,
+    },
+    {"func": "core.services.review.send_review_digest", "schedule_type": "D"},
+]
 
 
 class CoreConfig(AppConfig):
     name = "core"
 
     def ready(self):
+        from django_q.models import Schedule
+
         import core.signals
+
+        # Set up schedules, see actionstep.apps
+        for schedule_data in SCHEDULES:
+            try:
+                Schedule.objects.filter(func=schedule_data["func"]).exclude(
+                    **schedule_data
+                ).delete()
+                Schedule.objects.get_or_create(**schedule_data)
+            except (OperationalError, ProgrammingError):
+                pass  # No database available, eg. Docker build.
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from core.models import Issue
+from core.services.search import update_issue_search
+
+
+class Command(BaseCommand):
+    help = "Build the case search index for issues which aren't indexed yet"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all", action="store_true", help="Rebuild the index for every issue"
+        )
+
+    def handle(self, *args, **kwargs):
+        issue_qs = Issue.objects.all()
+        if not kwargs["all"]:
+            issue_qs = issue_qs.filter(search_vector__isnull=True)
+
+        num_issues = issue_qs.count()
+        self.stdout.write(f"Indexing {num_issues} issues")
+        update_issue_search(issue_qs)
+        self.stdout.write("Done")
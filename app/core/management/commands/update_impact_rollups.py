@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from core.services.rollup import update_issue_rollups
+
+
+class Command(BaseCommand):
+    help = "Bring the impact reporting rollups up to date"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild", action="store_true", help="Rebuild the rollups from scratch"
+        )
+
+    def handle(self, *args, **kwargs):
+        num_days = update_issue_rollups(rebuild=kwargs["rebuild"])
+        self.stdout.write(f"Rebuilt rollups for {num_days} days")
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_issuenote'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['created_at', 'id'], name='core_issue_created_9707e2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['is_open', 'created_at', 'id'], name='core_issue_is_open_5805b8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['topic', 'created_at', 'id'], name='core_issue_topic_9cc00c_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0028_issue_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['stage', 'created_at', 'id'], name='core_issue_stage_b617dc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['outcome', 'created_at', 'id'], name='core_issue_outcome_7b4a43_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(condition=models.Q(('is_open', True)), fields=['topic', 'created_at', 'id'], name='core_issue_open_topic_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['paralegal', 'is_open', 'topic'], name='core_issue_paraleg_641f36_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:40
+
+from django.contrib.postgres.operations import TrigramExtension
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0029_issue_search_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='issue',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='core_issue_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_text'], name='core_issue_search_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
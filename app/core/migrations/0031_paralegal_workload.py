@@ -0,0 +1,54 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+from django.db.models import Count, Max, Q
+
+
+def create_paralegal_workloads(apps, schema_editor):
+    Issue = apps.get_model("core", "Issue")
+    ParalegalWorkload = apps.get_model("core", "ParalegalWorkload")
+    rows = (
+        Issue.objects.filter(paralegal__isnull=False)
+        .order_by()
+        .values("paralegal_id")
+        .annotate(
+            total_cases=Count("id"),
+            open_cases=Count("id", filter=Q(is_open=True)),
+            open_repairs=Count("id", filter=Q(is_open=True, topic="REPAIRS")),
+            open_rent_reduction=Count("id", filter=Q(is_open=True, topic="RENT_REDUCTION")),
+            open_eviction=Count("id", filter=Q(is_open=True, topic="EVICTION")),
+            latest_issue_created_at=Max("created_at"),
+        )
+    )
+    ParalegalWorkload.objects.bulk_create([ParalegalWorkload(**row) for row in rows])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_is_intern'),
+        ('core', '0030_issue_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParalegalWorkload',
+            fields=[
+                ('paralegal', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='workload', serialize=False, to='accounts.user')),
+                ('total_cases', models.IntegerField(default=0)),
+                ('open_cases', models.IntegerField(default=0)),
+                ('open_repairs', models.IntegerField(default=0)),
+                ('open_rent_reduction', models.IntegerField(default=0)),
+                ('open_eviction', models.IntegerField(default=0)),
+                ('latest_issue_created_at', models.DateTimeField(blank=True, null=True)),
+                ('modified_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='paralegalworkload',
+            index=models.Index(fields=['-latest_issue_created_at'], name='core_parale_latest__e437a4_idx'),
+        ),
+        migrations.RunPython(create_paralegal_workloads, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0031_paralegal_workload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('D', 'Day'), ('M', 'Month')], max_length=1)),
+                ('period_start', models.DateField()),
+                ('topic', models.CharField(max_length=32)),
+                ('outcome', models.CharField(blank=True, default='', max_length=32)),
+                ('is_open', models.BooleanField()),
+                ('provided_legal_services', models.BooleanField()),
+                ('referrer_type', models.CharField(blank=True, default='', max_length=64)),
+                ('gender', models.CharField(blank=True, default='', max_length=64)),
+                ('income_band', models.CharField(blank=True, default='', max_length=16)),
+                ('is_aboriginal_or_torres_strait_islander', models.BooleanField()),
+                ('primary_language_non_english', models.BooleanField()),
+                ('num_issues', models.IntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('name', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('modified_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['modified_at'], name='core_client_modifie_9b3fe4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['modified_at'], name='core_issue_modifie_59fcbc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issuerollup',
+            index=models.Index(fields=['period', 'period_start'], name='core_issuer_period_0d9b41_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:49
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def set_next_review(apps, schema_editor):
+    Issue = apps.get_model("core", "Issue")
+    IssueNote = apps.get_model("core", "IssueNote")
+    latest_review = IssueNote.objects.filter(
+        issue=OuterRef("pk"), note_type="REVIEW"
+    ).order_by("-created_at")
+    Issue.objects.update(next_review=Subquery(latest_review.values("event")[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0032_issue_rollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='next_review',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(condition=models.Q(('is_open', True)), fields=['next_review'], name='core_issue_review_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issuenote',
+            index=models.Index(fields=['issue', 'note_type', '-created_at'], name='core_issuen_issue_i_eadb6c_idx'),
+        ),
+        migrations.RunPython(set_next_review, migrations.RunPython.noop),
+    ]
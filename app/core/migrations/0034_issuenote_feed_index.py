@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0033_issue_next_review'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issuenote',
+            index=models.Index(fields=['issue', 'created_at', 'id'], name='core_issuen_issue_i_f99dd0_idx'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+from django.db import migrations
+
+# Notify listeners on the case_events channel when an issue's case list columns
+# change, or a note is added to an issue, see case.live
+CREATE_TRIGGERS = """
+CREATE OR REPLACE FUNCTION core_notify_case_event() RETURNS trigger AS $$
+DECLARE
+    changed RECORD;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := OLD;
+    ELSE
+        changed := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME = 'core_issue' THEN
+        PERFORM pg_notify(
+            'case_events',
+            json_build_object('issue', changed.id, 'kind', 'issue', 'op', TG_OP)::text
+        );
+    ELSE
+        PERFORM pg_notify(
+            'case_events',
+            json_build_object('issue', changed.issue_id, 'kind', 'note', 'op', TG_OP)::text
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER core_issue_insert_notify
+    AFTER INSERT OR DELETE ON core_issue
+    FOR EACH ROW EXECUTE PROCEDURE core_notify_case_event();
+
+CREATE TRIGGER core_issue_update_notify
+    AFTER UPDATE ON core_issue
+    FOR EACH ROW
+    WHEN (
+        (OLD.topic, OLD.stage, OLD.outcome, OLD.is_open, OLD.provided_legal_services,
+         OLD.paralegal_id, OLD.fileref, OLD.next_review)
+        IS DISTINCT FROM
+        (NEW.topic, NEW.stage, NEW.outcome, NEW.is_open, NEW.provided_legal_services,
+         NEW.paralegal_id, NEW.fileref, NEW.next_review)
+    )
+    EXECUTE PROCEDURE core_notify_case_event();
+
+CREATE TRIGGER core_issuenote_notify
+    AFTER INSERT OR UPDATE OR DELETE ON core_issuenote
+    FOR EACH ROW EXECUTE PROCEDURE core_notify_case_event();
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS core_issuenote_notify ON core_issuenote;
+DROP TRIGGER IF EXISTS core_issue_update_notify ON core_issue;
+DROP TRIGGER IF EXISTS core_issue_insert_notify ON core_issue;
+DROP FUNCTION IF EXISTS core_notify_case_event();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0034_issuenote_feed_index"),
+    ]
+
+    operations = [migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS)]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+# Issue search text is only the client's name and the fileref, see
+# core.services.search.set_issue_search
+UPDATE_SEARCH_TEXT = """
+UPDATE core_issue
+SET search_text = concat_ws(
+    ' ',
+    NULLIF(core_client.first_name, ''),
+    NULLIF(core_client.last_name, ''),
+    NULLIF(core_issue.fileref, '')
+)
+FROM core_client
+WHERE core_client.id = core_issue.client_id
+    AND core_issue.search_vector IS NOT NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0035_case_event_triggers"),
+    ]
+
+    operations = [migrations.RunSQL(UPDATE_SEARCH_TEXT, migrations.RunSQL.noop)]
@@ -2,7 +2,9 @@ from .client import Client
 from .issue import CaseTopic, Issue
 from .issue_note import IssueNote
 from .person import Person
+from .rollup import IssueRollup, RollupPeriod, RollupWatermark
 from .submission import Submission
 from .tenancy import Tenancy
 from .timestamped import TimestampedModel
 from .upload import FileUpload
+from .workload import ParalegalWorkload
@@ -95,6 +95,12 @@ class Client(TimestampedModel):
     # Specific referrer name.
     referrer = models.CharField(max_length=64, blank=True, default="")
 
+    class Meta:
+        indexes = [
+            # Changes since the last impact rollup, see core.services.rollup
+            models.Index(fields=["modified_at"]),
+        ]
+
     def get_full_name(self) -> str:
         return f"{self.first_name} {self.last_name}".strip()
 
@@ -1,5 +1,7 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
@@ -95,3 +97,47 @@ class Issue(TimestampedModel):
 
     # Actionstep ID
     actionstep_id = models.IntegerField(blank=True, null=True)
+
+    # When the case is next due for review, from its latest review note,
+    # maintained by core.services.review.
+    next_review = models.DateTimeField(null=True, blank=True, editable=False)
+
+    # Full text search over the client's details, tenancy and answers,
+    # maintained by core.services.search.
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    # Client name and fileref, for fuzzy matching.
+    search_text = models.TextField(default="", blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination of the case list, see utils.pagination,
+            # for each IssueSearchForm filter.
+            models.Index(fields=["created_at", "id"]),
+            models.Index(fields=["is_open", "created_at", "id"]),
+            models.Index(fields=["topic", "created_at", "id"]),
+            models.Index(fields=["stage", "created_at", "id"]),
+            models.Index(fields=["outcome", "created_at", "id"]),
+            # Open cases by topic, the most common search.
+            models.Index(
+                fields=["topic", "created_at", "id"],
+                condition=models.Q(is_open=True),
+                name="core_issue_open_topic_idx",
+            ),
+            # Paralegal case loads.
+            models.Index(fields=["paralegal", "is_open", "topic"]),
+            # Changes since the last impact rollup, see core.services.rollup
+            models.Index(fields=["modified_at"]),
+            # Open cases due for review.
+            models.Index(
+                fields=["next_review"],
+                condition=models.Q(is_open=True),
+                name="core_issue_review_due_idx",
+            ),
+            # Case search, see core.services.search
+            GinIndex(fields=["search_vector"], name="core_issue_search_idx"),
+            GinIndex(
+                fields=["search_text"],
+                name="core_issue_search_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
@@ -36,3 +36,11 @@ class IssueNote(TimestampedModel):
     # An optional event time, which can be interpreted based on what kind of note this is:
     #  - Review: the time to next review this case.
     event = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination of an issue's notes feed, see utils.pagination
+            models.Index(fields=["issue", "created_at", "id"]),
+            # Latest review note for an issue, see core.services.review
+            models.Index(fields=["issue", "note_type", "-created_at"]),
+        ]
@@ -0,0 +1,50 @@
+from django.db import models
+
+
+class RollupPeriod:
+    DAY = "D"
+    MONTH = "M"
+
+
+class IssueRollup(models.Model):
+    """
+    Number of issues created in a day or a month, for each combination of the issue's
+    topic and outcome and the client's demographics. Maintained by
+    core.services.rollup, so that impact figures don't scan Issue and Client.
+    """
+
+    PERIOD_CHOICES = (
+        (RollupPeriod.DAY, "Day"),
+        (RollupPeriod.MONTH, "Month"),
+    )
+
+    period = models.CharField(max_length=1, choices=PERIOD_CHOICES)
+    # First day of the period, in local time.
+    period_start = models.DateField()
+
+    # Issue dimensions
+    topic = models.CharField(max_length=32)
+    outcome = models.CharField(max_length=32, blank=True, default="")
+    is_open = models.BooleanField()
+    provided_legal_services = models.BooleanField()
+
+    # Client dimensions
+    referrer_type = models.CharField(max_length=64, blank=True, default="")
+    gender = models.CharField(max_length=64, blank=True, default="")
+    income_band = models.CharField(max_length=16, blank=True, default="")
+    is_aboriginal_or_torres_strait_islander = models.BooleanField()
+    primary_language_non_english = models.BooleanField()
+
+    num_issues = models.IntegerField()
+
+    class Meta:
+        indexes = [models.Index(fields=["period", "period_start"])]
+
+
+class RollupWatermark(models.Model):
+    """
+    How far a rollup has been brought up to date with its source tables.
+    """
+
+    name = models.CharField(max_length=64, primary_key=True)
+    modified_at = models.DateTimeField()
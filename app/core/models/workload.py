@@ -0,0 +1,40 @@
+from django.db import models
+from django.utils import timezone
+
+from accounts.models import User
+
+# Number of open cases a paralegal can handle at once.
+PARALEGAL_CAPACITY = 4.0
+
+
+class ParalegalWorkload(models.Model):
+    """
+    Summary of a paralegal's cases, maintained by core.services.workload
+    whenever one of their issues is assigned, opened, closed or changes topic.
+    """
+
+    paralegal = models.OneToOneField(
+        User, primary_key=True, on_delete=models.CASCADE, related_name="workload"
+    )
+    total_cases = models.IntegerField(default=0)
+    open_cases = models.IntegerField(default=0)
+    open_repairs = models.IntegerField(default=0)
+    open_rent_reduction = models.IntegerField(default=0)
+    open_eviction = models.IntegerField(default=0)
+    # When the paralegal's most recent case was created
+    latest_issue_created_at = models.DateTimeField(null=True, blank=True)
+    # When this summary was last recomputed
+    modified_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [models.Index(fields=["-latest_issue_created_at"])]
+
+    @property
+    def capacity(self):
+        """
+        Percentage of the paralegal's capacity that is taken up by open cases.
+        """
+        return 100 * self.open_cases / PARALEGAL_CAPACITY
+
+    def __str__(self):
+        return f"{self.paralegal_id} {self.open_cases}/{self.total_cases}"
@@ -0,0 +1,125 @@
+"""
+Streaming exports of cases and client demographics, for impact reporting.
+
+Rows are read with a server-side cursor and written out one at a time, so an
+export uses the same small amount of memory no matter how many cases it has.
+"""
+
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import OuterRef, Subquery
+
+from core.models import Tenancy
+
+EXPORT_CHUNK_SIZE = 2000
+CSV = "csv"
+JSONL = "jsonl"
+EXPORT_FORMATS = {CSV: "text/csv", JSONL: "application/x-ndjson"}
+
+# Export column name, issue field lookup.
+ISSUE_COLUMNS = [
+    ("id", "id"),
+    ("fileref", "fileref"),
+    ("created_at", "created_at"),
+    ("topic", "topic"),
+    ("stage", "stage"),
+    ("outcome", "outcome"),
+    ("outcome_notes", "outcome_notes"),
+    ("provided_legal_services", "provided_legal_services"),
+    ("is_open", "is_open"),
+    ("paralegal_id", "paralegal_id"),
+    ("client_id", "client_id"),
+    ("client_created_at", "client__created_at"),
+    ("date_of_birth", "client__date_of_birth"),
+    ("gender", "client__gender"),
+    ("employment_status", "client__employment_status"),
+    ("special_circumstances", "client__special_circumstances"),
+    ("weekly_income", "client__weekly_income"),
+    ("weekly_rent", "client__weekly_rent"),
+    ("is_multi_income_household", "client__is_multi_income_household"),
+    ("number_of_dependents", "client__number_of_dependents"),
+    ("primary_language_non_english", "client__primary_language_non_english"),
+    ("primary_language", "client__primary_language"),
+    (
+        "is_aboriginal_or_torres_strait_islander",
+        "client__is_aboriginal_or_torres_strait_islander",
+    ),
+    ("rental_circumstances", "client__rental_circumstances"),
+    ("legal_access_difficulties", "client__legal_access_difficulties"),
+    ("referrer_type", "client__referrer_type"),
+    ("referrer", "client__referrer"),
+]
+# The client's latest tenancy.
+TENANCY_COLUMNS = [
+    ("tenancy_suburb", "suburb"),
+    ("tenancy_postcode", "postcode"),
+    ("tenancy_started", "started"),
+    ("tenancy_is_on_lease", "is_on_lease"),
+]
+EXPORT_COLUMNS = [name for name, _ in ISSUE_COLUMNS + TENANCY_COLUMNS]
+
+
+def iter_issue_rows(issue_qs):
+    """
+    Yields a dict of export columns for each issue.
+    """
+    latest_tenancy = Tenancy.objects.filter(client=OuterRef("client_id")).order_by(
+        "-created_at"
+    )
+    tenancy_fields = {
+        name: Subquery(latest_tenancy.values(field)[:1])
+        for name, field in TENANCY_COLUMNS
+    }
+    rows = (
+        issue_qs.annotate(**tenancy_fields)
+        .values_list(*[field for _, field in ISSUE_COLUMNS], *tenancy_fields.keys())
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    for row in rows:
+        yield dict(zip(EXPORT_COLUMNS, row))
+
+
+def stream_export(issue_qs, export_format: str):
+    """
+    Yields the issues' export as chunks of CSV or JSON lines text.
+    """
+    rows = iter_issue_rows(issue_qs)
+    if export_format == CSV:
+        return stream_csv(rows)
+    elif export_format == JSONL:
+        return stream_jsonl(rows)
+    else:
+        raise ValueError(f"Unknown export format {export_format}")
+
+
+def stream_csv(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        yield writer.writerow([format_csv_value(v) for v in row.values()])
+
+
+def stream_jsonl(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def format_csv_value(value):
+    if isinstance(value, list):
+        return ";".join(value)
+    elif value is None:
+        return ""
+    else:
+        return value
+
+
+class Echo:
+    """
+    A file-like object which returns what is written to it, so csv.writer output
+    can be streamed, see the Django docs on streaming large CSV files.
+    """
+
+    def write(self, value):
+        return value
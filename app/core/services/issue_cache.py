@@ -0,0 +1,37 @@
+"""
+Versions for cached fragments of case pages.
+
+Each issue has a version stamp in the cache, which is part of the key of every
+cached fragment for that issue. Changing the issue, its client or its notes
+replaces the stamp, so stale fragments are never read again and simply expire.
+See core.signals.issue_cache.
+"""
+
+import time
+
+from django.core.cache import cache
+
+VERSION_KEY_PREFIX = "issue:version"
+# seconds, how long cached case fragments are kept
+FRAGMENT_TIMEOUT = 24 * 60 * 60
+
+
+def get_issue_version(issue_pk) -> int:
+    """
+    Returns the issue's current cache version.
+    """
+    key = get_version_key(issue_pk)
+    # If the stamp has been evicted, start a new version rather than reusing an old one.
+    return cache.get_or_set(key, time.time_ns, FRAGMENT_TIMEOUT)
+
+
+def invalidate_issue_cache(issue_pks):
+    """
+    Give the issues a new cache version, so that their cached fragments are rebuilt.
+    """
+    version = time.time_ns()
+    cache.set_many({get_version_key(pk): version for pk in issue_pks}, FRAGMENT_TIMEOUT)
+
+
+def get_version_key(issue_pk) -> str:
+    return f"{VERSION_KEY_PREFIX}:{issue_pk}"
@@ -6,10 +6,12 @@ from mailchimp3 import MailChimp
 from mailchimp3.mailchimpclient import MailChimpError
 
 from core.models import CaseTopic, Client, Submission
+from utils.tasks import task_options
 
 logger = logging.getLogger(__file__)
 
 
+@task_options(lane="bulk", timeout=10 * 60)
 def remind_incomplete():
     """Sends reminder emails to submissions who have started their issue but didn't finish."""
     covid_submissions = find_submissions(topic=CaseTopic.RENT_REDUCTION)
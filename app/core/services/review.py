@@ -0,0 +1,85 @@
+"""
+Case reviews: each review note sets when the case is next due for review.
+The latest review note's date is copied onto the issue, so due reviews can be
+found with an index instead of searching every note.
+"""
+
+import logging
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.db.models import OuterRef, Subquery
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import Issue, IssueNote
+from core.models.issue_note import NoteType
+from slack.services import send_slack_message
+from utils.tasks import async_task, task_options
+
+logger = logging.getLogger(__name__)
+
+# Most cases listed in a review digest.
+DIGEST_MAX_CASES = 50
+
+
+def update_next_review(issue_qs):
+    """
+    Set the issues' next review date from their latest review note.
+    """
+    latest_review = IssueNote.objects.filter(
+        issue=OuterRef("pk"), note_type=NoteType.REVIEW
+    ).order_by("-created_at")
+    issue_qs.update(next_review=Subquery(latest_review.values("event")[:1]))
+
+
+def get_reviews_due(issue_qs):
+    """
+    Returns open issues whose next review is due, most overdue first.
+    """
+    return issue_qs.filter(is_open=True, next_review__lte=timezone.now()).order_by(
+        "next_review"
+    )
+
+
+def send_review_digest():
+    """
+    Scheduled daily. Django-Q runs schedules without their task options, so the
+    digest is enqueued as a task to send it on its lane, with retries.
+    """
+    async_task(_send_review_digest)
+
+
+@task_options(lane="alerts", max_attempts=5)
+def _send_review_digest():
+    """
+    Notify Slack of the cases which are due for review.
+    """
+    issues = list(
+        get_reviews_due(Issue.objects.select_related("paralegal"))[: DIGEST_MAX_CASES + 1]
+    )
+    if not issues:
+        logger.info("No case reviews due")
+        return
+
+    logger.info("Notifying Slack of case reviews due")
+    send_slack_message(settings.SLACK_MESSAGE.REVIEW_DUE, get_digest_text(issues))
+
+
+def get_digest_text(issues):
+    lines = ["These cases are due for review:"]
+    for issue in issues[:DIGEST_MAX_CASES]:
+        url = get_absolute_url(reverse("case-detail-progress", args=[issue.pk]))
+        due = timezone.localtime(issue.next_review).strftime("%d/%m/%y")
+        paralegal = issue.paralegal.get_full_name() if issue.paralegal else "unassigned"
+        lines.append(f"• <{url}|{issue.fileref or issue.pk}> due {due} ({paralegal})")
+
+    if len(issues) > DIGEST_MAX_CASES:
+        url = get_absolute_url(f"{reverse('case-list')}?reviews=due")
+        lines.append(f"... and more, see <{url}|the reviews due list>.")
+
+    return "\n".join(lines)
+
+
+def get_absolute_url(path: str) -> str:
+    return urljoin(settings.CLERK_BASE_URL, path)
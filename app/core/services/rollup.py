@@ -0,0 +1,263 @@
+"""
+Daily and monthly rollups of issue counts, for impact reporting.
+
+The rollups are kept up to date by a scheduled job. Each run finds the issues
+and clients which have been modified since the last run, then rebuilds the
+daily rollups for the days those issues were created, and the monthly rollups
+for those days' months. Monthly rollups are summed from the daily rollups,
+so only the daily rebuild reads Issue and Client.
+
+Deleted issues leave nothing behind to be found, so deleting an issue rebuilds
+the rollups for the day it was created in a task, see core.signals.rollup.
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Case, CharField, Count, F, Q, Sum, Value, When
+from django.db.models.functions import Coalesce, TruncDate, TruncMonth
+from django.utils import timezone
+
+from core.models import Client, Issue, IssueRollup, RollupPeriod, RollupWatermark
+from utils.tasks import task_options
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_NAME = "issue_rollup"
+# Rows modified this long before the watermark are checked again, in case they
+# were committed after the last run read the tables.
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# Rollup field, issue lookup.
+ROLLUP_DIMENSIONS = {
+    "topic": F("topic"),
+    "outcome": Coalesce("outcome", Value("")),
+    "is_open": F("is_open"),
+    "provided_legal_services": F("provided_legal_services"),
+    "referrer_type": F("client__referrer_type"),
+    "gender": Coalesce("client__gender", Value("")),
+    "income_band": Case(
+        When(client__weekly_income__isnull=True, then=Value("")),
+        When(client__weekly_income__lt=500, then=Value("0-499")),
+        When(client__weekly_income__lt=1000, then=Value("500-999")),
+        default=Value("1000+"),
+        output_field=CharField(),
+    ),
+    "is_aboriginal_or_torres_strait_islander": F(
+        "client__is_aboriginal_or_torres_strait_islander"
+    ),
+    "primary_language_non_english": F("client__primary_language_non_english"),
+}
+
+
+def update_issue_rollups(rebuild: bool = False) -> int:
+    """
+    Bring the issue rollups up to date with issues and clients modified since the
+    last update, or rebuild them all. Returns the number of days rebuilt.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        watermark = lock_watermark()
+        if watermark and not rebuild:
+            since = watermark.modified_at - WATERMARK_OVERLAP
+            num_days = update_modified_rollups(since)
+        else:
+            num_days = rebuild_all_rollups()
+
+        RollupWatermark.objects.update_or_create(
+            name=WATERMARK_NAME, defaults={"modified_at": now}
+        )
+
+    logger.info("Rebuilt issue rollups for %s days", num_days)
+    return num_days
+
+
+def update_modified_rollups(since) -> int:
+    """
+    Rebuild the rollups for the days on which issues that have been modified since
+    the given time, or whose clients have, were created.
+    """
+    modified_clients = Client.objects.filter(modified_at__gte=since).values("pk")
+    days = set()
+    # Queried separately so that each can use its modified_at index.
+    for issue_qs in [
+        Issue.objects.filter(modified_at__gte=since),
+        Issue.objects.filter(client__in=modified_clients),
+    ]:
+        days |= set(
+            issue_qs.annotate(day=TruncDate("created_at"))
+            .order_by()
+            .values_list("day", flat=True)
+            .distinct()
+        )
+
+    rebuild_day_rollups(days)
+    return len(days)
+
+
+@task_options(lane="bulk")
+def update_deleted_rollups(day_strs):
+    """
+    Rebuild the rollups for the days, given as ISO dates, on which deleted issues
+    were created. Task run when issues are deleted.
+    """
+    with transaction.atomic():
+        lock_watermark()
+        rebuild_day_rollups({date.fromisoformat(day_str) for day_str in day_strs})
+
+
+def rebuild_day_rollups(days):
+    """
+    Rebuild the daily rollups for the days, and the monthly rollups for their months.
+    """
+    if not days:
+        return
+
+    months = {day.replace(day=1) for day in days}
+    IssueRollup.objects.filter(period=RollupPeriod.DAY, period_start__in=days).delete()
+    IssueRollup.objects.filter(
+        period=RollupPeriod.MONTH, period_start__in=months
+    ).delete()
+    create_daily_rollups(Issue.objects.filter(get_days_q(days)))
+    create_monthly_rollups(get_months_q(months))
+
+
+def lock_watermark():
+    """
+    Returns the rollup's watermark, if it has been updated before, locked until the
+    end of the transaction so that rollups aren't rebuilt by two processes at once.
+    """
+    return RollupWatermark.objects.select_for_update().filter(name=WATERMARK_NAME).first()
+
+
+def rebuild_all_rollups() -> int:
+    IssueRollup.objects.all().delete()
+    create_daily_rollups(Issue.objects.all())
+    create_monthly_rollups(Q())
+    return (
+        IssueRollup.objects.filter(period=RollupPeriod.DAY)
+        .values("period_start")
+        .distinct()
+        .count()
+    )
+
+
+def create_daily_rollups(issue_qs):
+    rows = (
+        issue_qs.annotate(day=TruncDate("created_at"))
+        .values("day", **get_dimension_aliases())
+        .annotate(num_issues=Count("id"))
+        .order_by()
+    )
+    IssueRollup.objects.bulk_create(
+        [
+            IssueRollup(
+                period=RollupPeriod.DAY,
+                period_start=row["day"],
+                num_issues=row["num_issues"],
+                **{dim: row[f"_{dim}"] for dim in ROLLUP_DIMENSIONS},
+            )
+            for row in rows
+        ]
+    )
+
+
+def create_monthly_rollups(months_q):
+    """
+    Sum the daily rollups in the months into monthly rollups.
+    """
+    rows = (
+        IssueRollup.objects.filter(months_q, period=RollupPeriod.DAY)
+        .annotate(month=TruncMonth("period_start"))
+        .values("month", *ROLLUP_DIMENSIONS.keys())
+        .annotate(total=Sum("num_issues"))
+        .order_by()
+    )
+    IssueRollup.objects.bulk_create(
+        [
+            IssueRollup(
+                period=RollupPeriod.MONTH,
+                period_start=row.pop("month"),
+                num_issues=row.pop("total"),
+                **row,
+            )
+            for row in rows
+        ]
+    )
+
+
+def get_issue_series(
+    period=RollupPeriod.MONTH, start=None, end=None, group_by=(), **filters
+):
+    """
+    Returns the number of issues created in each period from start (inclusive) to
+    end (exclusive), split by the group_by dimensions and filtered on dimensions, eg.
+
+        get_issue_series(group_by=["topic"], provided_legal_services=True)
+        [{"period_start": date(2021, 1, 1), "topic": "REPAIRS", "num_issues": 12}, ...]
+    """
+    return list(
+        get_rollup_qs(period, start, end, group_by, filters)
+        .values("period_start", *group_by)
+        .annotate(num_issues=Sum("num_issues"))
+        .order_by("period_start", *group_by)
+    )
+
+
+def get_issue_totals(start=None, end=None, group_by=(), **filters):
+    """
+    Returns the number of issues created from start (inclusive) to end (exclusive),
+    split by the group_by dimensions and filtered on dimensions.
+    """
+    return list(
+        get_rollup_qs(RollupPeriod.DAY, start, end, group_by, filters)
+        .values(*group_by)
+        .annotate(num_issues=Sum("num_issues"))
+        .order_by(*group_by)
+    )
+
+
+def get_rollup_qs(period, start, end, group_by, filters):
+    unknown = (set(group_by) | set(filters)) - ROLLUP_DIMENSIONS.keys()
+    if unknown:
+        raise ValueError(f"Unknown rollup dimensions {sorted(unknown)}")
+
+    rollup_qs = IssueRollup.objects.filter(period=period, **filters)
+    if start:
+        rollup_qs = rollup_qs.filter(period_start__gte=start)
+    if end:
+        rollup_qs = rollup_qs.filter(period_start__lt=end)
+
+    return rollup_qs
+
+
+def get_days_q(days):
+    """
+    Returns a filter for issues created on any of the local dates, which can use
+    the index on created_at.
+    """
+    days_q = Q()
+    for day in days:
+        start = timezone.make_aware(datetime.combine(day, time()))
+        end = timezone.make_aware(datetime.combine(day + timedelta(days=1), time()))
+        days_q |= Q(created_at__gte=start, created_at__lt=end)
+
+    return days_q
+
+
+def get_months_q(months):
+    months_q = Q()
+    for month in months:
+        months_q |= Q(period_start__gte=month, period_start__lt=get_next_month(month))
+
+    return months_q
+
+
+def get_dimension_aliases():
+    # Prefixed so that they don't clash with Issue's own fields.
+    return {f"_{dim}": expr for dim, expr in ROLLUP_DIMENSIONS.items()}
+
+
+def get_next_month(month):
+    return (month + timedelta(days=32)).replace(day=1)
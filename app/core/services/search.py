@@ -0,0 +1,115 @@
+"""
+Full text search over cases.
+
+Each Issue stores a search vector of its client's name, contact details, fileref,
+tenancy addresses and intake answers, plus a short search text for fuzzy
+matching of names and filerefs. Both are updated when the issue, its client or
+their tenancies are saved, see core.signals.search.
+
+Emails and phone numbers are only matched by the search vector, since emails on
+the same domain share most of their trigrams, so any email would be similar to
+every other one on its domain.
+"""
+
+import logging
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import BooleanField, F, FloatField, Func, Q, Value
+
+from core.models import Issue
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CONFIG = "simple"
+REINDEX_BATCH_SIZE = 500
+
+
+class TrigramWordSimilar(Func):
+    """
+    Whether the text has a word which is similar to the query, ie. `query <% text`.
+    Unlike a trigram_similar lookup, a short query can match a long text.
+    Uses the trigram index on the text.
+    """
+
+    arg_joiner = " <%% "
+    template = "%(expressions)s"
+    output_field = BooleanField()
+
+
+class TrigramWordSimilarity(Func):
+    function = "WORD_SIMILARITY"
+    output_field = FloatField()
+
+
+def search_issues(issue_qs, query: str):
+    """
+    Returns issues matching the query, best matches first.
+    """
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+    fuzzy_match = TrigramWordSimilar(Value(query), F("search_text"))
+    rank = SearchRank(F("search_vector"), search_query) + TrigramWordSimilarity(
+        Value(query), F("search_text")
+    )
+    return (
+        issue_qs.filter(Q(search_vector=search_query) | Q(fuzzy_match))
+        .annotate(search_rank=rank)
+        .order_by("-search_rank", "-created_at")
+    )
+
+
+def update_issue_search(issue_qs):
+    """
+    Rebuild the search vector and text of the issues, in batches.
+    """
+    issue_pks = list(issue_qs.values_list("pk", flat=True))
+    for idx in range(0, len(issue_pks), REINDEX_BATCH_SIZE):
+        batch_pks = issue_pks[idx : idx + REINDEX_BATCH_SIZE]
+        issues = list(
+            Issue.objects.filter(pk__in=batch_pks)
+            .select_related("client")
+            .prefetch_related("client__tenancy_set")
+        )
+        for issue in issues:
+            set_issue_search(issue)
+
+        Issue.objects.bulk_update(issues, ["search_vector", "search_text"])
+
+
+def set_issue_search(issue: Issue):
+    client = issue.client
+    names = [client.first_name, client.last_name, issue.fileref]
+    contact = [client.email, client.phone_number]
+    addresses = []
+    for tenancy in client.tenancy_set.all():
+        addresses += [tenancy.address, tenancy.suburb, tenancy.postcode]
+
+    answers = get_answers_text(issue.answers)
+    issue.search_text = join_text(names)
+    issue.search_vector = (
+        get_vector(join_text(names), "A")
+        + get_vector(join_text(contact), "B")
+        + get_vector(join_text(addresses), "C")
+        + get_vector(join_text(answers), "D")
+    )
+
+
+def get_vector(text: str, weight: str):
+    return SearchVector(Value(text), config=SEARCH_CONFIG, weight=weight)
+
+
+def get_answers_text(answers):
+    """
+    Returns all text in an intake form's answers, which can be nested.
+    """
+    if isinstance(answers, str):
+        return [answers]
+    elif isinstance(answers, dict):
+        return [text for value in answers.values() for text in get_answers_text(value)]
+    elif isinstance(answers, list):
+        return [text for value in answers for text in get_answers_text(value)]
+    else:
+        return []
+
+
+def join_text(parts):
+    return " ".join(part for part in parts if part)
@@ -4,10 +4,12 @@ from django.conf import settings
 
 from core.models import Issue
 from slack.services import send_slack_message
+from utils.tasks import task_options
 
 logger = logging.getLogger(__name__)
 
 
+@task_options(lane="alerts", max_attempts=5)
 def send_issue_slack(issue_pk: str):
     issue = Issue.objects.select_related("client").get(pk=issue_pk)
     text = get_text(issue)
@@ -5,10 +5,12 @@ from django.db import transaction
 from django.utils import timezone
 
 from core.models import Client, FileUpload, Issue, Person, Submission, Tenancy
+from utils.tasks import task_options
 
 logger = logging.getLogger(__name__)
 
 
+@task_options(lane="alerts")
 @transaction.atomic
 def process_submission(sub_pk: str):
     """
@@ -0,0 +1,89 @@
+"""
+Maintains the ParalegalWorkload summary of each paralegal's cases.
+"""
+
+import logging
+
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from core.models import CaseTopic, Issue, ParalegalWorkload
+
+logger = logging.getLogger(__name__)
+
+WORKLOAD_FIELDS = [
+    "total_cases",
+    "open_cases",
+    "open_repairs",
+    "open_rent_reduction",
+    "open_eviction",
+    "latest_issue_created_at",
+]
+
+
+def update_paralegal_workloads(paralegal_pks):
+    """
+    Recompute the workloads of the given paralegals from their issues.
+    Uses the (paralegal, is_open, topic) index on Issue.
+    """
+    paralegal_pks = {pk for pk in paralegal_pks if pk is not None}
+    if not paralegal_pks:
+        return
+
+    now = timezone.now()
+    workloads = get_workloads(Issue.objects.filter(paralegal_id__in=paralegal_pks))
+    for paralegal_pk, workload in workloads.items():
+        ParalegalWorkload.objects.update_or_create(
+            paralegal_id=paralegal_pk, defaults={**workload, "modified_at": now}
+        )
+
+    # Paralegals with no cases left.
+    no_case_pks = paralegal_pks - workloads.keys()
+    ParalegalWorkload.objects.filter(paralegal_id__in=no_case_pks).delete()
+
+
+def recompute_paralegal_workloads() -> int:
+    """
+    Recompute every paralegal's workload, and fix any that have drifted from their
+    issues, eg. because issues were updated in bulk. Returns the number fixed.
+    """
+    expected = get_workloads(Issue.objects.filter(paralegal__isnull=False))
+    actual = {
+        w["paralegal_id"]: w
+        for w in ParalegalWorkload.objects.values("paralegal_id", *WORKLOAD_FIELDS)
+    }
+    drifted_pks = []
+    for paralegal_pk in expected.keys() | actual.keys():
+        workload = actual.get(paralegal_pk, {})
+        expected_workload = expected.get(paralegal_pk)
+        if expected_workload is None or any(
+            workload.get(f) != expected_workload[f] for f in WORKLOAD_FIELDS
+        ):
+            drifted_pks.append(paralegal_pk)
+
+    if drifted_pks:
+        logger.warning("Fixing drifted workloads for paralegals %s", drifted_pks)
+        update_paralegal_workloads(drifted_pks)
+
+    return len(drifted_pks)
+
+
+def get_workloads(issue_qs):
+    """
+    Returns workload fields for each paralegal with issues in the queryset.
+    """
+    rows = (
+        issue_qs.order_by()
+        .values("paralegal_id")
+        .annotate(
+            total_cases=Count("id"),
+            open_cases=Count("id", filter=Q(is_open=True)),
+            open_repairs=Count("id", filter=Q(is_open=True, topic=CaseTopic.REPAIRS)),
+            open_rent_reduction=Count(
+                "id", filter=Q(is_open=True, topic=CaseTopic.RENT_REDUCTION)
+            ),
+            open_eviction=Count("id", filter=Q(is_open=True, topic=CaseTopic.EVICTION)),
+            latest_issue_created_at=Max("created_at"),
+        )
+    )
+    return {row.pop("paralegal_id"): row for row in rows}
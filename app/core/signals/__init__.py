@@ -1 +1 @@
-from . import issue, submission
+from . import issue, issue_cache, review, rollup, search, submission, workload
@@ -2,11 +2,11 @@ import logging
 
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from django_q.tasks import async_task
 
 from actionstep.services.actionstep import send_issue_actionstep
 from core.models import Issue
 from core.services.slack import send_issue_slack
+from utils.tasks import async_task
 
 logger = logging.getLogger(__name__)
 
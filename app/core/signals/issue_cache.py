@@ -0,0 +1,38 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from core.models import Client, Issue, IssueNote
+from core.services.issue_cache import invalidate_issue_cache
+
+
+@receiver(post_save, sender=Issue)
+def invalidate_cache_on_issue_save(sender, instance, **kwargs):
+    invalidate_issue_cache([instance.pk])
+
+
+@receiver(post_save, sender=Client)
+def invalidate_cache_on_client_save(sender, instance, **kwargs):
+    invalidate_issue_cache(
+        Issue.objects.filter(client=instance).values_list("pk", flat=True)
+    )
+
+
+@receiver(post_save, sender=IssueNote)
+@receiver(post_delete, sender=IssueNote)
+def invalidate_cache_on_note_change(sender, instance, **kwargs):
+    invalidate_issue_cache([instance.issue_id])
+
+
+@receiver(post_save, sender=User)
+def invalidate_cache_on_user_save(sender, instance, update_fields=None, **kwargs):
+    # Signing in only updates last_login, which case pages don't show.
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
+
+    # Cached headers show the paralegal's name, and cached feeds each note's creator.
+    issue_pks = set(Issue.objects.filter(paralegal=instance).values_list("pk", flat=True))
+    issue_pks.update(
+        IssueNote.objects.filter(creator=instance).values_list("issue_id", flat=True)
+    )
+    invalidate_issue_cache(issue_pks)
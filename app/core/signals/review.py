@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import Issue, IssueNote
+from core.models.issue_note import NoteType
+from core.services.review import update_next_review
+
+
+@receiver(post_save, sender=IssueNote)
+@receiver(post_delete, sender=IssueNote)
+def update_next_review_on_note_change(sender, instance, **kwargs):
+    if instance.note_type == NoteType.REVIEW:
+        update_next_review(Issue.objects.filter(pk=instance.issue_id))
@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from core.models import Issue
+from core.services.rollup import update_deleted_rollups
+from utils.tasks import async_task
+
+
+@receiver(post_delete, sender=Issue)
+def update_rollups_on_issue_delete(sender, instance, **kwargs):
+    day_str = timezone.localtime(instance.created_at).date().isoformat()
+    # Rebuild once the issue is gone, so it isn't counted again.
+    transaction.on_commit(lambda: async_task(update_deleted_rollups, [day_str]))
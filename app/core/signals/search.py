@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from core.models import Client, Issue, Tenancy
+from core.services.search import update_issue_search
+
+
+@receiver(post_save, sender=Issue)
+def update_search_on_issue_save(sender, instance, **kwargs):
+    update_issue_search(Issue.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Client)
+def update_search_on_client_save(sender, instance, **kwargs):
+    update_issue_search(Issue.objects.filter(client=instance))
+
+
+@receiver(post_save, sender=Tenancy)
+def update_search_on_tenancy_save(sender, instance, **kwargs):
+    update_issue_search(Issue.objects.filter(client_id=instance.client_id))
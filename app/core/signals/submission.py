@@ -2,10 +2,10 @@ import logging
 
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from django_q.tasks import async_task
 
 from core.models import Submission
 from core.services.submission import process_submission
+from utils.tasks import async_task
 
 logger = logging.getLogger(__name__)
 
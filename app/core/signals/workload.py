@@ -0,0 +1,33 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.models import Issue
+from core.services.workload import update_paralegal_workloads
+
+# Issue fields which are summarised in ParalegalWorkload.
+WORKLOAD_ISSUE_FIELDS = ["paralegal_id", "is_open", "topic", "created_at"]
+
+
+@receiver(pre_save, sender=Issue)
+def store_workload_fields(sender, instance, **kwargs):
+    """
+    Remember the issue's saved values, so we can tell whether workloads changed.
+    """
+    instance._workload_before = (
+        Issue.objects.filter(pk=instance.pk).values(*WORKLOAD_ISSUE_FIELDS).first()
+    )
+
+
+@receiver(post_save, sender=Issue)
+def update_workload_on_issue_save(sender, instance, **kwargs):
+    before = getattr(instance, "_workload_before", None) or {}
+    after = {f: getattr(instance, f) for f in WORKLOAD_ISSUE_FIELDS}
+    if before == after:
+        return
+
+    update_paralegal_workloads([before.get("paralegal_id"), instance.paralegal_id])
+
+
+@receiver(post_delete, sender=Issue)
+def update_workload_on_issue_delete(sender, instance, **kwargs):
+    update_paralegal_workloads([instance.paralegal_id])
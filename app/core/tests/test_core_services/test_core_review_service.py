@@ -0,0 +1,53 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from core.factories import IssueFactory, UserFactory
+from core.models import Issue, IssueNote
+from core.services import review
+from core.services.review import get_reviews_due, send_review_digest
+
+
+@pytest.mark.django_db
+@pytest.mark.enable_signals
+def test_next_review_follows_latest_review_note(monkeypatch, settings):
+    """
+    Ensure the issue's next review is set from its latest review note,
+    and due reviews are sent in the digest.
+    """
+    mock_send_msg = mock.Mock()
+    monkeypatch.setattr(review, "send_slack_message", mock_send_msg)
+    user = UserFactory()
+    issue = IssueFactory(fileref="R0123")
+    IssueFactory()
+    now = timezone.now()
+    add_note(issue, user, "REVIEW", now + timedelta(days=7))
+    assert Issue.objects.get(pk=issue.pk).next_review == now + timedelta(days=7)
+    assert not get_reviews_due(Issue.objects.all()).exists()
+    send_review_digest()
+    mock_send_msg.assert_not_called()
+
+    # Later review notes set the next review, other notes don't.
+    note = add_note(issue, user, "REVIEW", now - timedelta(days=1))
+    add_note(issue, user, "PARALEGAL", now + timedelta(days=30))
+    assert list(get_reviews_due(Issue.objects.all())) == [issue]
+    settings.CLERK_BASE_URL = "https://test-clerk.anikalegal.com"
+    send_review_digest()
+    digest_text = mock_send_msg.call_args[0][1]
+    assert "R0123" in digest_text
+    assert f"<https://test-clerk.anikalegal.com/case/cases/{issue.pk}/progress/|" in (
+        digest_text
+    )
+
+    note.delete()
+    assert Issue.objects.get(pk=issue.pk).next_review == now + timedelta(days=7)
+
+
+def add_note(issue, user, note_type, event):
+    # Each note is created after the last.
+    created_at = timezone.now() + timedelta(seconds=IssueNote.objects.count())
+    return IssueNote.objects.create(
+        issue=issue, creator=user, note_type=note_type, event=event, created_at=created_at
+    )
@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from core.factories import ClientFactory, IssueFactory
+from core.models import Client, Issue, IssueRollup, RollupPeriod
+from core.services.rollup import get_issue_series, get_issue_totals, update_issue_rollups
+
+
+@pytest.mark.django_db
+def test_issue_rollups_updated_incrementally():
+    """
+    Ensure rollups count issues by dimension, and are only rebuilt for the days of
+    issues and clients which have changed.
+    """
+    created_at = timezone.now() - timedelta(days=40)
+    client = ClientFactory(weekly_income=700, referrer_type="SEARCH")
+    repairs = IssueFactory(client=client, topic="REPAIRS", created_at=created_at)
+    IssueFactory(client=client, topic="EVICTION", created_at=created_at)
+    old_issue = IssueFactory(topic="REPAIRS", created_at=created_at - timedelta(days=90))
+    long_ago = timezone.now() - timedelta(days=30)
+    Issue.objects.filter(pk=old_issue.pk).update(modified_at=long_ago)
+    Client.objects.filter(pk=old_issue.client_id).update(modified_at=long_ago)
+    update_issue_rollups()
+
+    totals = get_issue_totals(group_by=["topic", "income_band"])
+    assert totals == [
+        {"topic": "EVICTION", "income_band": "500-999", "num_issues": 1},
+        {"topic": "REPAIRS", "income_band": "", "num_issues": 1},
+        {"topic": "REPAIRS", "income_band": "500-999", "num_issues": 1},
+    ]
+    series = get_issue_series(group_by=["topic"], topic="REPAIRS")
+    assert [s["num_issues"] for s in series] == [1, 1]
+    assert series[0]["period_start"].day == 1
+
+    # Days without changes are left alone.
+    old_day = IssueRollup.objects.filter(period=RollupPeriod.DAY, num_issues=1).filter(
+        period_start=timezone.localtime(old_issue.created_at).date()
+    )
+    old_day.update(num_issues=99)
+    repairs.outcome = "SUCCESS"
+    repairs.save()
+    client.referrer_type = "RADIO"
+    client.save()
+    update_issue_rollups()
+
+    assert get_issue_totals(group_by=["outcome"], topic="REPAIRS") == [
+        {"outcome": "", "num_issues": 99},
+        {"outcome": "SUCCESS", "num_issues": 1},
+    ]
+    assert get_issue_totals(group_by=["referrer_type"], referrer_type="RADIO") == [
+        {"referrer_type": "RADIO", "num_issues": 2}
+    ]
+
+    # A rebuild recounts everything.
+    update_issue_rollups(rebuild=True)
+    assert sum(t["num_issues"] for t in get_issue_totals()) == 3
+
+    with pytest.raises(ValueError):
+        get_issue_totals(group_by=["email"])
+
+
+@pytest.mark.django_db
+@pytest.mark.enable_signals
+def test_issue_rollups_updated_on_delete(django_capture_on_commit_callbacks):
+    """
+    Ensure a deleted issue is no longer counted.
+    """
+    created_at = timezone.now() - timedelta(days=40)
+    issue = IssueFactory(topic="REPAIRS", created_at=created_at)
+    IssueFactory(topic="EVICTION", created_at=created_at)
+    update_issue_rollups()
+    assert sum(t["num_issues"] for t in get_issue_totals()) == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        issue.delete()
+
+    assert get_issue_totals(group_by=["topic"]) == [
+        {"topic": "EVICTION", "num_issues": 1}
+    ]
+    assert sum(s["num_issues"] for s in get_issue_series()) == 1
@@ -3,10 +3,11 @@ from unittest import mock
 import pytest
 
 from actionstep.services.actionstep import send_issue_actionstep
-from core.factories import IssueFactory
-from core.models import Submission
+from core.factories import ClientFactory, IssueFactory, UserFactory
+from core.models import Issue, ParalegalWorkload, Submission
 from core.services.slack import send_issue_slack
 from core.services.submission import process_submission
+from core.services.workload import recompute_paralegal_workloads
 
 
 @pytest.mark.django_db
@@ -87,3 +88,50 @@ def test_actionstep_not_dispatched_when_already_sent(mock_async):
     issue.save()
     # Ensure only email task was dispatched
     mock_async.assert_has_calls([mock.call(send_issue_slack, str(issue.pk))])
+
+
+@pytest.mark.django_db
+@pytest.mark.enable_signals
+def test_paralegal_workload_updated_on_issue_change():
+    """
+    Ensure paralegal workloads follow their issues' assignment, status and topic.
+    """
+    alice, bob = UserFactory(), UserFactory()
+    fields = {"client": ClientFactory(), "answers": {}}
+    fields.update(is_alert_sent=True, is_case_sent=True)
+    issue = Issue.objects.create(paralegal=alice, topic="REPAIRS", **fields)
+    Issue.objects.create(paralegal=alice, topic="EVICTION", is_open=False, **fields)
+    workload = ParalegalWorkload.objects.get(paralegal=alice)
+    assert workload.total_cases == 2
+    assert workload.open_cases == 1
+    assert workload.open_repairs == 1
+    assert workload.capacity == 25
+
+    issue.topic = "EVICTION"
+    issue.save()
+    workload.refresh_from_db()
+    assert (workload.open_repairs, workload.open_eviction) == (0, 1)
+
+    issue.paralegal = bob
+    issue.save()
+    workload.refresh_from_db()
+    assert (workload.total_cases, workload.open_cases) == (1, 0)
+    assert ParalegalWorkload.objects.get(paralegal=bob).open_eviction == 1
+
+    issue.delete()
+    assert not ParalegalWorkload.objects.filter(paralegal=bob).exists()
+
+
+@pytest.mark.django_db
+def test_paralegal_workload_drift_fixed():
+    """
+    Ensure the full recompute fixes workloads missed by bulk updates.
+    """
+    alice, bob = UserFactory(), UserFactory()
+    issue = IssueFactory(paralegal=alice)
+    recompute_paralegal_workloads()
+    Issue.objects.filter(pk=issue.pk).update(paralegal=bob)
+    assert recompute_paralegal_workloads() == 2
+    assert not ParalegalWorkload.objects.filter(paralegal=alice).exists()
+    assert ParalegalWorkload.objects.get(paralegal=bob).total_cases == 1
+    assert recompute_paralegal_workloads() == 0
@@ -0,0 +1,106 @@
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+
+from core.services.slack import send_issue_slack
+from taskqueue.models import DeadLetter
+from utils import tasks
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+@mock.patch("utils.tasks._async_task", autospec=True)
+def test_duplicate_tasks_dropped_while_pending(mock_async):
+    """
+    Ensure the same task is only enqueued once while it is pending.
+    """
+    mock_async.return_value = "task-id"
+    assert tasks.async_task(send_issue_slack, "issue-1") == "task-id"
+    assert tasks.async_task(send_issue_slack, "issue-1") is None
+    assert tasks.async_task(send_issue_slack, "issue-2") == "task-id"
+    assert mock_async.call_count == 2
+    assert tasks.get_dedupe_stats() == {"hits": 1, "misses": 2}
+
+
+@pytest.mark.django_db
+@mock.patch("utils.tasks._async_task", autospec=True)
+def test_task_can_be_enqueued_again_once_run(mock_async):
+    """
+    Ensure the dedupe key is released once the task has run, even if it fails.
+    """
+    tasks.async_task(failing_task, "issue-1")
+    wrapped_func = mock_async.call_args[0][0]
+    assert isinstance(wrapped_func, tasks.ReleaseDedupeKey)
+    with pytest.raises(ValueError):
+        wrapped_func("issue-1")
+
+    tasks.async_task(failing_task, "issue-1")
+    assert mock_async.call_count == 2
+    assert tasks.get_dedupe_stats() == {"hits": 0, "misses": 2}
+
+
+def failing_task(issue_pk):
+    raise ValueError("Oh no")
+
+
+@pytest.mark.django_db
+@mock.patch("utils.tasks._async_task", autospec=True)
+def test_tasks_routed_to_their_lane(mock_async):
+    """
+    Ensure tasks are enqueued on the lane they declare, or the default lane.
+    """
+    tasks.async_task(send_issue_slack, "issue-1")
+    assert mock_async.call_args[1]["broker"].list_key == "alerts"
+    tasks.async_task(failing_task, "issue-1")
+    assert mock_async.call_args[1]["broker"].list_key == settings.DEFAULT_TASK_LANE
+
+
+@pytest.mark.django_db
+@mock.patch("utils.tasks._async_task", autospec=True)
+def test_failed_task_retried_then_dead_lettered(mock_async):
+    """
+    Ensure a failing task is retried with backoff until it runs out of attempts,
+    and is then saved as a dead letter.
+    """
+    tasks.async_task(flaky_task, "issue-1")
+    for attempt in range(1, 4):
+        assert mock_async.call_count == attempt
+        wrapped_func = mock_async.call_args[0][0]
+        assert mock_async.call_args[1]["timeout"] == 5 * 60
+        with pytest.raises(ValueError):
+            wrapped_func("issue-1")
+
+        if attempt < 3:
+            # Duplicates are dropped until the task gives up.
+            assert tasks.async_task(flaky_task, "issue-1") is None
+
+    assert mock_async.call_count == 3
+    dead_letter = DeadLetter.objects.get()
+    assert dead_letter.name == tasks.get_task_name(flaky_task)
+    assert dead_letter.args == ("issue-1",)
+    assert dead_letter.attempts == 3
+    assert "Oh no" in dead_letter.error
+    tasks.async_task(flaky_task, "issue-1")
+    assert mock_async.call_count == 4
+
+
+def test_retry_delay_backs_off():
+    """
+    Ensure retry delays grow exponentially, up to a cap.
+    """
+    for attempt, max_delay in [(1, 10), (2, 20), (3, 40), (20, tasks.RETRY_BACKOFF_MAX)]:
+        delays = [tasks.get_retry_delay(attempt, 10) for _ in range(20)]
+        assert all(0 <= d <= max_delay for d in delays)
+
+
+@tasks.task_options(max_attempts=3, timeout=5 * 60)
+def flaky_task(issue_pk):
+    raise ValueError("Oh no")
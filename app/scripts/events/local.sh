@@ -0,0 +1,3 @@
+#!/bin/bash
+set -e
+uvicorn clerk.asgi:application --host 0.0.0.0 --port 8001 --reload
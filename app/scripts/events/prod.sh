@@ -0,0 +1,25 @@
+#!/bin/bash
+set -e
+echo "Starting clerk live events as `whoami`"
+
+echo "Setting up logging"
+# Set up gunicorn logging
+mkdir -p /var/log/gunicorn
+touch /var/log/gunicorn/access.log
+touch /var/log/gunicorn/error.log
+
+# Set up django logging
+touch /var/log/django.log
+
+# Long-lived event streams are served by an async worker,
+# so they don't tie up the sync web workers.
+echo "Starting gunicorn with an ASGI worker"
+gunicorn clerk.asgi:application \
+    --name clerk-events \
+    --worker-class uvicorn.workers.UvicornWorker \
+    --workers 1 \
+    --bind 0.0.0.0:${GUNICORN_PORT} \
+    --capture-output \
+    --log-level info \
+    --error-logfile /var/log/gunicorn/error.log \
+    --access-logfile /var/log/gunicorn/access.log
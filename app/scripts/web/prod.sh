@@ -13,6 +13,20 @@ touch /var/log/django.log
 
 echo "Running migrations"
 ./manage.py migrate
+./manage.py createcachetable
+
+echo "Purging cached pages"
+./manage.py page_cache --purge
+
+# Pages are served by their views until they have been pre-rendered.
+echo "Pre-rendering pages in the background"
+./manage.py prerender_pages &
+
+echo "Building sitemaps in the background"
+./manage.py build_sitemaps &
+
+echo "Indexing pages for search in the background"
+./manage.py rebuild_search_index &
 
 echo "Starting gunicorn"
 gunicorn clerk.wsgi:application \
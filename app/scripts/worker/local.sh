@@ -6,4 +6,4 @@ watchmedo \
     --recursive \
     --pattern '*.py' \
     -- \
-    ./manage.py qcluster
+    ./manage.py qlanes
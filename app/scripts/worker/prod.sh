@@ -7,5 +7,5 @@ echo "Setting up logging"
 touch /var/log/django.log
 
 
-echo "Starting qcluster"
-./manage.py qcluster
+echo "Starting qcluster for each task lane"
+./manage.py qlanes
@@ -0,0 +1,35 @@
+from django.contrib import admin
+from django.contrib.messages import constants as messages
+from django.utils import timezone
+
+from utils.tasks import async_task
+
+from .models import DeadLetter
+
+
+@admin.register(DeadLetter)
+class DeadLetterAdmin(admin.ModelAdmin):
+    ordering = ("-created_at",)
+    list_display = ("id", "created_at", "name", "lane", "attempts", "requeued_at")
+    list_filter = ("lane", "name")
+    readonly_fields = (
+        "created_at",
+        "name",
+        "lane",
+        "args",
+        "kwargs",
+        "attempts",
+        "error",
+        "requeued_at",
+    )
+
+    actions = ["requeue"]
+
+    def requeue(self, request, queryset):
+        for dead_letter in queryset:
+            async_task(dead_letter.func, *dead_letter.args, **dead_letter.kwargs)
+
+        queryset.update(requeued_at=timezone.now())
+        self.message_user(request, "Tasks requeued.", level=messages.INFO)
+
+    requeue.short_description = "Requeue tasks"
@@ -0,0 +1,25 @@
+from django.apps import AppConfig
+from django.db.utils import OperationalError, ProgrammingError
+
+SCHEDULES = [
+    {"func": "taskqueue.stats.prune_task_runs", "schedule_type": "D"},
+]
+
+
+class TaskQueueConfig(AppConfig):
+    name = "taskqueue"
+
+    def ready(self):
+        from django_q.models import Schedule
+
+        import taskqueue.signals
+
+        # Set up schedules, see actionstep.apps
+        for schedule_data in SCHEDULES:
+            try:
+                Schedule.objects.filter(func=schedule_data["func"]).exclude(
+                    **schedule_data
+                ).delete()
+                Schedule.objects.get_or_create(**schedule_data)
+            except (OperationalError, ProgrammingError):
+                pass  # No database available, eg. Docker build.
@@ -0,0 +1,165 @@
+"""
+Django-Q broker which stores tasks in Postgres, like the ORM broker,
+but wakes workers using LISTEN/NOTIFY instead of polling the queue table.
+"""
+
+import select
+from datetime import timedelta
+from time import sleep
+
+import psycopg2
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Case, IntegerField, Value, When
+from django.utils import timezone
+from django_q.brokers.orm import ORM, _timeout
+from django_q.conf import Conf, logger
+from psycopg2 import sql
+
+from .lanes import get_served_lanes
+
+# seconds, how long an idle worker waits for a notification before checking the queue
+# anyway, so that tasks whose lock has expired are eventually picked up again.
+LISTEN_TIMEOUT = 30
+
+
+class PostgresBroker(ORM):
+    """
+    Tasks are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so concurrent clusters
+    never contend for the same rows, and each enqueue sends a NOTIFY on the queue's
+    channel, so idle workers pick up new tasks within milliseconds.
+
+    When the queue is a task lane, workers also claim tasks from more urgent lanes,
+    most urgent first.
+
+    Tasks can be delayed by setting `delay` before enqueuing them: the task's lock
+    is set so that it expires `delay` seconds from now, and it is picked up by the
+    next worker to check the queue after that.
+    """
+
+    def __init__(self, list_key: str = Conf.PREFIX):
+        super().__init__(list_key=list_key)
+        self.listener = None
+        self.delay = 0
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.listener = None
+        self.delay = 0
+
+    @property
+    def channel(self):
+        return get_channel(self.list_key)
+
+    def get_served_keys(self):
+        if self.list_key in settings.TASK_LANES:
+            return get_served_lanes(self.list_key)
+        else:
+            return [self.list_key]
+
+    def enqueue(self, task):
+        lock = _timeout() + timedelta(seconds=self.delay)
+        with transaction.atomic(using=Conf.ORM):
+            package = self.get_connection().create(
+                key=self.list_key, payload=task, lock=lock
+            )
+            if not self.delay:
+                # Notifications are only delivered once the transaction commits.
+                with connections[Conf.ORM].cursor() as cursor:
+                    cursor.execute(
+                        "SELECT pg_notify(%s, %s)", [self.channel, str(package.pk)]
+                    )
+
+        return package.pk
+
+    def dequeue(self):
+        # Start listening before checking the queue so that no wakeups are missed.
+        listener = self.get_listener()
+        task_list = self.claim()
+        if task_list:
+            return task_list
+
+        self.wait(listener)
+
+    def claim(self):
+        """
+        Lock and return up to Conf.BULK tasks, skipping any claimed by other clusters.
+        """
+        keys = self.get_served_keys()
+        key_order = Case(
+            *[When(key=key, then=Value(idx)) for idx, key in enumerate(keys)],
+            output_field=IntegerField(),
+        )
+        queryset = self.get_connection()
+        with transaction.atomic(using=Conf.ORM):
+            tasks = list(
+                queryset.select_for_update(skip_locked=True)
+                .filter(key__in=keys, lock__lt=_timeout())
+                .order_by(key_order, "id")[: Conf.BULK]
+            )
+            if tasks:
+                queryset.filter(pk__in=[t.pk for t in tasks]).update(lock=timezone.now())
+
+        return [(t.pk, t.payload) for t in tasks]
+
+    def wait(self, listener):
+        """
+        Block until a task is enqueued on a served queue, or LISTEN_TIMEOUT seconds pass.
+        """
+        if listener is None:
+            # Can't listen, fall back to polling.
+            sleep(Conf.POLL)
+            return
+
+        try:
+            if not listener.notifies:
+                select.select([listener], [], [], LISTEN_TIMEOUT)
+                listener.poll()
+
+            listener.notifies.clear()
+        except (psycopg2.Error, OSError):
+            logger.exception("Postgres broker lost its LISTEN connection")
+            self.close_listener()
+            sleep(Conf.POLL)
+
+    def get_listener(self):
+        """
+        Returns a dedicated autocommit connection that is listening on this queue's
+        channels. Django's own connections can't be used, because they may be inside
+        a transaction, which holds back notifications.
+        """
+        if self.listener is not None and not self.listener.closed:
+            return self.listener
+
+        try:
+            params = connections[Conf.ORM].get_connection_params()
+            listener = psycopg2.connect(**params)
+            listener.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with listener.cursor() as cursor:
+                for key in self.get_served_keys():
+                    channel = sql.Identifier(get_channel(key))
+                    cursor.execute(sql.SQL("LISTEN {}").format(channel))
+        except psycopg2.Error:
+            logger.exception("Postgres broker could not LISTEN for %s", self.list_key)
+            return None
+
+        self.listener = listener
+        return listener
+
+    def close_listener(self):
+        if self.listener is not None:
+            try:
+                self.listener.close()
+            except psycopg2.Error:
+                pass
+
+        self.listener = None
+
+    def info(self) -> str:
+        if not self._info:
+            self._info = f"Postgres {Conf.ORM}"
+        return self._info
+
+
+def get_channel(key: str) -> str:
+    return f"django_q_{key}"
@@ -0,0 +1,89 @@
+"""
+Task lanes: named queues with a priority and their own workers.
+Lanes are declared in settings.TASK_LANES, and tasks are routed to a lane
+with utils.tasks.task_options.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+from django_q.conf import Conf
+from django_q.models import OrmQ
+
+# Wait times are recorded in one minute buckets, and reported over a rolling window.
+WAIT_BUCKET_SECONDS = 60
+WAIT_WINDOW_BUCKETS = 15
+WAIT_KEY_PREFIX = "taskqueue:wait"
+
+
+def get_lanes():
+    """
+    Returns lane names, most urgent first.
+    """
+    return sorted(settings.TASK_LANES.keys(), key=get_priority)
+
+
+def get_priority(lane: str) -> int:
+    return settings.TASK_LANES[lane]["priority"]
+
+
+def get_served_lanes(lane: str):
+    """
+    Returns the lanes whose tasks a lane's workers will run, most urgent first.
+    """
+    return [other for other in get_lanes() if get_priority(other) <= get_priority(lane)]
+
+
+def record_wait(lane: str, wait_seconds: float):
+    """
+    Record how long a task waited in a lane before a worker picked it up.
+    """
+    bucket = int(time.time() // WAIT_BUCKET_SECONDS)
+    key = f"{WAIT_KEY_PREFIX}:{lane}:{bucket}"
+    timeout = WAIT_BUCKET_SECONDS * (WAIT_WINDOW_BUCKETS + 1)
+    count, total, longest = cache.get(key, (0, 0.0, 0.0))
+    cache.set(key, (count + 1, total + wait_seconds, max(longest, wait_seconds)), timeout)
+
+
+def get_lane_metrics():
+    """
+    Returns queue depth and recent wait times for each lane.
+    Tasks which are waiting to be retried are counted as running.
+    """
+    lock_cutoff = timezone.now() - timedelta(seconds=Conf.RETRY)
+    depths = {
+        row["key"]: row
+        for row in OrmQ.objects.values("key").annotate(
+            queued=Count("id", filter=Q(lock__lt=lock_cutoff)),
+            running=Count("id", filter=Q(lock__gte=lock_cutoff)),
+        )
+    }
+    bucket = int(time.time() // WAIT_BUCKET_SECONDS)
+    metrics = []
+    for lane in get_lanes():
+        bucket_keys = [
+            f"{WAIT_KEY_PREFIX}:{lane}:{b}"
+            for b in range(bucket - WAIT_WINDOW_BUCKETS + 1, bucket + 1)
+        ]
+        waits = cache.get_many(bucket_keys).values()
+        count = sum(w[0] for w in waits)
+        total = sum(w[1] for w in waits)
+        depth = depths.get(lane, {})
+        metrics.append(
+            {
+                "lane": lane,
+                "priority": get_priority(lane),
+                "workers": settings.TASK_LANES[lane]["workers"],
+                "queued": depth.get("queued", 0),
+                "running": depth.get("running", 0),
+                "tasks": count,
+                "mean_wait": total / count if count else None,
+                "max_wait": max((w[2] for w in waits), default=None),
+            }
+        )
+
+    return metrics
@@ -0,0 +1,93 @@
+import threading
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django_q.brokers.orm import ORM
+
+from taskqueue.broker import PostgresBroker
+
+BROKERS = {"orm": ORM, "postgres": PostgresBroker}
+
+
+class Command(BaseCommand):
+    help = "Compare task throughput and pickup latency of the ORM and Postgres brokers"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tasks", type=int, default=1000, help="Tasks enqueued for throughput"
+        )
+        parser.add_argument(
+            "--samples", type=int, default=100, help="Tasks enqueued for latency"
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0.05,
+            help="Seconds between tasks enqueued for latency",
+        )
+        parser.add_argument("--broker", choices=BROKERS.keys(), action="append")
+
+    def handle(self, *args, **kwargs):
+        broker_names = kwargs["broker"] or list(BROKERS.keys())
+        self.stdout.write("broker      tasks/sec   p50 (ms)   p99 (ms)")
+        for name in broker_names:
+            broker = BROKERS[name](list_key=f"benchmark-{uuid.uuid4().hex[:8]}")
+            try:
+                rate = measure_throughput(broker, kwargs["tasks"])
+                latencies = measure_latency(broker, kwargs["samples"], kwargs["interval"])
+            finally:
+                broker.purge_queue()
+
+            p50 = 1000 * percentile(latencies, 50)
+            p99 = 1000 * percentile(latencies, 99)
+            self.stdout.write(f"{name:<10} {rate:>10.0f} {p50:>10.1f} {p99:>10.1f}")
+
+
+def measure_throughput(broker, num_tasks):
+    """
+    Returns tasks/sec when a backlog of tasks is enqueued and then drained.
+    """
+    for _ in range(num_tasks):
+        broker.enqueue("")
+
+    start = time.time()
+    done = 0
+    while done < num_tasks:
+        for task_id, _ in broker.dequeue() or []:
+            broker.acknowledge(task_id)
+            done += 1
+
+    return num_tasks / (time.time() - start)
+
+
+def measure_latency(broker, num_tasks, interval):
+    """
+    Returns seconds between enqueue and pickup for tasks enqueued to an idle worker.
+    """
+
+    def produce():
+        try:
+            for _ in range(num_tasks):
+                time.sleep(interval)
+                broker.enqueue(str(time.time()))
+        finally:
+            connections.close_all()
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    latencies = []
+    while len(latencies) < num_tasks:
+        for task_id, payload in broker.dequeue() or []:
+            latencies.append(time.time() - float(payload))
+            broker.acknowledge(task_id)
+
+    producer.join()
+    return latencies
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    idx = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[idx]
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from taskqueue.lanes import WAIT_BUCKET_SECONDS, WAIT_WINDOW_BUCKETS, get_lane_metrics
+
+
+class Command(BaseCommand):
+    help = "Show queue depth and recent wait times for each task lane"
+
+    def handle(self, *args, **kwargs):
+        window_mins = WAIT_BUCKET_SECONDS * WAIT_WINDOW_BUCKETS // 60
+        self.stdout.write(f"Wait times over the last {window_mins} minutes")
+        self.stdout.write(
+            f"{'lane':<14} {'priority':>8} {'workers':>8} {'queued':>7} "
+            f"{'running':>8} {'tasks':>6} {'mean wait':>10} {'max wait':>9}"
+        )
+        for m in get_lane_metrics():
+            mean_wait = format_seconds(m["mean_wait"])
+            max_wait = format_seconds(m["max_wait"])
+            self.stdout.write(
+                f"{m['lane']:<14} {m['priority']:>8} {m['workers']:>8} {m['queued']:>7} "
+                f"{m['running']:>8} {m['tasks']:>6} {mean_wait:>10} {max_wait:>9}"
+            )
+
+
+def format_seconds(seconds):
+    return "-" if seconds is None else f"{seconds:.2f}s"
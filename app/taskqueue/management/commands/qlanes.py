@@ -0,0 +1,36 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Start a Django-Q cluster for each task lane in settings.TASK_LANES"
+
+    def handle(self, *args, **kwargs):
+        procs = []
+        for lane in settings.TASK_LANES:
+            self.stdout.write(f"Starting qcluster for lane {lane}")
+            env = {**os.environ, "TASK_LANE": lane}
+            cmd = [sys.executable, sys.argv[0], "qcluster"]
+            procs.append(subprocess.Popen(cmd, env=env))
+
+        def stop(signum=None, frame=None):
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.send_signal(signal.SIGTERM)
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        try:
+            # Exit if any cluster exits, so that the whole worker gets restarted.
+            while all(proc.poll() is None for proc in procs):
+                time.sleep(1)
+        finally:
+            stop()
+            for proc in procs:
+                proc.wait()
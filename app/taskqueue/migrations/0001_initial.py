@@ -0,0 +1,31 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:35
+
+from django.db import migrations, models
+import django.utils.timezone
+import picklefield.fields
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeadLetter',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('name', models.CharField(max_length=256)),
+                ('lane', models.CharField(max_length=64)),
+                ('func', picklefield.fields.PickledObjectField(editable=False)),
+                ('args', picklefield.fields.PickledObjectField(default=tuple, editable=False)),
+                ('kwargs', picklefield.fields.PickledObjectField(default=dict, editable=False)),
+                ('attempts', models.IntegerField()),
+                ('error', models.TextField()),
+                ('requeued_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
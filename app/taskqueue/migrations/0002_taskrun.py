@@ -0,0 +1,32 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taskqueue', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskRun',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.CharField(max_length=32, unique=True)),
+                ('name', models.CharField(max_length=256)),
+                ('lane', models.CharField(max_length=64)),
+                ('enqueued_at', models.DateTimeField()),
+                ('started_at', models.DateTimeField(db_index=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('success', models.BooleanField(null=True)),
+                ('wait', models.FloatField()),
+                ('duration', models.FloatField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='taskrun',
+            index=models.Index(fields=['name', 'started_at'], name='taskqueue_t_name_1db845_idx'),
+        ),
+    ]
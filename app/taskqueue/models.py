@@ -0,0 +1,60 @@
+from django.db import models
+from django.utils import timezone
+from picklefield.fields import PickledObjectField
+
+
+class DeadLetter(models.Model):
+    """
+    A background task which failed on every attempt and was given up on.
+    Dead letters can be requeued from the admin once the cause has been fixed.
+    """
+
+    # When the task was given up on
+    created_at = models.DateTimeField(default=timezone.now)
+    # Dotted path of the task function, eg. "core.services.slack.send_issue_slack"
+    name = models.CharField(max_length=256)
+    # Lane that ran the task, eg. "alerts"
+    lane = models.CharField(max_length=64)
+    # The task function and its arguments
+    func = PickledObjectField()
+    args = PickledObjectField(default=tuple)
+    kwargs = PickledObjectField(default=dict)
+    # Number of attempts made
+    attempts = models.IntegerField()
+    # Traceback of the last failure
+    error = models.TextField()
+    # When the task was last requeued from the admin
+    requeued_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.pk} {self.name}"
+
+
+class TaskRun(models.Model):
+    """
+    Timings and outcome of a background task, recorded for every task that a worker
+    starts, so that task latency and failure rates can be monitored.
+    """
+
+    # Django-Q task id
+    task_id = models.CharField(max_length=32, unique=True)
+    # Dotted path of the task function, eg. "core.services.slack.send_issue_slack"
+    name = models.CharField(max_length=256)
+    # Lane that ran the task, eg. "alerts"
+    lane = models.CharField(max_length=64)
+    # When the task was enqueued, started and finished
+    enqueued_at = models.DateTimeField()
+    started_at = models.DateTimeField(db_index=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Whether the task succeeded, null until it has finished
+    success = models.BooleanField(null=True)
+    # Seconds between enqueue and start
+    wait = models.FloatField()
+    # Seconds between start and finish, null until it has finished
+    duration = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["name", "started_at"])]
+
+    def __str__(self):
+        return f"{self.task_id} {self.name}"
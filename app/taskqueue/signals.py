@@ -0,0 +1,61 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django_q.models import Task
+from django_q.signals import pre_execute
+
+from utils.tasks import get_task_lane, get_task_name, task_failed
+
+from .lanes import record_wait
+from .models import DeadLetter, TaskRun
+
+
+@receiver(pre_execute)
+def record_task_start(sender, func, task, **kwargs):
+    # Django-Q sets "started" when the task is enqueued.
+    if func is None or not task.get("started"):
+        return
+
+    now = timezone.now()
+    lane = get_task_lane(func)
+    wait_seconds = (now - task["started"]).total_seconds()
+    record_wait(lane, wait_seconds)
+    TaskRun.objects.update_or_create(
+        task_id=task["id"],
+        defaults={
+            "name": get_task_name(func),
+            "lane": lane,
+            "enqueued_at": task["started"],
+            "started_at": now,
+            "wait": wait_seconds,
+            "finished_at": None,
+            "success": None,
+            "duration": None,
+        },
+    )
+
+
+@receiver(post_save, sender=Task)
+def record_task_finish(sender, instance, **kwargs):
+    # Django-Q saves a Task once a worker has finished running it.
+    run = TaskRun.objects.filter(task_id=instance.id).first()
+    if run is None:
+        return
+
+    run.finished_at = instance.stopped
+    run.success = instance.success
+    run.duration = (instance.stopped - run.started_at).total_seconds()
+    run.save()
+
+
+@receiver(task_failed)
+def save_dead_letter(sender, func, args, kwargs, attempts, error, **kw):
+    DeadLetter.objects.create(
+        name=get_task_name(func),
+        lane=get_task_lane(func),
+        func=func,
+        args=args,
+        kwargs=kwargs,
+        attempts=attempts,
+        error=error,
+    )
@@ -0,0 +1,78 @@
+"""
+Rolling statistics on background tasks, aggregated from TaskRun.
+"""
+
+from datetime import timedelta
+
+from django.db.models import Aggregate, Count, F, FloatField, Q
+from django.utils import timezone
+
+from .lanes import get_lane_metrics
+from .models import TaskRun
+
+# How long task runs are kept for.
+TASK_RUN_RETENTION = timedelta(days=7)
+PERCENTILES = [50, 95, 99]
+
+
+class Percentile(Aggregate):
+    """
+    Postgres continuous percentile, eg. Percentile("duration", 0.95)
+    """
+
+    function = "PERCENTILE_CONT"
+    name = "percentile"
+    output_field = FloatField()
+    template = "%(function)s(%(percentile)s) WITHIN GROUP (ORDER BY %(expressions)s)"
+
+    def __init__(self, expression, percentile, **extra):
+        super().__init__(expression, percentile=percentile, **extra)
+
+
+def get_task_stats(window: timedelta):
+    """
+    Returns throughput, failure rate and wait/duration percentiles for each task
+    function over the last `window` of time, plus the current state of each lane.
+    """
+    since = timezone.now() - window
+    percentile_aggs = {}
+    for pct in PERCENTILES:
+        percentile_aggs[f"wait_p{pct}"] = Percentile("wait", pct / 100)
+        percentile_aggs[f"duration_p{pct}"] = Percentile("duration", pct / 100)
+
+    rows = (
+        TaskRun.objects.filter(started_at__gte=since)
+        .values("name", "lane")
+        .annotate(
+            started=Count("id"),
+            finished=Count("id", filter=Q(finished_at__isnull=False)),
+            failed=Count("id", filter=Q(success=False)),
+            **percentile_aggs,
+        )
+        .order_by(F("started").desc(), "name")
+    )
+    window_mins = window.total_seconds() / 60
+    tasks = []
+    for row in rows:
+        tasks.append(
+            {
+                **row,
+                "throughput": row["finished"] / window_mins,
+                "failure_rate": row["failed"] / row["finished"] if row["finished"] else 0,
+            }
+        )
+
+    return {
+        "since": since,
+        "window_mins": window_mins,
+        "tasks": tasks,
+        "lanes": get_lane_metrics(),
+    }
+
+
+def prune_task_runs():
+    """
+    Delete task runs older than TASK_RUN_RETENTION.
+    """
+    cutoff = timezone.now() - TASK_RUN_RETENTION
+    TaskRun.objects.filter(started_at__lt=cutoff).delete()
@@ -0,0 +1,26 @@
+import pytest
+
+from taskqueue import broker as broker_module
+from taskqueue.broker import PostgresBroker
+
+
+@pytest.mark.django_db
+def test_postgres_broker_claims_each_task_once(monkeypatch):
+    """
+    Ensure tasks are claimed in order, and that claimed tasks aren't handed out again.
+    """
+    monkeypatch.setattr(broker_module, "LISTEN_TIMEOUT", 0)
+    broker = PostgresBroker(list_key="test")
+    first_id = broker.enqueue("first")
+    second_id = broker.enqueue("second")
+    assert broker.queue_size() == 2
+
+    assert broker.dequeue() == [(first_id, "first")]
+    assert broker.dequeue() == [(second_id, "second")]
+    assert broker.dequeue() is None
+    assert broker.lock_size() == 2
+
+    broker.acknowledge(first_id)
+    broker.acknowledge(second_id)
+    assert broker.lock_size() == 0
+    broker.close_listener()
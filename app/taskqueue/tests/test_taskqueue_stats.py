@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from taskqueue.models import TaskRun
+from taskqueue.stats import get_task_stats
+
+
+@pytest.mark.django_db
+def test_task_stats_aggregated_per_function():
+    """
+    Ensure task runs are aggregated into throughput, failure rate and percentiles.
+    """
+    now = timezone.now()
+    for idx in range(10):
+        TaskRun.objects.create(
+            task_id=f"slack-{idx}",
+            name="core.services.slack.send_issue_slack",
+            lane="alerts",
+            enqueued_at=now - timedelta(minutes=5),
+            started_at=now - timedelta(minutes=4),
+            finished_at=now - timedelta(minutes=3),
+            success=idx != 0,
+            wait=1,
+            duration=idx + 1,
+        )
+
+    # Outside of the window.
+    TaskRun.objects.create(
+        task_id="old",
+        name="core.services.slack.send_issue_slack",
+        lane="alerts",
+        enqueued_at=now - timedelta(hours=2),
+        started_at=now - timedelta(hours=2),
+        wait=1,
+    )
+    # Still running.
+    TaskRun.objects.create(
+        task_id="running",
+        name="actionstep.services.actionstep._send_issue_actionstep",
+        lane="integrations",
+        enqueued_at=now,
+        started_at=now,
+        wait=0,
+    )
+
+    stats = get_task_stats(timedelta(minutes=60))
+    slack, actionstep = stats["tasks"]
+    assert slack["name"] == "core.services.slack.send_issue_slack"
+    assert slack["started"] == 10
+    assert slack["finished"] == 10
+    assert slack["failed"] == 1
+    assert slack["failure_rate"] == 0.1
+    assert slack["throughput"] == 10 / 60
+    assert slack["duration_p50"] == 5.5
+    assert slack["duration_p99"] == pytest.approx(9.91)
+    assert actionstep["started"] == 1
+    assert actionstep["finished"] == 0
+    assert actionstep["duration_p50"] is None
+    assert [lane["lane"] for lane in stats["lanes"]] == ["alerts", "integrations", "bulk"]
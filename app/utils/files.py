@@ -0,0 +1,15 @@
+import os
+import tempfile
+
+
+def write_file_atomically(file_path: str, content: bytes):
+    """
+    Write the file via a temporary file, so that it is never read half written.
+    """
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path))
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, file_path)
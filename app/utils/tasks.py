@@ -0,0 +1,255 @@
+"""
+Wrapper around Django-Q's async_task which coalesces duplicate tasks, routes
+each task to its lane and retries failed tasks.
+
+Admin actions and signal handlers can enqueue the same (func, args) many times
+in a burst. Only the first copy is enqueued: duplicates are dropped while it
+is pending, running or waiting to be retried, so they collapse into the task
+that is already in flight.
+"""
+
+import hashlib
+import logging
+import random
+import traceback
+
+from django.conf import settings
+from django.core.cache import cache
+from django.dispatch import Signal
+from django_q.brokers import get_broker
+from django_q.tasks import async_task as _async_task
+
+logger = logging.getLogger(__name__)
+
+# seconds, upper bound on how long a task can hold its dedupe key, in case a worker
+# dies without releasing it: a task killed for running too long is redelivered
+# after Q_CLUSTER["retry"], and can then run for up to TASK_MAX_TIMEOUT.
+DEDUPE_TIMEOUT = settings.TASK_MAX_TIMEOUT + settings.Q_CLUSTER["retry"]
+DEDUPE_KEY_PREFIX = "tasks:dedupe"
+DEDUPE_HITS_KEY = f"{DEDUPE_KEY_PREFIX}:hits"
+DEDUPE_MISSES_KEY = f"{DEDUPE_KEY_PREFIX}:misses"
+
+# seconds, failed tasks are retried after a random delay of up to
+# backoff * 2 ** (attempt - 1), capped at RETRY_BACKOFF_MAX.
+RETRY_BACKOFF = 30
+RETRY_BACKOFF_MAX = 60 * 60
+
+# Sent when a task has failed on its last attempt.
+# args: func, args, kwargs, attempts, error
+task_failed = Signal()
+
+
+def async_task(func, *args, **kwargs):
+    """
+    Drop-in replacement for django_q.tasks.async_task.
+    Returns the Django-Q task id, or None if the task was a duplicate.
+    """
+    key = get_dedupe_key(func, args, kwargs)
+    if not cache.add(key, 1, DEDUPE_TIMEOUT):
+        _incr(DEDUPE_HITS_KEY)
+        logger.info("Dropping duplicate task %s%s", get_task_name(func), args)
+        return None
+
+    _incr(DEDUPE_MISSES_KEY)
+    try:
+        return enqueue(RetryTask(func, key), args, kwargs)
+    except Exception:
+        cache.delete(key)
+        raise
+
+
+def enqueue(task, args, kwargs, delay: float = 0):
+    """
+    Enqueue a wrapped task on its lane, with its timeout, after `delay` seconds.
+    """
+    if "broker" not in kwargs:
+        kwargs["broker"] = get_broker(list_key=get_task_lane(task))
+        # Only taskqueue.broker.PostgresBroker supports delays, other brokers run
+        # the task as soon as possible.
+        kwargs["broker"].delay = delay
+
+    kwargs.setdefault("timeout", get_task_timeout(task))
+    return _async_task(task, *args, **kwargs)
+
+
+class ReleaseDedupeKey:
+    """
+    Wrapper for Django-Q tasks which releases the task's dedupe key once it has run,
+    so that the same task can be enqueued again.
+
+    Written as a class so it is pickleable, see utils.sentry.WithSentryCapture.
+    """
+
+    def __init__(self, func, key):
+        self.func = func
+        self.key = key
+
+    def __call__(self, *args, **kwargs):
+        try:
+            return self.func(*args, **kwargs)
+        finally:
+            self.release()
+
+    def release(self):
+        cache.delete(self.key)
+
+    def __str__(self):
+        return str(self.func)
+
+
+class RetryTask(ReleaseDedupeKey):
+    """
+    Wrapper for Django-Q tasks which re-enqueues a failed task with exponential
+    backoff and jitter, until it has been attempted max_attempts times.
+    The dedupe key is held until the task succeeds or runs out of attempts.
+
+    Attempts are counted in the cache, so that a task which was killed for running
+    past its timeout, and then redelivered by Django-Q, also counts as an attempt.
+    """
+
+    @property
+    def attempts_key(self):
+        return f"{self.key}:attempts"
+
+    def __call__(self, *args, **kwargs):
+        options = get_task_options(self.func)
+        max_attempts = options.get("max_attempts", 1)
+        attempt = _incr(self.attempts_key)
+        if attempt > max_attempts:
+            # The last attempt was killed for timing out.
+            self.fail(args, kwargs, max_attempts, "Task timed out")
+            return
+
+        try:
+            result = self.func(*args, **kwargs)
+        except Exception:
+            error = traceback.format_exc()
+            if attempt < max_attempts:
+                backoff = options.get("backoff", RETRY_BACKOFF)
+                delay = get_retry_delay(attempt, backoff)
+                logger.warning(
+                    "Retrying task %s%s in %.0fs after attempt %s of %s failed",
+                    get_task_name(self.func),
+                    args,
+                    delay,
+                    attempt,
+                    max_attempts,
+                )
+                # Keep holding the dedupe key while the retry is pending.
+                cache.set(self.key, 1, DEDUPE_TIMEOUT + delay)
+                enqueue(self, args, dict(kwargs), delay)
+            else:
+                self.fail(args, kwargs, attempt, error)
+
+            raise
+
+        self.release()
+        return result
+
+    def fail(self, args, kwargs, attempts, error):
+        logger.error(
+            "Task %s%s failed after %s attempts", get_task_name(self.func), args, attempts
+        )
+        self.release()
+        task_failed.send(
+            sender=RetryTask,
+            func=self.func,
+            args=args,
+            kwargs=kwargs,
+            attempts=attempts,
+            error=error,
+        )
+
+    def release(self):
+        cache.delete_many([self.key, self.attempts_key])
+
+
+def task_options(**options):
+    """
+    Declares how a task function is run, eg.
+
+        @task_options(lane="alerts")
+        def send_issue_slack(issue_pk: str):
+            ...
+
+    Options:
+        lane: name of the lane in settings.TASK_LANES which runs this task.
+        max_attempts: how many times to try the task before giving up, default 1.
+        backoff: seconds, base delay between attempts, default RETRY_BACKOFF.
+        timeout: seconds, the task is killed if it runs for longer than this,
+            default settings.TASK_TIMEOUT, at most settings.TASK_MAX_TIMEOUT.
+    """
+
+    def wrap(func):
+        func.task_options = options
+        return func
+
+    return wrap
+
+
+def get_task_options(func) -> dict:
+    """
+    Returns the options declared for a task function, looking through wrappers.
+    """
+    options = {}
+    while func is not None:
+        options = {**getattr(func, "task_options", {}), **options}
+        func = getattr(func, "func", None)
+
+    return options
+
+
+def get_task_lane(func) -> str:
+    return get_task_options(func).get("lane") or settings.DEFAULT_TASK_LANE
+
+
+def get_task_timeout(func) -> int:
+    timeout = get_task_options(func).get("timeout") or settings.TASK_TIMEOUT
+    return min(timeout, settings.TASK_MAX_TIMEOUT)
+
+
+def get_retry_delay(attempt: int, backoff: float) -> float:
+    """
+    Returns seconds to wait before retrying a task, using "full jitter" so that
+    tasks which failed together don't all retry at the same time.
+    """
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, backoff * 2 ** (attempt - 1)))
+
+
+def get_dedupe_stats():
+    """
+    Returns the number of duplicate tasks dropped (hits) and tasks enqueued (misses).
+    """
+    return {
+        "hits": cache.get(DEDUPE_HITS_KEY, 0),
+        "misses": cache.get(DEDUPE_MISSES_KEY, 0),
+    }
+
+
+def get_task_name(func) -> str:
+    """
+    Returns the dotted path of a task function, looking through wrappers like
+    WithSentryCapture, which store the wrapped function as `func`.
+    """
+    while hasattr(func, "func"):
+        func = func.func
+
+    module = getattr(func, "__module__", "")
+    name = getattr(func, "__qualname__", None) or str(func)
+    return f"{module}.{name}" if module else name
+
+
+def get_dedupe_key(func, args, kwargs) -> str:
+    task_str = repr((get_task_name(func), args, sorted(kwargs.items())))
+    task_hash = hashlib.sha1(task_str.encode("utf-8")).hexdigest()
+    return f"{DEDUPE_KEY_PREFIX}:{task_hash}"
+
+
+def _incr(key) -> int:
+    cache.add(key, 0, None)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Key was evicted between add and incr.
+        cache.set(key, 1, None)
+        return 1
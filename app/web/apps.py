@@ -5,6 +5,7 @@ class WebConfig(AppConfig):
     name = "web"
 
     def ready(self):
+        import web.signals
         import web.wagtail_hooks
 
         # Hack in edit to Redirect link property so it uses the specific page.
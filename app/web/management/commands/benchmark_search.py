@@ -0,0 +1,96 @@
+import random
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.core.paginator import Paginator
+from django.db import transaction
+from wagtail.core.models import Page
+from wagtail.core.rich_text import RichText
+
+from web.models import BlogListPage, BlogPage, PageSearchEntry
+from web.services.search import update_search_entry
+
+WORDS = (
+    "rent tenant landlord lease bond repairs eviction notice tribunal vcat agent "
+    "mould heating leak plumbing damage inspection increase reduction hardship "
+    "payment arrears property renter rights advice lawyer application hearing "
+    "order compensation housing market apartment house room share contract "
+    "condition report keys locks safety smoke alarm gas electricity water"
+).split()
+QUERIES = ["eviction", "rent increase", "mould repairs", "bond", "landlord notice"]
+
+
+class Command(BaseCommand):
+    help = "Compare blog search latency of the Wagtail database backend and the index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--posts", type=int, default=10000, help="Blog posts to search"
+        )
+        parser.add_argument(
+            "--samples", type=int, default=20, help="Searches timed per query"
+        )
+
+    def handle(self, *args, **kwargs):
+        # Nothing is kept, the posts are rolled back once they have been searched.
+        with transaction.atomic():
+            blog_list_page = create_blog_posts(kwargs["posts"])
+            self.stdout.write(f"Searching {kwargs['posts']} posts")
+            self.stdout.write("backend     p50 (ms)   p99 (ms)")
+            for name, search in [("wagtail", search_wagtail), ("index", search_index)]:
+                latencies = []
+                for query in QUERIES:
+                    for _ in range(kwargs["samples"]):
+                        start = time.time()
+                        search(blog_list_page, query)
+                        latencies.append(time.time() - start)
+
+                p50 = 1000 * percentile(latencies, 50)
+                p99 = 1000 * percentile(latencies, 99)
+                self.stdout.write(f"{name:<10} {p50:>10.1f} {p99:>10.1f}")
+
+            transaction.set_rollback(True)
+
+
+def create_blog_posts(num_posts):
+    root_page = Page.objects.get(depth=1)
+    blog_list_page = BlogListPage(title="Benchmark", slug=f"bench-{uuid.uuid4().hex}")
+    root_page.add_child(instance=blog_list_page)
+    for i in range(num_posts):
+        blog_page = BlogPage(
+            title=" ".join(random.choices(WORDS, k=6)).capitalize(),
+            slug=f"post-{i}",
+            search_description=" ".join(random.choices(WORDS, k=20)),
+            body=[
+                ("heading", " ".join(random.choices(WORDS, k=5))),
+                (
+                    "paragraph",
+                    RichText(f"<p>{' '.join(random.choices(WORDS, k=300))}</p>"),
+                ),
+            ],
+            live=True,
+        )
+        blog_list_page.add_child(instance=blog_page)
+        update_search_entry(blog_page)
+
+    return blog_list_page
+
+
+def search_wagtail(blog_list_page, query):
+    blogs = blog_list_page.get_children().live().public().order_by("-first_published_at")
+    blogs = blogs.search(query)
+    list(Paginator(blogs, BlogListPage.blogs_per_page).page(1))
+
+
+def search_index(blog_list_page, query):
+    blogs = blog_list_page.get_children().live().public().order_by("-first_published_at")
+    blogs = PageSearchEntry.search_pages(blogs, query)
+    page = Paginator(blogs, BlogListPage.blogs_per_page).page(1)
+    PageSearchEntry.add_search_snippets(page.object_list, query)
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    idx = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[idx]
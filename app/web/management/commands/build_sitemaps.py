@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from web.services.sitemaps import build_sitemaps
+
+
+class Command(BaseCommand):
+    help = "Write every sitemap shard and the sitemap index to storage"
+
+    def handle(self, *args, **kwargs):
+        build_sitemaps()
+        self.stdout.write("Built sitemaps")
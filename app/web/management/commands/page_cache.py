@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from web.services.page_cache import get_stats, purge_all_pages, reset_stats
+
+
+class Command(BaseCommand):
+    help = "Show the public page cache's hit ratio, or purge every cached page"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--purge", action="store_true", help="Purge every cached page, eg. on deploy"
+        )
+        parser.add_argument(
+            "--reset-stats", action="store_true", help="Start counting hits again"
+        )
+
+    def handle(self, *args, **kwargs):
+        if kwargs["purge"]:
+            purge_all_pages()
+            self.stdout.write("Purged all cached pages")
+            return
+
+        stats = get_stats()
+        hit_ratio = stats["hit_ratio"]
+        hit_ratio = f"{hit_ratio:.1%}" if hit_ratio is not None else "-"
+        self.stdout.write(
+            f"{stats['hits']} hits, {stats['misses']} misses, hit ratio {hit_ratio}"
+        )
+        if kwargs["reset_stats"]:
+            reset_stats()
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from web.services.prerender import prerender_site
+
+
+class Command(BaseCommand):
+    help = "Pre-render the marketing pages and every live Wagtail page to HTML files"
+
+    def handle(self, *args, **kwargs):
+        num_pages = prerender_site()
+        self.stdout.write(f"Pre-rendered {num_pages} pages")
@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Code run by each process on start, up to when it's ready to serve.
+ENTRY_POINTS = {
+    # gunicorn loads the WSGI application, which sets up Django.
+    "web": "import clerk.wsgi",
+    # ./manage.py qcluster sets up Django, then loads the cluster.
+    "worker": "import django; django.setup(); import django_q.cluster",
+}
+
+
+class Command(BaseCommand):
+    help = "Show which modules are slowest to import when the web or worker starts"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "entry_points",
+            nargs="*",
+            help=f"Processes to profile: {', '.join(ENTRY_POINTS)}, or all by default",
+        )
+        parser.add_argument("--top", type=int, default=15, help="Modules shown")
+
+    def handle(self, *args, **kwargs):
+        unknown = set(kwargs["entry_points"]) - set(ENTRY_POINTS)
+        if unknown:
+            raise CommandError(f"Unknown entry points: {', '.join(sorted(unknown))}")
+
+        project_packages = get_project_packages()
+        for name in kwargs["entry_points"] or ENTRY_POINTS:
+            imports = profile_imports(ENTRY_POINTS[name])
+            total_us = sum(self_us for _, self_us, _ in imports)
+            project_us = sum(
+                self_us
+                for module, self_us, _ in imports
+                if module.split(".")[0] in project_packages
+            )
+            self.stdout.write(
+                f"\n{name}: {len(imports)} modules imported in {total_us / 1000:.0f} ms, "
+                f"{project_us / 1000:.0f} ms in the project's own modules"
+            )
+            self.stdout.write("self (ms)   cumulative (ms)   module")
+            slowest = sorted(imports, key=lambda i: i[1], reverse=True)
+            for module, self_us, cumulative_us in slowest[: kwargs["top"]]:
+                self.stdout.write(
+                    f"{self_us / 1000:9.1f}   {cumulative_us / 1000:15.1f}   {module}"
+                )
+
+
+def profile_imports(code: str) -> list:
+    """
+    Returns the (module, self time, cumulative time) in microseconds of each module
+    imported by the code, run in a new Python process.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(settings.BASE_DIR),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        # eg. "import time:       421 |       1523 |   web.models"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        imports.append((module.strip(), int(self_us), int(cumulative_us)))
+
+    return imports
+
+
+def get_project_packages() -> set:
+    # The settings are in the clerk app, next to the other apps.
+    project_dir = os.path.dirname(settings.BASE_DIR)
+    return {e.name for e in os.scandir(project_dir) if e.is_dir()}
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from web.services.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Index the text of every live blog, news and resource page for search"
+
+    def handle(self, *args, **kwargs):
+        num_pages = rebuild_search_index()
+        self.stdout.write(f"Indexed {num_pages} pages")
@@ -1,22 +1,81 @@
+from django.http import FileResponse, HttpResponse
+from django.middleware.csrf import get_token
 from django.shortcuts import redirect
 from django.utils.deprecation import MiddlewareMixin
 
-from .models import WebRedirect
+from .services import page_cache, prerender
+from .services.redirects import redirect_table
 
 
 class RedirectMiddleware(MiddlewareMixin):
     """
-    Handles non-Wagtail redirects.
+    Handles non-Wagtail redirects, without querying the database.
     """
 
     def process_response(self, request, response):
         if response.status_code == 404:
-            web_redirect = WebRedirect.objects.filter(
-                source_path=request.path_info.strip("/")
-            ).first()
-            if web_redirect:
-                return redirect(
-                    web_redirect.destination_path, permanent=web_redirect.is_permanent
-                )
+            match = redirect_table.resolve(request.path_info)
+            if match:
+                destination_path, is_permanent = match
+                return redirect(destination_path, permanent=is_permanent)
+
+        return response
+
+
+class PrerenderMiddleware(MiddlewareMixin):
+    """
+    Serves pre-rendered public pages to anonymous visitors from disk.
+    See web.services.prerender.
+    """
+
+    def process_request(self, request):
+        file_path = prerender.get_prerendered_file(request)
+        if file_path is None:
+            return None
+
+        response = FileResponse(open(file_path, "rb"), content_type="text/html")
+        response["X-Page-Cache"] = "PRERENDERED"
+        # Pages read the visitor's CSRF token from their cookie, so make sure it's set.
+        get_token(request)
+        return response
+
+    def process_response(self, request, response):
+        if not response.has_header("X-Page-Cache"):
+            prerender.refresh_prerendered_file(request, response)
+
+        return response
+
+
+class PageCacheMiddleware(MiddlewareMixin):
+    """
+    Serves public pages to anonymous visitors from the page cache.
+    See web.services.page_cache.
+    """
+
+    def process_request(self, request):
+        if not page_cache.is_cacheable_request(request):
+            return None
+
+        request.page_cache_key = page_cache.get_page_key(request)
+        page = page_cache.get_cached_page(request.page_cache_key)
+        if page is None:
+            return None
+
+        content, content_type = page
+        response = HttpResponse(content, content_type=content_type)
+        response["X-Page-Cache"] = "HIT"
+        # Pages read the visitor's CSRF token from their cookie, so make sure it's set.
+        get_token(request)
+        return response
+
+    def process_response(self, request, response):
+        key = getattr(request, "page_cache_key", None)
+        if key is None or response.has_header("X-Page-Cache"):
+            return response
+
+        if page_cache.is_cacheable_response(request, response):
+            page_cache.set_cached_page(key, response)
+            response["X-Page-Cache"] = "MISS"
+            get_token(request)
 
         return response
@@ -0,0 +1,45 @@
+# Generated by Django 3.2.25 on 2026-10-19 11:07
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailcore", "0062_comment_models_and_pagesubscription"),
+        ("web", "0013_extenalnews"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PageSearchEntry",
+            fields=[
+                (
+                    "page",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_entry",
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("title", models.CharField(max_length=255)),
+                ("search_description", models.TextField(blank=True)),
+                ("body", models.TextField(blank=True)),
+                (
+                    "search_vector",
+                    django.contrib.postgres.search.SearchVectorField(null=True),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="pagesearchentry",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="web_pagesea_search__f09f15_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-19 11:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web', '0014_pagesearchentry'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='jobpage',
+            name='icon',
+            field=models.CharField(choices=[('web/img/icons/cash.svg', 'cash'), ('web/img/icons/change.svg', 'change'), ('web/img/icons/clients.svg', 'clients'), ('web/img/icons/crowd.svg', 'crowd'), ('web/img/icons/dial.svg', 'dial'), ('web/img/icons/document.svg', 'document'), ('web/img/icons/email.svg', 'email'), ('web/img/icons/fast.svg', 'fast'), ('web/img/icons/house.svg', 'house'), ('web/img/icons/impact.svg', 'impact'), ('web/img/icons/law.svg', 'law'), ('web/img/icons/lawyer.svg', 'lawyer'), ('web/img/icons/love-hand.svg', 'love-hand'), ('web/img/icons/network.svg', 'network'), ('web/img/icons/partners.svg', 'partners'), ('web/img/icons/personal-growth.svg', 'personal-growth'), ('web/img/icons/phone.svg', 'phone'), ('web/img/icons/questionnaire.svg', 'questionnaire'), ('web/img/icons/reports.svg', 'reports'), ('web/img/icons/star.svg', 'star'), ('web/img/icons/students.svg', 'students'), ('web/img/icons/team.svg', 'team'), ('web/img/icons/tree.svg', 'tree'), ('web/img/icons/universities.svg', 'universities'), ('web/img/icons/valet.svg', 'valet'), ('web/img/icons/wrench.svg', 'wrench')], max_length=64),
+        ),
+    ]
@@ -2,5 +2,6 @@ from .blog import BlogListPage, BlogPage
 from .jobs import JobListPage, JobPage, JobsRootMixin
 from .resources import ResourceListPage, ResourcePage
 from .root import RootPage
+from .search import PageSearchEntry
 from .web_redirect import WebRedirect
 from .news import NewsListPage, NewsPage, ExternalNews
\ No newline at end of file
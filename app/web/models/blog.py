@@ -13,6 +13,7 @@ from wagtail.images.edit_handlers import ImageChooserPanel
 from wagtail.images.blocks import ImageChooserBlock
 
 from .mixins import RICH_TEXT_FEATURES, MultiRootPageMixin
+from .search import PageSearchEntry
 
 
 class BlogRootMixin(MultiRootPageMixin):
@@ -31,7 +32,7 @@ class BlogListPage(BlogRootMixin, Page):
         search = request.GET.get("search")
         blogs = self.get_children().live().public().order_by("-first_published_at")
         if search:
-            blogs = blogs.search(search)
+            blogs = PageSearchEntry.search_pages(blogs, search)
 
         page = request.GET.get("page")
         paginator = Paginator(blogs, self.blogs_per_page)
@@ -42,6 +43,9 @@ class BlogListPage(BlogRootMixin, Page):
         except EmptyPage:
             blogs = paginator.page(paginator.num_pages)
 
+        if search:
+            PageSearchEntry.add_search_snippets(blogs.object_list, search)
+
         context["blogs"] = blogs
         context["search"] = search or ""
         return context
@@ -1,6 +1,3 @@
-import os
-from django.conf import settings
-
 from django.db import models
 from wagtail.core import blocks
 from wagtail.core.models import Page
@@ -12,20 +9,9 @@ from wagtail.admin.edit_handlers import (
 )
 from wagtail.images.blocks import ImageChooserBlock
 
-from .mixins import MultiRootPageMixin, RICH_TEXT_FEATURES
-
+from web.services.icons import IconChoices
 
-ICONS_DIR = os.path.join(
-    settings.BASE_DIR, "..", "web", "static", "web", "img", "icons"
-)
-ICONS = [os.path.join("web", "img", "icons", i) for i in os.listdir(ICONS_DIR)]
-ICON_CHOICES = (
-    (
-        i,
-        i.split("/")[-1].split(".")[0],
-    )
-    for i in ICONS
-)
+from .mixins import ListingPageMixin, MultiRootPageMixin, RICH_TEXT_FEATURES
 
 
 class JobsRootMixin(MultiRootPageMixin):
@@ -33,29 +19,43 @@ class JobsRootMixin(MultiRootPageMixin):
     public_path = "/about/join-our-team/"
 
 
-class JobListPage(JobsRootMixin, Page):
+class JobListPage(ListingPageMixin, JobsRootMixin, Page):
     template = "web/jobs/job-list.html"
     subpage_types = ["web.JobPage"]
     parent_page_types = ["web.RootPage"]
 
     def get_context(self, request):
         context = super().get_context(request)
+        context.update(self.get_listing(request))
+        return context
+
+    def build_listing(self, request) -> dict:
         jobs = (
-            self.get_children()
+            JobPage.objects.child_of(self)
             .live()
-            .specific()
             .public()
+            .defer_streamfields()
             .order_by("-first_published_at")
         )
-        context["jobs"] = jobs
-        return context
+        return {
+            "jobs": [
+                {
+                    "title": job.title,
+                    "url": job.get_url(request),
+                    "icon": job.icon,
+                    "search_description": job.search_description,
+                    "closing_date": job.closing_date,
+                }
+                for job in jobs
+            ]
+        }
 
 
 class JobPage(JobsRootMixin, Page):
     template = "web/jobs/job-details.html"
     parent_page_types = ["web.JobListPage"]
     subpage_types = []
-    icon = models.CharField(max_length=64, choices=ICON_CHOICES)
+    icon = models.CharField(max_length=64, choices=IconChoices())
     closing_date = models.DateField()
     body = StreamField(
         [
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.http import Http404, HttpResponse
 from wagtail.core import hooks
 from wagtail.core.models import Site
@@ -14,6 +15,8 @@ RICH_TEXT_FEATURES = [
     "ul",  # ordered / unordered lists
     "link",  # page, external and email links
 ]
+# Cached listings are cleared when they change, this only bounds a stale one.
+LISTING_TIMEOUT = 60 * 60 * 24
 
 
 class NotFoundMixin:
@@ -21,6 +24,38 @@ class NotFoundMixin:
         raise Http404("Page does not exist.")
 
 
+class ListingPageMixin:
+    """
+    A list page which renders the pages it lists from one cache read, rather than
+    querying them on every view. The listing is built as plain data when it isn't
+    cached, and is cleared when anything it lists changes, see web.signals.listings.
+
+    Pages using it define build_listing(request), which returns the listing as a
+    dict of plain data that can be cached.
+    """
+
+    def get_listing(self, request) -> dict:
+        key = get_listing_cache_key(self.pk)
+        listing = cache.get(key)
+        if listing is None:
+            listing = self.build_listing(request)
+            cache.set(key, listing, LISTING_TIMEOUT)
+
+        return listing
+
+    @classmethod
+    def clear_listings(cls):
+        clear_listings(cls.objects.values_list("pk", flat=True))
+
+
+def get_listing_cache_key(page_id) -> str:
+    return f"web:listing:{page_id}"
+
+
+def clear_listings(page_ids):
+    cache.delete_many([get_listing_cache_key(page_id) for page_id in page_ids])
+
+
 class MultiRootPageMixin:
     public_path = None
     wagtail_slug = None
@@ -11,7 +11,9 @@ from wagtail.images.edit_handlers import ImageChooserPanel
 
 from wagtail.images.blocks import ImageChooserBlock
 
-from .mixins import MultiRootPageMixin, RICH_TEXT_FEATURES
+from web.services.renditions import get_responsive_image
+
+from .mixins import ListingPageMixin, MultiRootPageMixin, RICH_TEXT_FEATURES
 
 
 class NewsRootMixin(MultiRootPageMixin):
@@ -19,24 +21,47 @@ class NewsRootMixin(MultiRootPageMixin):
     public_path = "/news/"
 
 
-class NewsListPage(NewsRootMixin, Page):
+class NewsListPage(ListingPageMixin, NewsRootMixin, Page):
     template = "web/news/news-list.html"
     subpage_types = ["web.NewsPage"]
     parent_page_types = ["web.RootPage"]
 
     def get_context(self, request):
         context = super().get_context(request)
-        external_articles = ExternalNews.objects.order_by("-published_date").all()
+        context.update(self.get_listing(request))
+        return context
+
+    def build_listing(self, request) -> dict:
         articles = (
-            self.get_children()
+            NewsPage.objects.child_of(self)
             .live()
-            .specific()
             .public()
+            .defer_streamfields()
             .order_by("-first_published_at")
         )
-        context["articles"] = articles
-        context["external_articles"] = external_articles
-        return context
+        external_articles = ExternalNews.objects.select_related(
+            "brand_image"
+        ).order_by("-published_date")
+        return {
+            "articles": [
+                {
+                    "title": article.title,
+                    "url": article.get_url(request),
+                    "last_published_at": article.last_published_at,
+                }
+                for article in articles
+            ],
+            "external_articles": [
+                {
+                    "title": article.title,
+                    "url": article.url,
+                    "published_date": article.published_date,
+                    "brand_image": article.brand_image
+                    and get_responsive_image(article.brand_image, "news-brand"),
+                }
+                for article in external_articles
+            ],
+        }
 
 
 class NewsPage(NewsRootMixin, Page):
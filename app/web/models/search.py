@@ -0,0 +1,127 @@
+import re
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
+from django.db import models
+from django.db.models import F
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+from wagtail.core.models import Page
+
+# Postgres text search configuration, which stems English words.
+SEARCH_CONFIG = "english"
+# Snippets are marked up with these, rather than HTML, so that the text can be escaped.
+SNIPPET_START = "\x02"
+SNIPPET_STOP = "\x03"
+SNIPPET_MAX_WORDS = 30
+SNIPPET_MIN_WORDS = 15
+# The word being typed at the end of a query, unless it's excluded with "-".
+LAST_WORD_RE = re.compile(r"(?:^|[^\w-])(\w+)$")
+
+
+class PageSearchEntry(models.Model):
+    """
+    The searchable text of a live blog, news or resource page, with a tsvector
+    which Postgres indexes for full-text search. Kept up to date when the page is
+    published or unpublished, see web.services.search.
+    """
+
+    class Meta:
+        indexes = [GinIndex(fields=["search_vector"])]
+
+    page = models.OneToOneField(
+        Page, on_delete=models.CASCADE, primary_key=True, related_name="search_entry"
+    )
+    title = models.CharField(max_length=255)
+    search_description = models.TextField(blank=True)
+    body = models.TextField(blank=True)
+    search_vector = SearchVectorField(null=True)
+
+    def __str__(self):
+        return self.title
+
+    @staticmethod
+    def get_search_vector():
+        """
+        Title matches rank above description matches, which rank above body matches.
+        """
+        return (
+            SearchVector("title", weight="A", config=SEARCH_CONFIG)
+            + SearchVector("search_description", weight="B", config=SEARCH_CONFIG)
+            + SearchVector("body", weight="C", config=SEARCH_CONFIG)
+        )
+
+    @staticmethod
+    def get_search_query(query: str):
+        """
+        Accepts what people type into search boxes, eg. quoted phrases, "or", "-word".
+        Results are shown as people type, so the last word also matches words which
+        start with it, eg. "evi" matches "eviction".
+        """
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+        match = LAST_WORD_RE.search(query)
+        if not match:
+            return search_query
+
+        # Only word characters are passed to to_tsquery, so the syntax is always valid.
+        prefix_query = SearchQuery(
+            f"{match.group(1)}:*", config=SEARCH_CONFIG, search_type="raw"
+        )
+        other_words = query[: match.start(1)]
+        if other_words.strip():
+            prefix_query = (
+                SearchQuery(other_words, config=SEARCH_CONFIG, search_type="websearch")
+                & prefix_query
+            )
+
+        return search_query | prefix_query
+
+    @classmethod
+    def search_pages(cls, pages, query: str):
+        """
+        Returns the pages which match the search query, best match first.
+        """
+        search_query = cls.get_search_query(query)
+        return (
+            pages.filter(search_entry__search_vector=search_query)
+            .annotate(
+                search_rank=SearchRank(F("search_entry__search_vector"), search_query)
+            )
+            .order_by("-search_rank", "-first_published_at")
+        )
+
+    @classmethod
+    def add_search_snippets(cls, pages, query: str):
+        """
+        Sets the search_snippet of each page to an extract of its text, with the
+        search terms highlighted. Only run for the pages shown, since it's slow.
+        """
+        snippets = dict(
+            cls.objects.filter(page_id__in=[p.pk for p in pages])
+            .annotate(
+                snippet=SearchHeadline(
+                    "body",
+                    cls.get_search_query(query),
+                    config=SEARCH_CONFIG,
+                    start_sel=SNIPPET_START,
+                    stop_sel=SNIPPET_STOP,
+                    max_words=SNIPPET_MAX_WORDS,
+                    min_words=SNIPPET_MIN_WORDS,
+                )
+            )
+            .values_list("page_id", "snippet")
+        )
+        for page in pages:
+            page.search_snippet = format_snippet(snippets.get(page.pk) or "")
+
+
+def format_snippet(snippet: str) -> str:
+    html = escape(snippet)
+    html = html.replace(SNIPPET_START, "<mark>").replace(SNIPPET_STOP, "</mark>")
+    return mark_safe(html)
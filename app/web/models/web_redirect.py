@@ -2,6 +2,11 @@ from django.db import models
 
 
 class WebRedirect(models.Model):
+    """
+    A redirect for a path outside of Wagtail.
+    A source path ending in "*" redirects every path below it, see web.services.redirects.
+    """
+
     class Meta:
         unique_together = ["source_path", "destination_path"]
 
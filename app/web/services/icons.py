@@ -0,0 +1,66 @@
+"""
+Icons which job pages can show, listed when they are first needed.
+
+Job pages listed the icons directory when web.models was imported, which every
+process does on start, including management commands and task workers which never
+show a job page. The icons are now listed the first time the icon choices are
+used, eg. by a form or a model check, and kept for the life of the process, since
+icons only change when the app is deployed.
+
+The icons are listed from the web app's static files, or, when those aren't there,
+from the manifest of collected static files, which collectstatic writes on deploy.
+"""
+
+import functools
+import os
+
+from django.apps import apps
+from django.contrib.staticfiles.storage import staticfiles_storage
+
+ICONS_PATH = "web/img/icons/"
+
+
+@functools.lru_cache(maxsize=None)
+def get_icons() -> list:
+    """
+    Returns the static path of each icon.
+    """
+    icons_dir = get_icons_dir()
+    if os.path.isdir(icons_dir):
+        names = [e.name for e in os.scandir(icons_dir) if e.is_file()]
+    else:
+        names = get_collected_icon_names()
+
+    return sorted(ICONS_PATH + name for name in names if not name.startswith("."))
+
+
+def get_icons_dir() -> str:
+    web_path = apps.get_app_config("web").path
+    return os.path.join(web_path, "static", *ICONS_PATH.split("/"))
+
+
+def get_collected_icon_names() -> list:
+    """
+    Returns the name of each icon in the collected static files' manifest.
+    """
+    # Only the manifest storage has hashed files, loaded from its manifest.
+    collected_paths = getattr(staticfiles_storage, "hashed_files", {})
+    return [
+        path[len(ICONS_PATH) :]
+        for path in collected_paths
+        if path.startswith(ICONS_PATH) and "/" not in path[len(ICONS_PATH) :]
+    ]
+
+
+def get_icon_choices() -> list:
+    return [(path, os.path.splitext(os.path.basename(path))[0]) for path in get_icons()]
+
+
+class IconChoices:
+    """
+    The choices of a field for an icon, which are listed when they're first used
+    rather than when the field is defined.
+    """
+
+    def __iter__(self):
+        return iter(get_icon_choices())
@@ -0,0 +1,195 @@
+"""
+Full page cache for anonymous visitors to the public website.
+
+Anonymous visitors all see the same page, so the first GET of a public page is
+stored, keyed on its path and the query args which change its content, and later
+visitors are served the stored page without routing or rendering it.
+
+Each path has a version stamp, which is part of the key of its cached pages.
+Publishing or unpublishing a Wagtail page replaces the stamps of the page and its
+parents, so stale pages are never read again and simply expire,
+see web.signals.page_cache. Replacing the site-wide stamp, eg. on deploy, purges
+every page.
+"""
+
+import hashlib
+import logging
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import reverse
+
+from web.models import BlogListPage
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "web:page"
+SITE_VERSION_KEY = f"{KEY_PREFIX}:version"
+STATS_KEY = f"{KEY_PREFIX}:stats"
+# seconds, how long pages are cached, which limits how stale the impact figures get.
+PAGE_TIMEOUT = 60 * 60
+# Query args which change a page's content, all others, eg. utm_source, are ignored.
+CACHE_QUERY_ARGS = ["page", "search"]
+# Paths which are never cached.
+UNCACHED_PATHS = [
+    "/admin/",
+    "/accounts/",
+    "/actionstep/",
+    "/api/",
+    "/caller/",
+    "/case/",
+    "/cms/",
+    "/oauth/",
+    # Sitemaps are served from storage, see web.services.sitemaps.
+    "/sitemap",
+]
+# Page lookups counted in each process before the counts are added to the shared stats.
+STATS_FLUSH_EVERY = 100
+HIT = "hits"
+MISS = "misses"
+
+
+def is_cacheable_request(request) -> bool:
+    """
+    Whether the request is an anonymous GET of a public page.
+    Visitors with a session or pending messages may see their own content.
+    """
+    return (
+        request.method == "GET"
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and "messages" not in request.COOKIES
+        and not any(request.path.startswith(p) for p in UNCACHED_PATHS)
+    )
+
+
+def is_cacheable_response(request, response) -> bool:
+    """
+    Whether the response is the same for every anonymous visitor.
+    Pages with a CSRF token in their content are tied to the visitor's CSRF cookie.
+    """
+    session = getattr(request, "session", None)
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and "private" not in response.get("Cache-Control", "")
+        and not request.META.get("CSRF_COOKIE_USED")
+        and not (session and session.modified)
+    )
+
+
+def get_cached_page(key: str):
+    """
+    Returns (content, content type) of the cached page, or None.
+    """
+    page = cache.get(key)
+    count_lookup(HIT if page else MISS)
+    return page
+
+
+def set_cached_page(key: str, response):
+    page = (response.content, response["Content-Type"])
+    cache.set(key, page, PAGE_TIMEOUT)
+
+
+def get_page_key(request) -> str:
+    """
+    Returns the cache key for the request's page, which changes when it is purged.
+    """
+    path = request.path
+    site_key, path_key = SITE_VERSION_KEY, get_path_version_key(path)
+    versions = cache.get_many([site_key, path_key])
+    # If a stamp has been evicted, start a new version rather than reusing an old one.
+    missing = {k: time.time_ns() for k in (site_key, path_key) if k not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+
+    query = urlencode(
+        sorted((k, v) for k, v in request.GET.items() if k in CACHE_QUERY_ARGS)
+    )
+    url_hash = hashlib.md5(f"{path}?{query}".encode()).hexdigest()
+    return f"{KEY_PREFIX}:{versions[site_key]}:{versions[path_key]}:{url_hash}"
+
+
+def purge_paths(paths):
+    """
+    Purge every cached page for the paths, whatever their query args.
+    """
+    version = time.time_ns()
+    cache.set_many({get_path_version_key(p): version for p in paths}, None)
+
+
+def purge_all_pages():
+    cache.set(SITE_VERSION_KEY, time.time_ns(), None)
+
+
+def get_path_version_key(path: str) -> str:
+    path_hash = hashlib.md5(path.encode()).hexdigest()
+    return f"{KEY_PREFIX}:version:{path_hash}"
+
+
+def get_page_purge_paths(page) -> list:
+    """
+    Returns the paths to purge when a Wagtail page is published or unpublished:
+    the page and the pages which list it.
+    """
+    paths = []
+    for ancestor in page.get_ancestors(inclusive=True).specific():
+        url_parts = ancestor.get_url_parts()
+        if url_parts and url_parts[2]:
+            paths.append(url_parts[2])
+        if isinstance(ancestor, BlogListPage):
+            # Blog search results are built from the blog list.
+            paths.append(reverse("blog-search"))
+
+    return paths
+
+
+_lookup_counts = {HIT: 0, MISS: 0}
+
+
+def count_lookup(result: str):
+    """
+    Count a cache hit or miss, adding the counts to the shared stats now and then,
+    so that counting doesn't cost a write on every request.
+    """
+    _lookup_counts[result] += 1
+    if sum(_lookup_counts.values()) >= STATS_FLUSH_EVERY:
+        flush_stats()
+
+
+def flush_stats():
+    counts = {k: v for k, v in _lookup_counts.items() if v}
+    for result in _lookup_counts:
+        _lookup_counts[result] = 0
+
+    for result, count in counts.items():
+        key = f"{STATS_KEY}:{result}"
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key, count)
+        except ValueError:
+            logger.warning("Page cache stats for %s were evicted", result)
+
+
+def get_stats() -> dict:
+    """
+    Returns the number of pages served from the cache, and rendered, since the
+    stats were reset, and the hit ratio.
+    """
+    counts = cache.get_many([f"{STATS_KEY}:{HIT}", f"{STATS_KEY}:{MISS}"])
+    hits = counts.get(f"{STATS_KEY}:{HIT}", 0)
+    misses = counts.get(f"{STATS_KEY}:{MISS}", 0)
+    total = hits + misses
+    return {
+        HIT: hits,
+        MISS: misses,
+        "hit_ratio": hits / total if total else None,
+    }
+
+
+def reset_stats():
+    cache.delete_many([f"{STATS_KEY}:{HIT}", f"{STATS_KEY}:{MISS}"])
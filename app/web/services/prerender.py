@@ -0,0 +1,213 @@
+"""
+Pre-rendered public pages.
+
+The marketing pages and every live Wagtail page are rendered to HTML files under
+settings.PRERENDER_ROOT, on deploy by the prerender_pages command and when a page
+is published, unpublished, moved or deleted, or when external news which it
+lists changes, see web.signals.prerender.
+Anonymous visitors are then served the file straight from disk, and the view only
+runs when there is no file, see web.middleware.PrerenderMiddleware.
+
+Files for pages with live figures expire, after which the view renders the page
+again and the file is replaced.
+"""
+
+import logging
+import os
+import shutil
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from django.urls import Resolver404, resolve, reverse
+from wagtail.core.models import Page
+
+from utils.files import write_file_atomically
+from web.models.mixins import MultiRootPageMixin
+
+from .page_cache import CACHE_QUERY_ARGS, is_cacheable_request, is_cacheable_response
+
+logger = logging.getLogger(__name__)
+
+# Names of the marketing pages which are pre-rendered.
+PRERENDER_VIEWS = [
+    "landing",
+    "about",
+    "reports",
+    "team",
+    "impact",
+    "services",
+    "repairs",
+    "evictions",
+    "refer",
+]
+# seconds, how long pre-rendered pages with live figures are served.
+PRERENDER_MAX_AGES = {"impact": 60 * 60}
+INDEX_FILE = "index.html"
+# Pages are rendered as if requested from here, Wagtail falls back to the default site.
+PRERENDER_HOST = "localhost"
+
+
+def prerender_site() -> int:
+    """
+    Pre-render every page from scratch. Returns the number of pages rendered.
+    """
+    shutil.rmtree(settings.PRERENDER_ROOT, ignore_errors=True)
+    paths = [reverse(name) for name in PRERENDER_VIEWS]
+    for page in Page.objects.live().public().specific():
+        path = get_page_path(page)
+        if path:
+            paths.append(path)
+
+    return sum(prerender_path(path) for path in paths)
+
+
+def prerender_page(page):
+    """
+    Pre-render a live page, eg. when something else that it shows has changed.
+    """
+    path = get_page_path(page)
+    if path:
+        prerender_path(path)
+
+
+def prerender_page_tree(page):
+    """
+    Pre-render a page which has been published or unpublished, and the pages which
+    list it, and remove any files for pages which are no longer under its parent.
+    """
+    for ancestor in page.get_ancestors(inclusive=True).specific():
+        path = get_page_path(ancestor)
+        if not path:
+            continue
+        elif ancestor.live:
+            prerender_path(path)
+        else:
+            remove_prerendered_path(path)
+
+    parent = page.get_parent()
+    if parent:
+        prune_prerendered_children(parent.specific)
+
+
+def prerender_path(path: str) -> bool:
+    """
+    Render the page at the path to its file. Returns whether it was rendered.
+    Pages which aren't the same for every anonymous visitor aren't written.
+    """
+    request = RequestFactory().get(path, HTTP_HOST=PRERENDER_HOST)
+    request.user = AnonymousUser()
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return False
+
+    try:
+        response = match.func(request, *match.args, **match.kwargs)
+        if hasattr(response, "render"):
+            response.render()
+    except Exception:
+        logger.exception("Could not pre-render %s", path)
+        return False
+
+    if not is_cacheable_response(request, response):
+        remove_prerendered_path(path)
+        return False
+
+    write_prerendered_file(path, response.content)
+    return True
+
+
+def get_prerendered_file(request):
+    """
+    Returns the path of the fresh pre-rendered file for the request, or None.
+    """
+    if not is_cacheable_request(request):
+        return None
+    elif any(arg in request.GET for arg in CACHE_QUERY_ARGS):
+        return None
+
+    file_path = get_file_path(request.path)
+    try:
+        modified_at = os.path.getmtime(file_path)
+    except OSError:
+        return None
+
+    max_age = get_max_age(request.path)
+    if max_age and time.time() - modified_at > max_age:
+        return None
+
+    return file_path
+
+
+def refresh_prerendered_file(request, response):
+    """
+    Replace an expired pre-rendered file with the page rendered by its view.
+    """
+    if not get_max_age(request.path) or not is_cacheable_request(request):
+        return
+    elif any(arg in request.GET for arg in CACHE_QUERY_ARGS):
+        return
+    elif not os.path.exists(get_file_path(request.path)):
+        return
+    elif is_cacheable_response(request, response):
+        write_prerendered_file(request.path, response.content)
+
+
+def get_max_age(path: str):
+    for name, max_age in PRERENDER_MAX_AGES.items():
+        if reverse(name) == path:
+            return max_age
+
+    return None
+
+
+def get_page_path(page):
+    """
+    Returns the public path of a Wagtail page, or None if it doesn't have one.
+    """
+    url_parts = page.get_url_parts()
+    path = url_parts[2] if url_parts else None
+    if not path or any(path.startswith(p) for p in ["/cms/", "/admin/"]):
+        return None
+
+    return path
+
+
+def get_file_path(path: str) -> str:
+    path = path.strip("/")
+    return os.path.join(settings.PRERENDER_ROOT, path, INDEX_FILE)
+
+
+def write_prerendered_file(path: str, content: bytes):
+    write_file_atomically(get_file_path(path), content)
+
+
+def remove_prerendered_path(path: str):
+    try:
+        os.remove(get_file_path(path))
+    except FileNotFoundError:
+        pass
+
+
+def prune_prerendered_children(parent):
+    """
+    Remove the files of pages under the parent which aren't live any more,
+    or which have moved or changed their slug.
+    """
+    parent_path = get_page_path(parent)
+    if not parent_path or not isinstance(parent, MultiRootPageMixin):
+        # Only list pages have their children's files under their own.
+        return
+
+    parent_dir = os.path.dirname(get_file_path(parent_path))
+    live_slugs = set(parent.get_children().live().values_list("slug", flat=True))
+    try:
+        entries = list(os.scandir(parent_dir))
+    except FileNotFoundError:
+        return
+
+    for entry in entries:
+        if entry.is_dir() and entry.name not in live_slugs:
+            shutil.rmtree(entry.path, ignore_errors=True)
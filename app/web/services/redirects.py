@@ -0,0 +1,119 @@
+"""
+Non-Wagtail redirects, resolved from an in-memory table.
+
+Each process loads every WebRedirect into a dict the first time a page isn't
+found, so most 404s, which are bots and scanners, are resolved without a query.
+The table is reloaded when the redirect version stamp in the shared cache changes,
+which happens whenever a redirect is saved or deleted, see web.signals.redirects.
+
+A source path ending in "*" is a prefix redirect, which matches the path itself
+and any path below it. A "*" in its destination is replaced with the rest of the
+matched path, eg. "old-blog/*" to "/blog/*/" redirects "old-blog/foo" to "/blog/foo/".
+"""
+
+import time
+
+from django.core.cache import cache
+
+from web.models import WebRedirect
+
+VERSION_KEY = "web:redirects:version"
+# seconds, how often each process checks whether redirects have changed.
+VERSION_CHECK_INTERVAL = 10
+# Paths remembered as having no redirect, before the memory is cleared.
+MAX_MISSES = 10000
+WILDCARD = "*"
+
+
+class RedirectTable:
+    def __init__(self):
+        self.version = None
+        self.checked_at = 0
+        self.exact = {}
+        self.prefixes = {}
+        self.misses = set()
+
+    def resolve(self, path: str):
+        """
+        Returns (destination path, is permanent) for the path, or None.
+        """
+        self.refresh()
+        path = path.strip("/")
+        if path in self.misses:
+            return None
+
+        match = self.match(path)
+        if match is None:
+            if len(self.misses) >= MAX_MISSES:
+                self.misses.clear()
+            self.misses.add(path)
+
+        return match
+
+    def match(self, path: str):
+        if path in self.exact:
+            return self.exact[path]
+
+        # Try the longest prefix first.
+        parts = path.split("/")
+        for idx in range(len(parts), 0, -1):
+            prefix = "/".join(parts[:idx])
+            if prefix in self.prefixes:
+                destination, is_permanent = self.prefixes[prefix]
+                rest = "/".join(parts[idx:])
+                destination = destination.replace(WILDCARD, rest).replace("//", "/")
+                return destination, is_permanent
+
+        if WILDCARD in self.prefixes:
+            destination, is_permanent = self.prefixes[WILDCARD]
+            return destination.replace(WILDCARD, path).replace("//", "/"), is_permanent
+
+        return None
+
+    def refresh(self):
+        """
+        Reload the redirects if they have changed since they were loaded.
+        The shared version stamp is read at most every VERSION_CHECK_INTERVAL seconds.
+        """
+        now = time.monotonic()
+        if self.version is not None and now - self.checked_at < VERSION_CHECK_INTERVAL:
+            return
+
+        self.checked_at = now
+        version = get_redirects_version()
+        if version != self.version:
+            self.load()
+            self.version = version
+
+    def load(self):
+        self.exact = {}
+        self.prefixes = {}
+        self.misses = set()
+        redirects = WebRedirect.objects.order_by("pk").values_list(
+            "source_path", "destination_path", "is_permanent"
+        )
+        for source_path, destination_path, is_permanent in redirects:
+            if source_path.endswith(WILDCARD):
+                prefix = source_path[: -len(WILDCARD)].strip("/") or WILDCARD
+                self.prefixes.setdefault(prefix, (destination_path, is_permanent))
+            else:
+                self.exact.setdefault(source_path, (destination_path, is_permanent))
+
+    def clear(self):
+        self.version = None
+
+
+redirect_table = RedirectTable()
+
+
+def get_redirects_version() -> int:
+    return cache.get_or_set(VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_redirects():
+    """
+    Make every process reload its redirects.
+    """
+    cache.set(VERSION_KEY, time.time_ns(), None)
+    # This process reloads straight away.
+    redirect_table.clear()
@@ -0,0 +1,104 @@
+"""
+Image renditions, generated ahead of time rather than on first view.
+
+Wagtail resizes an image the first time a page asks for each size of it, which
+makes the first visitors to a new post wait. Instead, every rendition the site
+uses is generated in a worker when an image is uploaded, and again when a page or
+news item that uses it is saved, see web.signals.renditions.
+
+Images shown at a fixed size use a rendition set, which has a 1x and a 2x size,
+each as a WebP and in the original format, see the responsive_image tag. Each
+process keeps the renditions it has looked up in the "renditions" cache.
+"""
+
+import logging
+
+from wagtail.core.models import Page
+from wagtail.images import get_image_model
+from wagtail.images.models import SourceImageIOError
+
+logger = logging.getLogger(__name__)
+
+# Filter specs of the 1x and 2x renditions of each set, see the responsive_image tag.
+RENDITION_SETS = {
+    "blog-card": ["width-400", "width-800"],
+    "news-brand": ["height-72", "height-144"],
+}
+WEBP_FILTER = "format-webp"
+# Renditions used by templates outside of rendition sets.
+SOCIAL_IMAGE_FILTER = "fill-1200x630"
+BODY_IMAGE_FILTER = "original"
+
+
+def get_filter_specs(set_name: str, webp=False) -> list:
+    specs = RENDITION_SETS[set_name]
+    if webp:
+        specs = [f"{spec}|{WEBP_FILTER}" for spec in specs]
+
+    return specs
+
+
+def get_responsive_image(image, set_name: str) -> dict:
+    """
+    Returns the URLs and size of the image's 1x and 2x renditions from the set,
+    as plain data which can be cached, see the responsive_image tag.
+    """
+    renditions = [image.get_rendition(spec) for spec in get_filter_specs(set_name)]
+    webp_renditions = [
+        image.get_rendition(spec) for spec in get_filter_specs(set_name, webp=True)
+    ]
+    return {
+        "urls": [r.url for r in renditions],
+        "webp_urls": [r.url for r in webp_renditions],
+        "width": renditions[0].width,
+        "height": renditions[0].height,
+        "alt": image.default_alt_text,
+    }
+
+
+def get_image_filter_specs(set_names, extra_specs=()) -> list:
+    """
+    Returns every filter spec for the rendition sets, and any extra specs.
+    """
+    specs = list(extra_specs)
+    for set_name in set_names:
+        specs += get_filter_specs(set_name) + get_filter_specs(set_name, webp=True)
+
+    return specs
+
+
+def warm_image_renditions(image_id, set_names=None, extra_specs=()):
+    """
+    Generate the image's renditions for the sets, or for every set.
+    Task run when an image is uploaded or used.
+    """
+    image = get_image_model().objects.filter(pk=image_id).first()
+    if not image:
+        return
+
+    set_names = RENDITION_SETS.keys() if set_names is None else set_names
+    for spec in get_image_filter_specs(set_names, extra_specs):
+        try:
+            image.get_rendition(spec)
+        except SourceImageIOError:
+            logger.warning("Could not read image %s to render %s", image_id, spec)
+            return
+
+
+def warm_page_renditions(page_id):
+    """
+    Generate the renditions of every image on the page.
+    Task run when a page is published.
+    """
+    page = Page.objects.filter(pk=page_id).first()
+    if not page:
+        return
+
+    page = page.specific
+    main_image_id = getattr(page, "main_image_id", None)
+    if main_image_id:
+        warm_image_renditions(main_image_id, ["blog-card"], [SOCIAL_IMAGE_FILTER])
+
+    for block in getattr(page, "body", None) or []:
+        if block.block_type == "image" and block.value:
+            warm_image_renditions(block.value.pk, [], [BODY_IMAGE_FILTER])
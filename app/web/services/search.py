@@ -0,0 +1,90 @@
+"""
+Full-text search of the blog, news and resource pages.
+
+The title, search description and body text of each live page are copied into a
+PageSearchEntry, with a weighted tsvector which Postgres indexes, when the page is
+published, see web.signals.search. Searches then use the index rather than scanning
+every page, and results are ranked by how well they match, see
+PageSearchEntry.search_pages.
+"""
+
+import time
+
+from django.db import transaction
+from wagtail.core.models import Page
+
+from web.models import BlogListPage, BlogPage, NewsPage, PageSearchEntry, ResourcePage
+
+SEARCHABLE_PAGE_TYPES = (BlogPage, NewsPage, ResourcePage)
+# seconds, how long each process keeps the blog list page used for searches.
+BLOG_LIST_PAGE_TIMEOUT = 60
+
+_blog_list_page = {"page": None, "fetched_at": 0}
+
+
+def update_search_entry(page):
+    """
+    Index the page's text if it's live, or remove it from the index if not.
+    """
+    page = page.specific
+    if not isinstance(page, SEARCHABLE_PAGE_TYPES):
+        return
+    elif not page.live:
+        remove_search_entry(page)
+        return
+
+    PageSearchEntry.objects.update_or_create(
+        page_id=page.pk, defaults=get_search_entry_fields(page)
+    )
+    PageSearchEntry.objects.filter(page_id=page.pk).update(
+        search_vector=PageSearchEntry.get_search_vector()
+    )
+
+
+def remove_search_entry(page):
+    PageSearchEntry.objects.filter(page_id=page.pk).delete()
+
+
+@transaction.atomic
+def rebuild_search_index() -> int:
+    """
+    Index every live searchable page from scratch. Returns the number of pages indexed.
+    """
+    pages = Page.objects.live().type(*SEARCHABLE_PAGE_TYPES).specific()
+    entries = [
+        PageSearchEntry(page_id=page.pk, **get_search_entry_fields(page))
+        for page in pages
+    ]
+    PageSearchEntry.objects.all().delete()
+    PageSearchEntry.objects.bulk_create(entries, batch_size=500)
+    PageSearchEntry.objects.update(search_vector=PageSearchEntry.get_search_vector())
+    return len(entries)
+
+
+def get_search_entry_fields(page) -> dict:
+    body = page.body
+    return {
+        "title": page.title,
+        "search_description": page.search_description,
+        "body": " ".join(body.stream_block.get_searchable_content(body)),
+    }
+
+
+def get_blog_list_page():
+    """
+    Returns the blog list page, which blog searches list the children of,
+    fetched at most every BLOG_LIST_PAGE_TIMEOUT seconds.
+    """
+    now = time.monotonic()
+    if (
+        _blog_list_page["page"] is None
+        or now - _blog_list_page["fetched_at"] > BLOG_LIST_PAGE_TIMEOUT
+    ):
+        _blog_list_page["page"] = BlogListPage.objects.get(slug="blog")
+        _blog_list_page["fetched_at"] = now
+
+    return _blog_list_page["page"]
+
+
+def clear_blog_list_page():
+    _blog_list_page["page"] = None
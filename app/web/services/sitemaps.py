@@ -0,0 +1,137 @@
+"""
+Sitemaps, generated to storage rather than on each request.
+
+Each section of web.sitemaps.SITEMAPS is written as one or more shards of up to
+SHARD_SIZE pages, listed in a sitemap index. When a page is published, unpublished,
+moved or deleted, only its section's shards and the index are written again in a
+task, see web.signals.sitemaps. Crawlers are then served the stored files, with
+Last-Modified and ETag headers, see web.views.sitemap_view.
+
+Sitemaps need full URLs, but the website is served on several hosts, so the
+files are written with a placeholder origin, which is replaced with the
+request's origin when they are served.
+"""
+
+import json
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.template.loader import render_to_string
+from wagtail.core.models import Page
+
+from utils.files import write_file_atomically
+from utils.tasks import task_options
+from web.sitemaps import SITEMAPS
+
+INDEX_NAME = "sitemap.xml"
+MANIFEST_NAME = "sitemap.json"
+PLACEHOLDER_SCHEME = "http"
+PLACEHOLDER_DOMAIN = "sitemap.invalid"
+PLACEHOLDER_ORIGIN = f"{PLACEHOLDER_SCHEME}://{PLACEHOLDER_DOMAIN}"
+
+
+def get_sitemap_storage():
+    return FileSystemStorage(location=settings.SITEMAP_ROOT)
+
+
+@task_options(lane="bulk", timeout=5 * 60)
+def build_sitemaps(sections=None):
+    """
+    Write the shards of the sections, or of every section, and the sitemap index.
+    Task run when a page is deleted.
+    """
+    storage = get_sitemap_storage()
+    manifest = read_manifest()
+    for section in sections or SITEMAPS.keys():
+        old_shards = manifest.get(section, [])
+        manifest[section] = write_section(section)
+        # Remove shards which are no longer needed.
+        new_names = {shard["name"] for shard in manifest[section]}
+        for shard in old_shards:
+            if shard["name"] not in new_names:
+                storage.delete(shard["name"])
+
+    # Drop sections which no longer exist.
+    manifest = {section: manifest[section] for section in SITEMAPS if section in manifest}
+    write_index(manifest)
+    save_file(MANIFEST_NAME, json.dumps(manifest).encode())
+
+
+@task_options(lane="bulk", timeout=5 * 60)
+def build_sitemaps_for_page(page_id):
+    """
+    Write the shards of the sections which list the page, and the sitemap index.
+    Task run when a page is published, unpublished or moved.
+    """
+    page = Page.objects.filter(pk=page_id).first()
+    if not page:
+        build_sitemaps()
+        return
+
+    sections = [
+        section
+        for section, sitemap_cls in SITEMAPS.items()
+        if sitemap_cls.is_page_listed(page)
+    ]
+    if sections:
+        build_sitemaps(sections)
+
+
+def write_section(section: str) -> list:
+    """
+    Write the section's shards. Returns the name and last modified date of each shard.
+    """
+    sitemap = SITEMAPS[section]()
+    site = SimpleNamespace(domain=PLACEHOLDER_DOMAIN, name=PLACEHOLDER_DOMAIN)
+    shards = []
+    for page_num in sitemap.paginator.page_range:
+        sitemap.latest_lastmod = None
+        urls = sitemap.get_urls(page=page_num, site=site, protocol=PLACEHOLDER_SCHEME)
+        name = f"sitemap-{section}-{page_num}.xml"
+        save_file(name, render_to_string("sitemap.xml", {"urlset": urls}).encode())
+        lastmod = sitemap.latest_lastmod
+        shards.append({"name": name, "lastmod": lastmod.isoformat() if lastmod else None})
+
+    return shards
+
+
+def write_index(manifest: dict):
+    shards = [shard for section in manifest.values() for shard in section]
+    content = render_to_string(
+        "web/sitemap_index.xml", {"shards": shards, "origin": PLACEHOLDER_ORIGIN}
+    )
+    save_file(INDEX_NAME, content.encode())
+
+
+def read_manifest() -> dict:
+    try:
+        with get_sitemap_storage().open(MANIFEST_NAME) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_file(name: str, content: bytes):
+    # Replace the file in place, so crawlers never find it missing.
+    write_file_atomically(get_sitemap_storage().path(name), content)
+
+
+def get_sitemap_file(name: str):
+    """
+    Returns the path of the stored sitemap file, building the sitemaps if they
+    haven't been built yet, or None if there is no such file.
+    """
+    storage = get_sitemap_storage()
+    if not storage.exists(INDEX_NAME):
+        build_sitemaps()
+
+    if not storage.exists(name):
+        return None
+
+    return storage.path(name)
+
+
+def read_sitemap_file(file_path: str, origin: str) -> bytes:
+    with open(file_path, "rb") as f:
+        return f.read().replace(PLACEHOLDER_ORIGIN.encode(), origin.encode())
@@ -0,0 +1,175 @@
+"""
+Page URLs by slug, for the clerk_slugurl template tag.
+
+Nav and footer templates link to many pages by slug, so rather than querying for
+each link, the URL of every page is built into a map, which is kept in the shared
+cache and copied into each process. Resolving a link then costs no queries.
+
+The map is rebuilt in a task when a page is published, moved or deleted, or a site
+changes, see web.signals.slugurl. If a link on every page changes, eg. when a linked
+page's slug changes, every cached and pre-rendered page is rebuilt too.
+"""
+
+import logging
+import time
+
+from django.core.cache import cache
+from django.http.request import split_domain_port
+from wagtail.core.models import Page, Site
+
+from utils.tasks import task_options
+
+from .page_cache import purge_all_pages
+from .prerender import prerender_site
+
+logger = logging.getLogger(__name__)
+
+MAP_KEY = "web:slugurls"
+VERSION_KEY = "web:slugurls:version"
+# seconds, how often each process checks whether the map has changed.
+VERSION_CHECK_INTERVAL = 10
+
+# Site matches, best first, as in wagtail.core.sites.get_site_for_hostname
+MATCH_HOSTNAME_PORT = 0
+MATCH_HOSTNAME_DEFAULT = 1
+MATCH_DEFAULT = 2
+MATCH_HOSTNAME = 3
+
+
+class SlugUrlMap:
+    def __init__(self):
+        self.version = None
+        self.checked_at = 0
+        self.sites = []
+        self.slugs = {}
+
+    def get_url(self, request, slug: str):
+        """
+        Returns the URL of the page with the slug, preferring pages on the request's
+        site, as a path if it's on the request's site, or as a full URL if not.
+        """
+        self.refresh()
+        urls = self.slugs.get(slug)
+        if not urls:
+            return None
+
+        if request is None:
+            site_id = None
+        else:
+            site_id = getattr(request, "_clerk_site_id", None)
+            if site_id is None:
+                site_id = request._clerk_site_id = self.find_site_id(request)
+
+        url_site_id, root_url, page_path = next(
+            (url for url in urls if site_id and url[0] == site_id), urls[0]
+        )
+        if page_path is None:
+            return None
+        elif url_site_id == site_id or (request is None and len(self.sites) == 1):
+            return page_path
+        else:
+            return (root_url or "") + page_path
+
+    def find_site_id(self, request):
+        """
+        Returns the id of the request's site, matched like Site.find_for_request.
+        """
+        hostname = split_domain_port(request.get_host())[0]
+        port = request.get_port()
+        matches = []
+        for site_id, site_hostname, site_port, is_default in self.sites:
+            if site_hostname == hostname and str(site_port) == str(port):
+                matches.append((MATCH_HOSTNAME_PORT, site_id))
+            elif site_hostname == hostname and is_default:
+                matches.append((MATCH_HOSTNAME_DEFAULT, site_id))
+            elif is_default:
+                matches.append((MATCH_DEFAULT, site_id))
+            elif site_hostname == hostname:
+                matches.append((MATCH_HOSTNAME, site_id))
+
+        if not matches:
+            return None
+
+        matches.sort()
+        match, site_id = matches[0]
+        if len(matches) == 1 or match in (MATCH_HOSTNAME_PORT, MATCH_HOSTNAME_DEFAULT):
+            return site_id
+        elif match == MATCH_DEFAULT and len(matches) == 2:
+            # One other site has this hostname, so use it rather than the default.
+            return matches[1][1]
+        else:
+            return site_id
+
+    def refresh(self):
+        """
+        Copy the map from the shared cache if it has changed since it was copied.
+        The shared version stamp is read at most every VERSION_CHECK_INTERVAL seconds.
+        """
+        now = time.monotonic()
+        if self.version is not None and now - self.checked_at < VERSION_CHECK_INTERVAL:
+            return
+
+        self.checked_at = now
+        version = cache.get(VERSION_KEY)
+        if version is not None and version == self.version:
+            return
+
+        slug_urls = cache.get(MAP_KEY)
+        if slug_urls is None or version is None:
+            slug_urls = build_slug_urls()
+            version = time.time_ns()
+            cache.set_many({MAP_KEY: slug_urls, VERSION_KEY: version}, None)
+
+        self.sites = slug_urls["sites"]
+        self.slugs = slug_urls["slugs"]
+        self.version = version
+
+    def clear(self):
+        self.version = None
+
+
+slug_url_map = SlugUrlMap()
+
+
+def build_slug_urls() -> dict:
+    """
+    Returns the sites, and the (site id, root URL, path) of every page by slug,
+    in tree order.
+    """
+    sites = list(Site.objects.values_list("id", "hostname", "port", "is_default_site"))
+    slugs = {}
+    for page in Page.objects.order_by("path").specific():
+        slugs.setdefault(page.slug, []).append(tuple(page.get_url_parts() or [None] * 3))
+
+    return {"sites": sites, "slugs": slugs}
+
+
+@task_options(lane="bulk", timeout=15 * 60)
+def update_slug_urls():
+    """
+    Rebuild the map of page URLs for every process. If an existing link has changed,
+    then rebuild every cached and pre-rendered page, since they all have nav links.
+    Task run when pages or sites change.
+    """
+    old_slug_urls = cache.get(MAP_KEY)
+    slug_urls = build_slug_urls()
+    cache.set_many({MAP_KEY: slug_urls, VERSION_KEY: time.time_ns()}, None)
+    slug_url_map.clear()
+    if old_slug_urls and has_changed_links(old_slug_urls, slug_urls):
+        logger.info("Page links have changed, rebuilding every page")
+        purge_all_pages()
+        prerender_site()
+
+
+def has_changed_links(old_slug_urls: dict, slug_urls: dict) -> bool:
+    """
+    Whether any slug now links somewhere else, or nowhere.
+    New pages with new slugs don't change any existing links.
+    """
+    if old_slug_urls["sites"] != slug_urls["sites"]:
+        return True
+
+    return any(
+        slug_urls["slugs"].get(slug) != urls
+        for slug, urls in old_slug_urls["slugs"].items()
+    )
@@ -0,0 +1,298 @@
+"""
+Static file bundles, built when static files are collected.
+
+Pages loaded each of their stylesheets and scripts separately, and the case pages
+loaded the whole 1.3 MB Semantic UI stylesheet, although they only use a few of its
+components. When static files are collected, the files of each bundle are joined
+into one file, see web.storage.StaticStorage:
+
+- stylesheets are minified, and their relative URLs are rewritten for the bundle
+- rules for classes which no template, Python module or script of the project
+  mentions are dropped from the PURGED_STYLESHEETS, along with unused fonts
+
+The bundles are then hashed and compressed, as gzip and brotli, with the rest of
+the static files. Pages load them with the static_bundle tag, which loads the
+separate files instead when static files haven't been collected, eg. in development.
+"""
+
+import os
+import posixpath
+import re
+
+from django.apps import apps
+from django.conf import settings
+
+# Bundle name: files, in the order they are loaded.
+STATIC_BUNDLES = {
+    "case/bundle.css": ["semantic/semantic.min.css", "styles/global.css"],
+    "case/bundle.js": [
+        "semantic/jquery.min.js",
+        "semantic/semantic.min.js",
+        "htmx.min.js",
+    ],
+    "web/bundle.css": ["web/styles/global.css", "web/styles/components.css"],
+}
+# Stylesheets with rules for many more classes than are used: scripts which add
+# classes of their own, see purge_css.
+PURGED_STYLESHEETS = {"semantic/semantic.min.css": ["semantic/semantic.min.js"]}
+# Project files which are searched for the class names that are used.
+CLASS_SOURCE_EXTENSIONS = [".html", ".py", ".js"]
+CLASS_SOURCE_EXCLUDE_DIRS = ["static", "migrations", "tests", "__pycache__"]
+
+CSS_TOKEN_RE = re.compile(
+    r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)|(\s+)", re.DOTALL
+)
+CSS_URL_RE = re.compile(r"url\(\s*(['\"]?)(.*?)\1\s*\)")
+CSS_IMPORT_RE = re.compile(r"@(?:import|charset)\b[^;]*;")
+CSS_CLASS_RE = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+CSS_FONT_FAMILY_RE = re.compile(r"font-family\s*:\s*([^;}]+)")
+CSS_FONT_FACE_RE = re.compile(r"@font-face\s*\{[^}]*\}", re.IGNORECASE)
+WORD_RE = re.compile(r"[_a-zA-Z][\w-]*")
+# Whitespace next to these can be dropped from stylesheets.
+CSS_PUNCTUATION = "{};,>"
+
+
+def build_bundle(storage, name: str) -> bytes:
+    """
+    Returns the content of the bundle, built from the collected files in storage.
+    """
+    files = STATIC_BUNDLES[name]
+    if name.endswith(".css"):
+        return build_stylesheet(storage, name, files).encode()
+
+    return "\n;\n".join(read_file(storage, path) for path in files).encode()
+
+
+def build_stylesheet(storage, name: str, files) -> str:
+    imports = []
+    parts = []
+    for path in files:
+        css = read_file(storage, path)
+        if path in PURGED_STYLESHEETS:
+            css = purge_css(css, get_used_words(storage, PURGED_STYLESHEETS[path]))
+
+        css = rebase_urls(css, path, name)
+        # Imports are only allowed at the start of a stylesheet.
+        imports += [i for i in CSS_IMPORT_RE.findall(css) if i.startswith("@import")]
+        parts.append(minify_css(CSS_IMPORT_RE.sub("", css)))
+
+    return "\n".join(imports + parts)
+
+
+def read_file(storage, path: str) -> str:
+    with storage.open(path) as f:
+        return f.read().decode("utf-8")
+
+
+def minify_css(css: str) -> str:
+    """
+    Drop comments, except /*! licences, and whitespace which doesn't change a rule.
+    """
+
+    def replace(match):
+        string, comment, space = match.groups()
+        if string:
+            return string
+        elif comment:
+            return comment if comment.startswith("/*!") else ""
+
+        before = css[match.start() - 1] if match.start() else ""
+        after = css[match.end()] if match.end() < len(css) else ""
+        if (
+            not before
+            or not after
+            or before in CSS_PUNCTUATION
+            or after in CSS_PUNCTUATION
+        ):
+            return ""
+
+        return " "
+
+    return CSS_TOKEN_RE.sub(replace, css).strip()
+
+
+def rebase_urls(css: str, path: str, bundle_name: str) -> str:
+    """
+    Rewrite URLs relative to the stylesheet to be relative to the bundle.
+    """
+    source_dir = posixpath.dirname(path)
+    bundle_dir = posixpath.dirname(bundle_name)
+
+    def replace(match):
+        quote, url = match.groups()
+        if url.startswith(("data:", "http:", "https:", "//", "/", "#")):
+            return match.group(0)
+
+        url_path, suffix = re.match(r"([^?#]*)(.*)", url).groups()
+        url_path = posixpath.normpath(posixpath.join(source_dir, url_path))
+        url_path = posixpath.relpath(url_path, bundle_dir or ".")
+        return f"url({quote}{url_path}{suffix}{quote})"
+
+    return CSS_URL_RE.sub(replace, css)
+
+
+def purge_css(css: str, used_words: set) -> str:
+    """
+    Drop the selectors with a class which isn't one of the used words, the rules
+    left without selectors, and the fonts which no rule uses any more.
+    """
+    css = purge_rules(css, used_words)
+    rules_css = CSS_FONT_FACE_RE.sub("", css)
+    used_fonts = {
+        family.strip().strip("'\"").lower()
+        for families in CSS_FONT_FAMILY_RE.findall(rules_css)
+        for family in families.split(",")
+    }
+    kept = []
+    for prelude, body in parse_css(css):
+        if prelude.lower() == "@font-face":
+            match = CSS_FONT_FAMILY_RE.search(body)
+            family = match.group(1).strip().strip("'\"").lower() if match else None
+            if family and family not in used_fonts:
+                continue
+
+        kept.append(format_css_rule(prelude, body))
+
+    return "".join(kept)
+
+
+def purge_rules(css: str, used_words: set) -> str:
+    kept = []
+    for prelude, body in parse_css(css):
+        if body is None or (prelude.startswith("@") and "{" not in body):
+            # Statements, and at-rules which hold declarations, eg. @font-face.
+            kept.append(format_css_rule(prelude, body))
+        elif prelude.startswith("@"):
+            # At-rules which hold rules, eg. @media, or keyframes, which are kept.
+            if prelude.lower().startswith(("@media", "@supports")):
+                body = purge_rules(body, used_words)
+
+            if body:
+                kept.append(format_css_rule(prelude, body))
+        else:
+            selectors = [
+                s for s in split_selectors(prelude) if is_selector_used(s, used_words)
+            ]
+            if selectors:
+                kept.append(format_css_rule(",".join(selectors), body))
+
+    return "".join(kept)
+
+
+def format_css_rule(prelude: str, body) -> str:
+    return f"{prelude};" if body is None else f"{prelude}{{{body}}}"
+
+
+def parse_css(css: str) -> list:
+    """
+    Returns the top level (prelude, body) of each rule in the stylesheet,
+    with a body of None for statements, eg. @import.
+    """
+    rules = []
+    start = 0
+    depth = 0
+    body_start = None
+    i = 0
+    while i < len(css):
+        char = css[i]
+        if char in "\"'":
+            i = skip_css_string(css, i)
+            continue
+        elif css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            i = len(css) if end == -1 else end + 2
+            continue
+        elif char == "{":
+            if depth == 0:
+                body_start = i + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                prelude = css[start : body_start - 1].strip()
+                rules.append((prelude, css[body_start:i]))
+                start = i + 1
+        elif char == ";" and depth == 0:
+            rules.append((css[start:i].strip(), None))
+            start = i + 1
+
+        i += 1
+
+    return [(prelude, body) for prelude, body in rules if prelude or body]
+
+
+def skip_css_string(css: str, i: int) -> int:
+    quote = css[i]
+    i += 1
+    while i < len(css) and css[i] != quote:
+        i += 2 if css[i] == "\\" else 1
+
+    return i + 1
+
+
+def split_selectors(prelude: str) -> list:
+    """
+    Split a selector list on commas which aren't in brackets, eg. :is(.a, .b).
+    """
+    selectors = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def is_selector_used(selector: str, used_words: set) -> bool:
+    # Classes in comments, attribute values and :not() don't need to be used to match.
+    selector = re.sub(
+        r"/\*.*?\*/|\[[^\]]*\]|:not\([^)]*\)", "", selector, flags=re.DOTALL
+    )
+    return all(c in used_words for c in CSS_CLASS_RE.findall(selector))
+
+
+def get_used_words(storage, script_paths) -> set:
+    """
+    Returns every word in the project's templates, Python modules and scripts, and
+    in the collected scripts, any of which could be a class name.
+    """
+    words = set()
+    for script_path in script_paths:
+        words.update(WORD_RE.findall(read_file(storage, script_path)))
+
+    for source_dir in get_class_source_dirs():
+        for dir_path, dir_names, file_names in os.walk(source_dir):
+            dir_names[:] = [d for d in dir_names if d not in CLASS_SOURCE_EXCLUDE_DIRS]
+            for file_name in file_names:
+                if os.path.splitext(file_name)[1] not in CLASS_SOURCE_EXTENSIONS:
+                    continue
+
+                file_path = os.path.join(dir_path, file_name)
+                with open(file_path, encoding="utf-8", errors="ignore") as f:
+                    words.update(WORD_RE.findall(f.read()))
+
+    return words
+
+
+def get_class_source_dirs() -> list:
+    """
+    Returns the directories of the project's apps and templates.
+    """
+    # The settings are in the clerk app, next to the other apps.
+    project_dir = os.path.dirname(settings.BASE_DIR)
+    dirs = [
+        app.path
+        for app in apps.get_app_configs()
+        if app.path.startswith(project_dir + os.sep)
+    ]
+    for template_settings in settings.TEMPLATES:
+        dirs += template_settings.get("DIRS", [])
+
+    return dirs
@@ -0,0 +1,10 @@
+from . import (
+    listings,
+    page_cache,
+    prerender,
+    redirects,
+    renditions,
+    search,
+    sitemaps,
+    slugurl,
+)
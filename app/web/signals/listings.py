@@ -0,0 +1,47 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.core.models import PageViewRestriction
+from wagtail.core.signals import page_published, page_unpublished, post_page_move
+from wagtail.images import get_image_model
+
+from web.models import ExternalNews, NewsListPage
+from web.models.mixins import clear_listings
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def clear_listings_on_publish(sender, instance, **kwargs):
+    # Deleting a page unpublishes it first, so this covers deletes too.
+    page_ids = [instance.pk, instance.get_parent().pk]
+    # Cleared once the change is visible, so the old listing isn't cached again.
+    # These are cleared before the page cache is purged, see web.signals.page_cache.
+    transaction.on_commit(lambda: clear_listings(page_ids))
+
+
+@receiver(post_page_move)
+def clear_listings_on_move(
+    sender, instance, parent_page_before, parent_page_after, **kwargs
+):
+    page_ids = [parent_page_before.pk, parent_page_after.pk]
+    transaction.on_commit(lambda: clear_listings(page_ids))
+
+
+@receiver(post_save, sender=PageViewRestriction)
+@receiver(post_delete, sender=PageViewRestriction)
+def clear_listings_on_privacy_change(sender, instance, **kwargs):
+    page_ids = [instance.page.pk, instance.page.get_parent().pk]
+    transaction.on_commit(lambda: clear_listings(page_ids))
+
+
+@receiver(post_save, sender=ExternalNews)
+@receiver(post_delete, sender=ExternalNews)
+def clear_listings_on_external_news_change(sender, instance, **kwargs):
+    transaction.on_commit(NewsListPage.clear_listings)
+
+
+@receiver(post_save, sender=get_image_model())
+def clear_listings_on_image_change(sender, instance, created, **kwargs):
+    # A new file for the image replaces its renditions, which listings link to.
+    if not created:
+        transaction.on_commit(NewsListPage.clear_listings)
@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.core.signals import page_published, page_unpublished
+
+from web.models import ExternalNews, NewsListPage
+from web.services.page_cache import get_page_purge_paths, purge_paths
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def purge_page_cache_on_publish(sender, instance, **kwargs):
+    paths = get_page_purge_paths(instance)
+    # Purge once the change is visible, so the old page isn't cached again.
+    transaction.on_commit(lambda: purge_paths(paths))
+
+
+@receiver(post_save, sender=ExternalNews)
+@receiver(post_delete, sender=ExternalNews)
+def purge_page_cache_on_external_news_change(sender, instance, **kwargs):
+    paths = []
+    for news_list_page in NewsListPage.objects.all():
+        paths += get_page_purge_paths(news_list_page)
+
+    transaction.on_commit(lambda: purge_paths(paths))
@@ -0,0 +1,46 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.core.models import Page
+from wagtail.core.signals import page_published, page_unpublished, post_page_move
+
+from web.models import ExternalNews, NewsListPage
+from web.services.prerender import (
+    prerender_page,
+    prerender_page_tree,
+    prune_prerendered_children,
+)
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def prerender_on_publish(sender, instance, **kwargs):
+    # Render once the change is visible.
+    transaction.on_commit(lambda: prerender_page_tree(instance))
+
+
+@receiver(post_page_move)
+def prerender_on_move(sender, instance, parent_page_before, **kwargs):
+    def prerender():
+        prerender_page_tree(instance)
+        prune_prerendered_children(parent_page_before.specific)
+
+    transaction.on_commit(prerender)
+
+
+@receiver(post_delete, sender=Page)
+def prerender_on_delete(sender, instance, **kwargs):
+    parent = instance.get_parent()
+    if parent:
+        transaction.on_commit(lambda: prerender_page_tree(parent))
+
+
+@receiver(post_save, sender=ExternalNews)
+@receiver(post_delete, sender=ExternalNews)
+def prerender_on_external_news_change(sender, instance, **kwargs):
+    def prerender():
+        for news_list_page in NewsListPage.objects.live().public():
+            prerender_page(news_list_page)
+
+    # Rendered after the news listings are cleared, see web.signals.listings.
+    transaction.on_commit(prerender)
@@ -0,0 +1,13 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from web.models import WebRedirect
+from web.services.redirects import invalidate_redirects
+
+
+@receiver(post_save, sender=WebRedirect)
+@receiver(post_delete, sender=WebRedirect)
+def invalidate_redirects_on_change(sender, instance, **kwargs):
+    # Other processes must not reload the redirects before the change is visible.
+    transaction.on_commit(invalidate_redirects)
@@ -0,0 +1,30 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from wagtail.core.signals import page_published
+from wagtail.images import get_image_model
+
+from utils.tasks import async_task
+from web.models import ExternalNews
+from web.services.renditions import warm_image_renditions, warm_page_renditions
+
+
+@receiver(post_save, sender=get_image_model())
+def warm_renditions_on_upload(sender, instance, created, **kwargs):
+    if created:
+        # Render once the image is visible to the worker.
+        transaction.on_commit(lambda: async_task(warm_image_renditions, instance.pk))
+
+
+@receiver(page_published)
+def warm_renditions_on_publish(sender, instance, **kwargs):
+    transaction.on_commit(lambda: async_task(warm_page_renditions, instance.pk))
+
+
+@receiver(post_save, sender=ExternalNews)
+def warm_renditions_on_external_news_change(sender, instance, **kwargs):
+    if instance.brand_image_id:
+        image_id = instance.brand_image_id
+        transaction.on_commit(
+            lambda: async_task(warm_image_renditions, image_id, ["news-brand"])
+        )
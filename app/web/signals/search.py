@@ -0,0 +1,18 @@
+from django.dispatch import receiver
+from wagtail.core.signals import page_published, page_unpublished, post_page_move
+
+from web.models import BlogListPage
+from web.services.search import clear_blog_list_page, update_search_entry
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def update_search_entry_on_publish(sender, instance, **kwargs):
+    # Indexed in the same transaction, so the index is never out of step.
+    update_search_entry(instance)
+
+
+@receiver(page_published, sender=BlogListPage)
+@receiver(post_page_move)
+def clear_blog_list_page_on_change(sender, instance, **kwargs):
+    clear_blog_list_page()
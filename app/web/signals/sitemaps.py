@@ -0,0 +1,22 @@
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from wagtail.core.models import Page
+from wagtail.core.signals import page_published, page_unpublished, post_page_move
+
+from utils.tasks import async_task
+from web.services.sitemaps import build_sitemaps, build_sitemaps_for_page
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def build_sitemaps_on_publish(sender, instance, **kwargs):
+    # Build once the change is visible to the worker.
+    transaction.on_commit(lambda: async_task(build_sitemaps_for_page, instance.pk))
+
+
+@receiver(post_delete, sender=Page)
+def build_sitemaps_on_delete(sender, instance, **kwargs):
+    # The page's specific class may already be gone, so rebuild every section.
+    transaction.on_commit(lambda: async_task(build_sitemaps))
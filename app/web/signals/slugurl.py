@@ -0,0 +1,23 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.core.models import Page, Site
+from wagtail.core.signals import page_published, page_unpublished, post_page_move
+
+from utils.tasks import async_task
+from web.services.slugurl import update_slug_urls
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def update_slug_urls_on_page_change(sender, instance, **kwargs):
+    # Rebuild once the change is visible to the worker.
+    transaction.on_commit(lambda: async_task(update_slug_urls))
+
+
+@receiver(post_delete, sender=Page)
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def update_slug_urls_on_delete(sender, instance, **kwargs):
+    transaction.on_commit(lambda: async_task(update_slug_urls))
@@ -1,5 +1,7 @@
 from django.contrib import sitemaps
+from django.test import RequestFactory
 from django.urls import reverse
+from django.utils.functional import cached_property
 
 from .models import (
     ResourcePage,
@@ -11,10 +13,20 @@ from .models import (
     NewsPage,
 )
 
+# Pages in each sitemap file, see web.services.sitemaps.
+SHARD_SIZE = 1000
+# Pages are linked as if requested from here, Wagtail falls back to the default site.
+URL_REQUEST_HOST = "localhost"
+
 
 class StaticSitemap(sitemaps.Sitemap):
     priority = 0.5
     changefreq = "daily"
+    limit = SHARD_SIZE
+
+    @classmethod
+    def is_page_listed(cls, page) -> bool:
+        return False
 
     def items(self):
         return [
@@ -35,20 +47,40 @@ class StaticSitemap(sitemaps.Sitemap):
 class WagtailSitemap(sitemaps.Sitemap):
     priority = 0.5
     changefreq = "daily"
+    limit = SHARD_SIZE
     list_page = None
     details_page = None
 
     def items(self):
+        # Wagtail caches the site root paths on the request, so they are only read once.
+        self.url_request = RequestFactory().get("/", HTTP_HOST=URL_REQUEST_HOST)
         items = []
-        if self.list_page:
-            items += list(self.list_page.objects.all())
-        if self.details_page:
-            items += list(self.details_page.objects.all())
+        for page_cls in [self.list_page, self.details_page]:
+            if page_cls:
+                pages = page_cls.objects.live().public().defer_streamfields()
+                items += [p for p in pages.order_by("path") if self.get_path(p)]
 
         return items
 
+    @cached_property
+    def paginator(self):
+        # Built once, rather than for every shard.
+        return super().paginator
+
+    def get_path(self, page):
+        url_parts = page.get_url_parts(request=self.url_request)
+        return url_parts[2] if url_parts else None
+
     def location(self, item):
-        return item.url
+        return self.get_path(item)
+
+    def lastmod(self, item):
+        return item.last_published_at
+
+    @classmethod
+    def is_page_listed(cls, page) -> bool:
+        page_classes = [c for c in [cls.list_page, cls.details_page] if c]
+        return isinstance(page.specific, tuple(page_classes))
 
 
 class JobSitemap(WagtailSitemap):
@@ -0,0 +1,114 @@
+"""
+Static files storage.
+"""
+
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, features
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+from web.services.static_bundles import STATIC_BUNDLES, build_bundle
+
+# Photos which get smaller copies, see StaticStorage.
+PHOTO_DIR = "web/img/photos/"
+PHOTO_EXTENSIONS = [".jpg", ".jpeg"]
+# Widths of the 1x and 2x copies of each photo.
+PHOTO_WIDTHS = [400, 800]
+PHOTO_QUALITY = 80
+
+
+class StaticStorage(CompressedManifestStaticFilesStorage):
+    """
+    When static files are collected, writes:
+
+    - 1x and 2x copies of each photo, as JPEG and WebP. The photos are much larger
+      than they are shown, so pages list the copies in a srcset, see the
+      responsive_static tag.
+    - the bundles of stylesheets and scripts, see web.services.static_bundles.
+
+    These are then hashed and compressed along with the collected files.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            paths = dict(paths)
+            for path in list(paths):
+                if is_photo(path):
+                    for name in self.write_photo_copies(path):
+                        paths[name] = (self, name)
+
+            for name, files in STATIC_BUNDLES.items():
+                if all(path in paths for path in files):
+                    self.write_file(name, build_bundle(self, name))
+                    paths[name] = (self, name)
+
+        yield from super().post_process(paths, dry_run, **options)
+
+    def write_file(self, name: str, content: bytes):
+        if self.exists(name):
+            self.delete(name)
+
+        self.save(name, ContentFile(content))
+
+    def is_collected(self, name: str) -> bool:
+        return bool(self.hashed_files.get(self.hash_key(self.clean_name(name))))
+
+    def write_photo_copies(self, path: str) -> list:
+        with self.open(path) as f:
+            image = Image.open(f)
+            image.load()
+
+        image = image.convert("RGB")
+        names = []
+        for width in PHOTO_WIDTHS:
+            if width >= image.width:
+                break
+
+            height = round(image.height * width / image.width)
+            resized = image.resize((width, height), Image.LANCZOS)
+            for ext, image_format in get_photo_formats(path):
+                content = BytesIO()
+                resized.save(content, image_format, quality=PHOTO_QUALITY, optimize=True)
+                name = get_photo_copy_name(path, width, ext)
+                self.write_file(name, content.getvalue())
+                names.append(name)
+
+        return names
+
+    def get_photo_copies(self, path: str) -> dict:
+        """
+        Returns the names of the collected copies of the photo, by extension.
+        """
+        copies = {}
+        for width in PHOTO_WIDTHS:
+            for ext, _ in get_photo_formats(path):
+                name = get_photo_copy_name(path, width, ext)
+                if self.is_collected(name):
+                    copies.setdefault(ext, []).append(name)
+
+        return copies
+
+
+def is_photo(path: str) -> bool:
+    path = path.replace(os.sep, "/")
+    ext = os.path.splitext(path)[1].lower()
+    return path.startswith(PHOTO_DIR) and ext in PHOTO_EXTENSIONS
+
+
+def get_photo_formats(path: str) -> list:
+    """
+    Returns the (extension, Pillow format) of each copy of the photo.
+    WebP copies are skipped if Pillow was built without WebP.
+    """
+    formats = [(os.path.splitext(path)[1].lower(), "JPEG")]
+    if features.check("webp"):
+        formats.append((".webp", "WEBP"))
+
+    return formats
+
+
+def get_photo_copy_name(path: str, width: int, ext: str) -> str:
+    root = os.path.splitext(path)[0]
+    return f"{root}.{width}w{ext}"
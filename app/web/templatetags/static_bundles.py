@@ -0,0 +1,31 @@
+"""
+Template tags for static file bundles
+"""
+
+from django import template
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+from django.utils.html import format_html_join
+
+from web.services.static_bundles import STATIC_BUNDLES
+
+register = template.Library()
+
+
+@register.simple_tag
+def static_bundle(name):
+    """
+    Renders the stylesheet or script tag for a bundle, or a tag for each of its
+    files if the bundle hasn't been collected, eg. in development,
+    see web.services.static_bundles.
+
+    Usage: {% static_bundle "case/bundle.css" %}
+    """
+    is_collected = getattr(staticfiles_storage, "is_collected", None)
+    paths = [name] if is_collected and is_collected(name) else STATIC_BUNDLES[name]
+    if name.endswith(".css"):
+        tag = '<link rel="stylesheet" type="text/css" href="{}">'
+    else:
+        tag = '<script type="text/javascript" src="{}"></script>'
+
+    return format_html_join("\n", tag, ((static(path),) for path in paths))
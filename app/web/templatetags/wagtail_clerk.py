@@ -2,11 +2,16 @@
 Clerk specific Wagtail stuff
 """
 
-from django import template
+import os
 
-from wagtail.core.templatetags.wagtailcore_tags import pageurl
-from wagtail.core.models import Page, Site
+from django import template
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html
 
+from web.services.renditions import get_responsive_image
+from web.services.slugurl import slug_url_map
 
 register = template.Library()
 
@@ -19,25 +24,76 @@ def clerk_slugurl(context, slug):
     is not available in the context, then returns the URL for the first page
     that matches the slug on any site.
 
+    URLs are looked up in a map of every page, so no queries are made,
+    see web.services.slugurl.
+
     Based on: https://github.com/wagtail/wagtail/blob/main/wagtail/core/templatetags/wagtailcore_tags.py#L48
     """
-    page = None
-    try:
-        site = Site.find_for_request(context["request"])
-        current_site = site
-    except KeyError:
-        # No site object found - allow the fallback below to take place.
-        pass
-    else:
-        if current_site is not None:
-            page = (
-                Page.objects.in_site(current_site).filter(slug=slug).specific().first()
-            )
-
-    # If no page is found, fall back to searching the whole tree.
-    if page is None:
-        page = Page.objects.filter(slug=slug).specific().first()
-
-    if page:
-        # call pageurl() instead of page.relative_url() here so we get the ``accepts_kwarg`` logic
-        return pageurl(context, page)
+    return slug_url_map.get_url(context.get("request"), slug)
+
+
+@register.simple_tag
+def responsive_image(image, set_name, **attrs):
+    """
+    Renders a picture of the image's 1x and 2x renditions from the rendition set,
+    as WebP for browsers which support it. The renditions are generated when the
+    image is uploaded or used, see web.services.renditions.
+
+    Usage: {% responsive_image page.main_image "blog-card" class="round-small" %}
+
+    The image can also be the renditions from get_responsive_image, eg. in a cached
+    listing, see ListingPageMixin.
+    """
+    if not image:
+        return ""
+
+    if not isinstance(image, dict):
+        image = get_responsive_image(image, set_name)
+
+    img_attrs = {
+        "src": image["urls"][0],
+        "srcset": get_srcset(image["urls"]),
+        "width": image["width"],
+        "height": image["height"],
+        "alt": image["alt"],
+        "loading": "lazy",
+        **attrs,
+    }
+    return render_picture(image["webp_urls"], img_attrs)
+
+
+@register.simple_tag
+def responsive_static(path, **attrs):
+    """
+    Renders a picture of the 1x and 2x copies of a static photo, as WebP for
+    browsers which support it, or just the photo if it has no copies, eg. when
+    static files haven't been collected, see web.storage.StaticStorage.
+
+    Usage: {% responsive_static member.image class="headshot" %}
+    """
+    get_photo_copies = getattr(staticfiles_storage, "get_photo_copies", None)
+    copies = get_photo_copies(path) if get_photo_copies else {}
+    img_attrs = {"src": static(path), "loading": "lazy", **attrs}
+    ext = os.path.splitext(path)[1].lower()
+    if not copies.get(ext):
+        return format_html("<img{}>", flatatt(img_attrs))
+
+    urls = [static(name) for name in copies[ext]]
+    img_attrs["src"] = urls[0]
+    img_attrs["srcset"] = get_srcset(urls)
+    return render_picture([static(name) for name in copies.get(".webp", [])], img_attrs)
+
+
+def get_srcset(urls) -> str:
+    # The first URL is for 1x displays, the second for 2x displays.
+    return ", ".join(f"{url} {i + 1}x" for i, url in enumerate(urls))
+
+
+def render_picture(webp_urls, img_attrs):
+    webp_source = ""
+    if webp_urls:
+        webp_source = format_html(
+            '<source type="image/webp" srcset="{}">', get_srcset(webp_urls)
+        )
+
+    return format_html("<picture>{}<img{}></picture>", webp_source, flatatt(img_attrs))
@@ -0,0 +1,37 @@
+import json
+
+from web.models import JobPage
+from web.services import icons
+from web.storage import StaticStorage
+
+
+def test_icon_choices():
+    """
+    Ensure job page icons are listed from the static files, without directories.
+    """
+    icons.get_icons.cache_clear()
+    choices = list(JobPage._meta.get_field("icon").choices)
+    assert ("web/img/icons/crowd.svg", "crowd") in choices
+    assert all(path.endswith(".svg") for path, _ in choices)
+
+
+def test_icons_from_manifest(settings, tmp_path, monkeypatch):
+    """
+    Ensure icons are listed from the collected static files when the source
+    files aren't there.
+    """
+    settings.STATIC_ROOT = str(tmp_path)
+    settings.STATICFILES_STORAGE = "web.storage.StaticStorage"
+    paths = {
+        "web/img/icons/crowd.svg": "web/img/icons/crowd.1a2b.svg",
+        "web/img/icons/social/twitter.svg": "web/img/icons/social/twitter.3c4d.svg",
+        "web/img/team.jpg": "web/img/team.5e6f.jpg",
+    }
+    manifest = {"paths": paths, "version": StaticStorage.manifest_version}
+    (tmp_path / "staticfiles.json").write_text(json.dumps(manifest))
+    monkeypatch.setattr(icons, "get_icons_dir", lambda: str(tmp_path / "icons"))
+    icons.get_icons.cache_clear()
+    try:
+        assert icons.get_icons() == ["web/img/icons/crowd.svg"]
+    finally:
+        icons.get_icons.cache_clear()
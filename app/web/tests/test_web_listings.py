@@ -0,0 +1,110 @@
+import datetime
+
+import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
+from wagtail.images.models import Image
+from wagtail.images.tests.utils import get_test_image_file
+
+from web.models import (
+    ExternalNews,
+    JobListPage,
+    JobPage,
+    NewsListPage,
+    NewsPage,
+    RootPage,
+)
+
+
+@pytest.mark.django_db
+def test_news_listing_cached(
+    client, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    """
+    Ensure the news list page renders from its cached listing, which is cleared
+    when a news page or external news item changes.
+    """
+    cache.clear()
+    request = RequestFactory().get("/news/")
+    with django_capture_on_commit_callbacks(execute=True):
+        news_list_page = NewsListPage(title="News", slug="news")
+        RootPage.objects.get().add_child(instance=news_list_page)
+        news_list_page.save_revision().publish()
+        news_page = NewsPage(title="Funding announced", slug="funding-announced")
+        news_list_page.add_child(instance=news_page)
+        news_page.save_revision().publish()
+
+    # The revision is published with another instance of the page.
+    news_page.refresh_from_db()
+    listing = news_list_page.get_listing(request)
+    assert listing["articles"] == [
+        {
+            "title": "Funding announced",
+            "url": "/news/funding-announced/",
+            "last_published_at": news_page.last_published_at,
+        }
+    ]
+    assert listing["external_articles"] == []
+    with django_assert_num_queries(0):
+        assert news_list_page.get_listing(request) == listing
+
+    with django_capture_on_commit_callbacks(execute=True):
+        image = Image.objects.create(title="Age", file=get_test_image_file())
+        ExternalNews.objects.create(
+            title="Anika in The Age",
+            published_date=datetime.date(2021, 6, 1),
+            url="https://www.theage.com.au/anika",
+            brand_image=image,
+        )
+
+    external_articles = news_list_page.get_listing(request)["external_articles"]
+    assert [a["title"] for a in external_articles] == ["Anika in The Age"]
+    brand_image = external_articles[0]["brand_image"]
+    assert brand_image["urls"][0] == image.get_rendition("height-72").url
+
+    response = client.get("/news/")
+    assert b"Anika in The Age" in response.content
+    assert brand_image["webp_urls"][0].encode() in response.content
+
+    with django_capture_on_commit_callbacks(execute=True):
+        news_page.unpublish()
+
+    assert news_list_page.get_listing(request)["articles"] == []
+
+
+@pytest.mark.django_db
+def test_job_listing_cached(client, django_assert_num_queries):
+    """
+    Ensure the job list page renders its jobs from one cache read.
+    """
+    cache.clear()
+    job_list_page = JobListPage(title="Jobs", slug="jobs")
+    RootPage.objects.get().add_child(instance=job_list_page)
+    job_list_page.save_revision().publish()
+    job_page = JobPage(
+        title="Paralegal",
+        slug="paralegal",
+        icon="web/img/icons/crowd.svg",
+        closing_date=datetime.date(2021, 7, 1),
+        search_description="Help renters with their repairs.",
+    )
+    job_list_page.add_child(instance=job_page)
+    job_page.save_revision().publish()
+
+    request = RequestFactory().get("/about/join-our-team/")
+    listing = job_list_page.get_listing(request)
+    assert listing["jobs"] == [
+        {
+            "title": "Paralegal",
+            "url": "/about/join-our-team/paralegal/",
+            "icon": "web/img/icons/crowd.svg",
+            "search_description": "Help renters with their repairs.",
+            "closing_date": datetime.date(2021, 7, 1),
+        }
+    ]
+    with django_assert_num_queries(0):
+        assert job_list_page.get_listing(request) == listing
+
+    response = client.get("/about/join-our-team/")
+    assert b"Help renters with their repairs." in response.content
+    assert b'href="/about/join-our-team/paralegal/"' in response.content
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+from django.core.cache import cache
+
+from core.factories import UserFactory
+from web.models import BlogListPage, BlogPage, RootPage
+from web.services import page_cache
+from web.services.page_cache import HIT, MISS, flush_stats, get_stats
+
+
+@pytest.mark.django_db
+def test_page_cache_anonymous(client, settings, tmp_path, monkeypatch):
+    """
+    Ensure public pages are cached for anonymous visitors, whatever their
+    tracking query args, and not for signed in users.
+    """
+    settings.PRERENDER_ROOT = str(tmp_path)
+    cache.clear()
+    # Lookups are counted in each process before they're added to the stats.
+    monkeypatch.setattr(page_cache, "_lookup_counts", {HIT: 0, MISS: 0})
+    response = client.get("/about/")
+    assert response["X-Page-Cache"] == "MISS"
+
+    response = client.get("/about/?utm_source=facebook")
+    assert response["X-Page-Cache"] == "HIT"
+    assert b"</html>" in response.content
+    # Visitors get a CSRF cookie for the page's forms.
+    assert "csrftoken" in response.cookies
+
+    # Query args which change the page aren't ignored.
+    response = client.get("/about/?page=2")
+    assert response["X-Page-Cache"] == "MISS"
+
+    client.force_login(UserFactory())
+    response = client.get("/about/")
+    assert not response.has_header("X-Page-Cache")
+
+    flush_stats()
+    stats = get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+@pytest.mark.django_db
+def test_page_cache_purged_on_publish(
+    client, settings, tmp_path, django_capture_on_commit_callbacks
+):
+    """
+    Ensure a page and the pages which list it are pre-rendered again and purged
+    from the page cache when the page is published.
+    """
+    settings.PRERENDER_ROOT = str(tmp_path)
+    cache.clear()
+    blog_list_page = BlogListPage(title="Blog", slug="blog")
+    RootPage.objects.get().add_child(instance=blog_list_page)
+    blog_list_page.save_revision().publish()
+
+    client.get("/blog/")
+    assert client.get("/blog/")["X-Page-Cache"] == "HIT"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        blog_page = BlogPage(title="Fresh Blog Post", slug="fresh-blog-post")
+        blog_list_page.add_child(instance=blog_page)
+        blog_page.save_revision().publish()
+
+    # The pre-rendered page is served first.
+    response = client.get("/blog/")
+    assert response["X-Page-Cache"] == "PRERENDERED"
+    assert b"Fresh Blog Post" in b"".join(response.streaming_content)
+
+    # Without it, the view renders the page, rather than the cache serving the old one.
+    os.remove(tmp_path / "blog" / "index.html")
+    response = client.get("/blog/")
+    assert response["X-Page-Cache"] == "MISS"
+    assert b"Fresh Blog Post" in response.content
+    # Other pages are still cached.
+    client.get("/about/")
+    assert client.get("/about/")["X-Page-Cache"] == "HIT"
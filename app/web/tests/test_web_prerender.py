@@ -0,0 +1,103 @@
+import datetime
+import os
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from core.factories import UserFactory
+from web.models import BlogListPage, BlogPage, ExternalNews, NewsListPage, RootPage
+
+
+@pytest.fixture
+def blog_page(settings, tmp_path):
+    settings.PRERENDER_ROOT = str(tmp_path)
+    cache.clear()
+    blog_list_page = BlogListPage(title="Blog", slug="blog")
+    RootPage.objects.get().add_child(instance=blog_list_page)
+    blog_list_page.save_revision().publish()
+    blog_page = BlogPage(title="Prerendered Post", slug="prerendered-post")
+    blog_list_page.add_child(instance=blog_page)
+    blog_page.save_revision().publish()
+    return blog_page
+
+
+@pytest.mark.django_db
+def test_prerender_pages(client, blog_page, tmp_path):
+    """
+    Ensure marketing pages and Wagtail pages are pre-rendered and served from disk.
+    """
+    call_command("prerender_pages")
+    for path in ["index.html", "about/index.html", "blog/prerendered-post/index.html"]:
+        assert os.path.exists(tmp_path / path), path
+
+    response = client.get("/blog/prerendered-post/")
+    assert response["X-Page-Cache"] == "PRERENDERED"
+    assert b"Prerendered Post" in b"".join(response.streaming_content)
+    assert "csrftoken" in response.cookies
+
+    # Listings with query args are served by the view.
+    response = client.get("/blog/?page=2")
+    assert response.get("X-Page-Cache") != "PRERENDERED"
+
+    # Signed in users are served by the view.
+    client.force_login(UserFactory())
+    response = client.get("/blog/prerendered-post/")
+    assert response.get("X-Page-Cache") != "PRERENDERED"
+
+
+@pytest.mark.django_db
+def test_prerender_on_publish(
+    client, blog_page, tmp_path, django_capture_on_commit_callbacks
+):
+    """
+    Ensure pages are pre-rendered when published, and removed when unpublished
+    or when their slug changes.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        blog_page.title = "Renamed Post"
+        blog_page.slug = "renamed-post"
+        blog_page.save_revision().publish()
+
+    assert not os.path.exists(tmp_path / "blog" / "prerendered-post")
+    with open(tmp_path / "blog" / "renamed-post" / "index.html", "rb") as f:
+        assert b"Renamed Post" in f.read()
+    with open(tmp_path / "blog" / "index.html", "rb") as f:
+        assert b"Renamed Post" in f.read()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        blog_page.unpublish()
+
+    assert not os.path.exists(tmp_path / "blog" / "renamed-post")
+    assert client.get("/blog/renamed-post/").status_code == 404
+
+
+@pytest.mark.django_db
+def test_prerender_on_external_news_change(
+    settings, tmp_path, django_capture_on_commit_callbacks
+):
+    """
+    Ensure news list pages are pre-rendered again when external news changes.
+    """
+    settings.PRERENDER_ROOT = str(tmp_path)
+    cache.clear()
+    with django_capture_on_commit_callbacks(execute=True):
+        news_list_page = NewsListPage(title="News", slug="news")
+        RootPage.objects.get().add_child(instance=news_list_page)
+        news_list_page.save_revision().publish()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        news = ExternalNews.objects.create(
+            title="Anika in The Age",
+            published_date=datetime.date(2021, 6, 1),
+            url="https://www.theage.com.au/anika",
+        )
+
+    with open(tmp_path / "news" / "index.html", "rb") as f:
+        assert b"Anika in The Age" in f.read()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        news.delete()
+
+    with open(tmp_path / "news" / "index.html", "rb") as f:
+        assert b"Anika in The Age" not in f.read()
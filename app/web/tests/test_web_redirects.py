@@ -0,0 +1,70 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from web.models import WebRedirect
+from web.services.redirects import redirect_table
+
+
+@pytest.fixture
+def redirects(django_capture_on_commit_callbacks):
+    redirect_table.clear()
+    with django_capture_on_commit_callbacks(execute=True):
+        for source, destination in [
+            ("our-impact", "about/impact"),
+            ("old-blog/*", "blog/*"),
+            ("old-blog/moved", "blog/elsewhere"),
+            ("old-jobs/*", "about/join-our-team"),
+        ]:
+            WebRedirect.objects.create(
+                source_path=source, destination_path=destination, is_permanent=True
+            )
+
+
+REDIRECT_TESTS = [
+    # path, expected destination
+    ("/our-impact/", "/about/impact/"),
+    ("/old-blog/", "/blog/"),
+    ("/old-blog/foo/", "/blog/foo/"),
+    ("/old-blog/foo/bar/", "/blog/foo/bar/"),
+    ("/old-blog/moved/", "/blog/elsewhere/"),
+    ("/old-jobs/lawyer/", "/about/join-our-team/"),
+    ("/old-blogs/", None),
+    ("/wp-login.php", None),
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("path, expected", REDIRECT_TESTS)
+def test_redirects(client, redirects, path, expected):
+    response = client.get(path)
+    if expected:
+        assert response.status_code == 301
+        assert response.url == expected
+    else:
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_redirects_resolved_without_queries(
+    redirects, django_capture_on_commit_callbacks
+):
+    """
+    Ensure redirects are loaded once, then resolved from memory,
+    and reloaded when a redirect changes.
+    """
+    assert redirect_table.resolve("/our-impact/")
+    with CaptureQueriesContext(connection) as ctx:
+        assert redirect_table.resolve("/our-impact/") == ("/about/impact/", True)
+        assert redirect_table.resolve("/wp-admin/") is None
+        assert redirect_table.resolve("/wp-admin/") is None
+
+    assert not ctx.captured_queries
+    assert "wp-admin" in redirect_table.misses
+
+    with django_capture_on_commit_callbacks(execute=True):
+        WebRedirect.objects.create(
+            source_path="wp-admin", destination_path="", is_permanent=False
+        )
+
+    assert redirect_table.resolve("/wp-admin/") == ("/", False)
@@ -0,0 +1,64 @@
+from io import BytesIO
+
+import pytest
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.base import ContentFile
+from django.template import Context, Template
+from PIL import Image as PILImage
+from wagtail.images.models import Image
+from wagtail.images.tests.utils import get_test_image_file
+
+from web.services.renditions import get_image_filter_specs
+
+
+@pytest.mark.django_db
+def test_renditions_warmed_on_upload(django_capture_on_commit_callbacks):
+    """
+    Ensure every rendition is generated when an image is uploaded, and the
+    responsive_image tag uses them.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        image = Image.objects.create(title="Mould", file=get_test_image_file())
+
+    filter_specs = set(image.renditions.values_list("filter_spec", flat=True))
+    assert "width-400" in filter_specs
+    assert "width-800|format-webp" in filter_specs
+    assert "height-72|format-webp" in filter_specs
+    assert filter_specs == set(get_image_filter_specs(["blog-card", "news-brand"]))
+
+    html = Template(
+        '{% load wagtail_clerk %}{% responsive_image image "blog-card" class="card" %}'
+    ).render(Context({"image": image}))
+    webp_url = image.get_rendition("width-400|format-webp").url
+    assert f'<source type="image/webp" srcset="{webp_url} 1x, ' in html
+    assert f'src="{image.get_rendition("width-400").url}"' in html
+    assert 'class="card"' in html
+
+
+def test_static_photo_copies(settings, tmp_path):
+    """
+    Ensure smaller copies of static photos are collected and used in srcsets.
+    """
+    settings.STATIC_ROOT = str(tmp_path)
+    settings.STATICFILES_STORAGE = "web.storage.StaticStorage"
+    photo = BytesIO()
+    PILImage.new("RGB", (1000, 1000), "blue").save(photo, "JPEG")
+    name = "web/img/photos/team/sam.jpeg"
+    staticfiles_storage.save(name, ContentFile(photo.getvalue()))
+    list(staticfiles_storage.post_process({name: (staticfiles_storage, name)}))
+
+    copies = staticfiles_storage.get_photo_copies(name)
+    assert copies[".jpeg"] == [
+        "web/img/photos/team/sam.400w.jpeg",
+        "web/img/photos/team/sam.800w.jpeg",
+    ]
+    with staticfiles_storage.open(copies[".jpeg"][0]) as f:
+        assert PILImage.open(f).size == (400, 400)
+
+    html = Template(
+        '{% load wagtail_clerk %}{% responsive_static path alt="Sam" %}'
+    ).render(Context({"path": name}))
+    url = staticfiles_storage.url(copies[".jpeg"][0])
+    assert f'src="{url}"' in html
+    assert f'srcset="{url} 1x, ' in html
+    assert 'alt="Sam"' in html
@@ -0,0 +1,54 @@
+import pytest
+from wagtail.core.rich_text import RichText
+
+from web.models import BlogListPage, BlogPage, PageSearchEntry, RootPage
+
+
+def add_blog_page(blog_list_page, title, text):
+    blog_page = BlogPage(
+        title=title,
+        slug=title.lower().replace(" ", "-"),
+        body=[("paragraph", RichText(f"<p>{text}</p>"))],
+    )
+    blog_list_page.add_child(instance=blog_page)
+    blog_page.save_revision().publish()
+    return blog_page
+
+
+@pytest.mark.django_db
+def test_blog_search_ranked(client, django_capture_on_commit_callbacks):
+    """
+    Ensure blog searches use the search index, with the best matches first and
+    the search terms highlighted, and unpublished pages are removed from the index.
+    """
+    blog_list_page = BlogListPage(title="Blog", slug="blog")
+    RootPage.objects.get().add_child(instance=blog_list_page)
+    blog_list_page.save_revision().publish()
+    add_blog_page(
+        blog_list_page, "Fixing mould", "Ask your landlord to <b>repair</b> it."
+    )
+    add_blog_page(blog_list_page, "Evictions explained", "How notices to vacate work.")
+    mentions_page = add_blog_page(
+        blog_list_page, "Renting tips", "Keep records in case of an eviction."
+    )
+    assert PageSearchEntry.objects.count() == 3
+
+    response = client.get("/blog/search/", {"search": "eviction"})
+    assert response.status_code == 200
+    blogs = list(response.context["blogs"])
+    # Matches in the title rank above matches in the body.
+    assert [b.title for b in blogs] == ["Evictions explained", "Renting tips"]
+    assert b"<mark>eviction</mark>" in response.content
+
+    response = client.get("/blog/search/", {"search": "repairs"})
+    assert [b.title for b in response.context["blogs"]] == ["Fixing mould"]
+    # Searches match other forms of the words.
+    assert b"<mark>repair</mark> it" in response.content
+
+    # Cached pages are purged once the unpublish is committed.
+    with django_capture_on_commit_callbacks(execute=True):
+        mentions_page.unpublish()
+
+    assert not PageSearchEntry.objects.filter(page_id=mentions_page.pk).exists()
+    response = client.get("/blog/search/", {"search": "eviction"})
+    assert [b.title for b in response.context["blogs"]] == ["Evictions explained"]
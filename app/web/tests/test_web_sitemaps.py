@@ -0,0 +1,44 @@
+import pytest
+
+from web.models import BlogListPage, BlogPage, RootPage
+
+
+@pytest.mark.django_db
+def test_sitemaps_built_on_publish(
+    client, settings, tmp_path, django_capture_on_commit_callbacks
+):
+    """
+    Ensure sitemaps are served from storage, for the requested host,
+    and rebuilt when a page is published.
+    """
+    settings.SITEMAP_ROOT = str(tmp_path)
+    with django_capture_on_commit_callbacks(execute=True):
+        blog_list_page = BlogListPage(title="Blog", slug="blog")
+        RootPage.objects.get().add_child(instance=blog_list_page)
+        blog_list_page.save_revision().publish()
+
+    response = client.get("/sitemap.xml")
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/xml"
+    assert b"<loc>http://testserver/sitemap-blog-1.xml</loc>" in response.content
+    assert b"sitemap.invalid" not in response.content
+
+    response = client.get("/sitemap-blog-1.xml")
+    assert response.status_code == 200
+    assert b"<loc>http://testserver/blog/</loc>" in response.content
+    assert b"<lastmod>" in response.content
+
+    # Crawlers which have already read the sitemap don't read it again.
+    etag = response["ETag"]
+    response = client.get("/sitemap-blog-1.xml", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    with django_capture_on_commit_callbacks(execute=True):
+        blog_page = BlogPage(title="Fresh Blog Post", slug="fresh-blog-post")
+        blog_list_page.add_child(instance=blog_page)
+        blog_page.save_revision().publish()
+
+    response = client.get("/sitemap-blog-1.xml", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert b"/blog/fresh-blog-post/" in response.content
+    assert client.get("/sitemap-missing-1.xml").status_code == 404
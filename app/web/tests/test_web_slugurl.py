@@ -0,0 +1,44 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.template import Context, Template
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from web.models import BlogListPage, RootPage
+from web.services.page_cache import SITE_VERSION_KEY
+from web.services.slugurl import slug_url_map
+
+TEMPLATE = Template("{% load wagtail_clerk %}{% clerk_slugurl 'blog' %}")
+
+
+@pytest.mark.django_db
+def test_slugurl_without_queries(settings, tmp_path, django_capture_on_commit_callbacks):
+    """
+    Ensure page links are resolved without queries, and change when the page's
+    slug changes, which rebuilds every cached page.
+    """
+    settings.PRERENDER_ROOT = str(tmp_path)
+    cache.clear()
+    slug_url_map.clear()
+    blog_list_page = BlogListPage(title="Blog", slug="blog")
+    RootPage.objects.get().add_child(instance=blog_list_page)
+    blog_list_page.save_revision().publish()
+
+    context = Context({"request": RequestFactory().get("/")})
+    assert TEMPLATE.render(context) == "/blog/"
+    with CaptureQueriesContext(connection) as ctx:
+        assert TEMPLATE.render(context) == "/blog/"
+        # No request.
+        assert TEMPLATE.render(Context()) == "/blog/"
+
+    assert not ctx.captured_queries
+
+    site_version = cache.get(SITE_VERSION_KEY)
+    with django_capture_on_commit_callbacks(execute=True):
+        blog_list_page.title = "News"
+        blog_list_page.slug = "news-blog"
+        blog_list_page.save_revision().publish()
+
+    assert TEMPLATE.render(context) == "None"
+    assert cache.get(SITE_VERSION_KEY) != site_version
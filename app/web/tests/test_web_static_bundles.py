@@ -0,0 +1,78 @@
+from django.template import Context, Template
+
+from web.services.static_bundles import minify_css, purge_css, rebase_urls
+
+
+def test_minify_css():
+    """
+    Ensure minifying drops comments and whitespace, but not from strings,
+    or between a selector and a pseudo-class.
+    """
+    css = """
+    /* Buttons */
+    .ui.button , .ui .label :hover {
+        content : "a  b";
+        margin: 0 auto;
+    }
+    """
+    assert (
+        minify_css(css)
+        == '.ui.button,.ui .label :hover{content : "a  b";margin: 0 auto;}'
+    )
+
+
+def test_rebase_urls():
+    """
+    Ensure relative URLs in a stylesheet point to the same files from the bundle.
+    """
+    css = (
+        'a{background:url("themes/icons.eot?#iefix")}'
+        "b{background:url(/static/web/img/x.png)}"
+        "c{background:url(data:image/png;base64,AAAA)}"
+    )
+    assert rebase_urls(css, "semantic/semantic.min.css", "case/bundle.css") == (
+        'a{background:url("../semantic/themes/icons.eot?#iefix")}'
+        "b{background:url(/static/web/img/x.png)}"
+        "c{background:url(data:image/png;base64,AAAA)}"
+    )
+
+
+def test_purge_css():
+    """
+    Ensure rules and fonts for unused classes are dropped, and other rules are kept.
+    """
+    css = (
+        "@font-face{font-family:Icons;src:url(icons.woff2)}"
+        "@font-face{font-family:Flags;src:url(flags.woff2)}"
+        "*,:after{box-sizing:inherit}"
+        ".ui.button,.ui.statistic{margin:0}"
+        ".ui.feed>.event{padding:0}"
+        ".ui.button:not(.basic)[data-x='.y']{color:red}"
+        "@media (max-width:767px){.ui.feed{margin:0}.ui.button{margin:1px}}"
+        "@keyframes spin{from{opacity:0}to{opacity:1}}"
+        "i.icon{font-family:Icons}"
+        "i.flag{font-family:Flags}"
+    )
+    used_words = {"ui", "button", "icon", "i"}
+    assert purge_css(css, used_words) == (
+        "@font-face{font-family:Icons;src:url(icons.woff2)}"
+        "*,:after{box-sizing:inherit}"
+        ".ui.button{margin:0}"
+        ".ui.button:not(.basic)[data-x='.y']{color:red}"
+        "@media (max-width:767px){.ui.button{margin:1px}}"
+        "@keyframes spin{from{opacity:0}to{opacity:1}}"
+        "i.icon{font-family:Icons}"
+    )
+
+
+def test_static_bundle_files_not_collected():
+    """
+    Ensure each file of a bundle is loaded when static files haven't been collected.
+    """
+    html = Template(
+        '{% load static_bundles %}{% static_bundle "web/bundle.css" %}'
+    ).render(Context())
+    assert html == (
+        '<link rel="stylesheet" type="text/css" href="/static/web/styles/global.css">\n'
+        '<link rel="stylesheet" type="text/css" href="/static/web/styles/components.css">'
+    )
@@ -1,12 +1,10 @@
 from django.urls import path, re_path
 from django.conf.urls import include
 from django.views.generic import TemplateView
-from django.contrib.sitemaps.views import sitemap
 from wagtail.admin import urls as wagtailadmin_urls
 from wagtail.core import urls as wagtail_urls
 from wagtail.documents import urls as wagtaildocs_urls
 from .models import ResourceListPage, BlogListPage, JobListPage, NewsListPage
-from .sitemaps import SITEMAPS
 
 from . import views
 
@@ -20,7 +18,7 @@ urlpatterns = [
     path("about/", template("web/about/about.html"), name="about"),
     path("about/annual-reports/", template("web/about/reports.html"), name="reports"),
     path("about/team/", views.team_view, name="team"),
-    path("about/impact/", template("web/about/impact.html"), name="impact"),
+    path("about/impact/", views.impact_view, name="impact"),
     # Services
     path(
         "services/",
@@ -57,10 +55,12 @@ urlpatterns = [
     # Sitemap
     path(
         "sitemap.xml",
-        sitemap,
-        {"sitemaps": SITEMAPS},
+        views.sitemap_view,
         name="django.contrib.sitemaps.views.sitemap",
     ),
+    re_path(
+        r"^(?P<name>sitemap-\w+-\d+\.xml)$", views.sitemap_view, name="sitemap-shard"
+    ),
     # Landing page
     path("landing/contact/", views.landing_contact_form_view, name="landing-contact"),
     re_path(r"^$", views.landing_view, name="landing"),
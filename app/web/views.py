@@ -1,11 +1,27 @@
+import os
 import random
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
 
+from django.http import Http404, HttpResponse
 from django.shortcuts import render
-from django.views.decorators.http import require_http_methods
+from django.utils import timezone
+from django.views.decorators.http import condition, require_http_methods
 from django.contrib import messages
 
-from .models import BlogListPage
+from core.models import CaseTopic
+from core.services.rollup import get_issue_totals
+
 from .forms import ContactForm
+from .services.search import get_blog_list_page
+from .services.sitemaps import INDEX_NAME, get_sitemap_file, read_sitemap_file
+
+# Clients helped in the last 12 months, as last published.
+IMPACT_FALLBACK = {
+    CaseTopic.REPAIRS: 121,
+    CaseTopic.RENT_REDUCTION: 85,
+    CaseTopic.EVICTION: 8,
+}
 
 
 @require_http_methods(["GET"])
@@ -14,6 +30,39 @@ def robots_view(request):
     return render(request, "web/robots.txt", content_type="text/plain")
 
 
+def sitemap_etag(request, name=INDEX_NAME):
+    file_path = get_sitemap_file(name)
+    if not file_path:
+        return None
+
+    stat = os.stat(file_path)
+    # The content depends on the host the sitemap is requested from.
+    return f"{stat.st_mtime_ns}-{stat.st_size}-{request.get_host()}"
+
+
+def sitemap_last_modified(request, name=INDEX_NAME):
+    file_path = get_sitemap_file(name)
+    if not file_path:
+        return None
+
+    return datetime.fromtimestamp(os.path.getmtime(file_path), tz=dt_timezone.utc)
+
+
+@require_http_methods(["GET"])
+@condition(etag_func=sitemap_etag, last_modified_func=sitemap_last_modified)
+def sitemap_view(request, name=INDEX_NAME):
+    """
+    Sitemap index and shards, served from storage, see web.services.sitemaps.
+    """
+    file_path = get_sitemap_file(name)
+    if not file_path:
+        raise Http404()
+
+    origin = f"{request.scheme}://{request.get_host()}"
+    content = read_sitemap_file(file_path, origin)
+    return HttpResponse(content, content_type="application/xml")
+
+
 @require_http_methods(["GET"])
 def landing_view(request):
     form = ContactForm()
@@ -24,7 +73,7 @@ def landing_view(request):
 
 @require_http_methods(["GET"])
 def blog_search_view(request):
-    blog_parent = BlogListPage.objects.get(slug="blog")
+    blog_parent = get_blog_list_page()
     context = blog_parent.get_context(request)
     return render(request, "web/htmx/_blog_results.html", context)
 
@@ -39,6 +88,31 @@ def landing_contact_form_view(request):
     return render(request, "web/htmx/_contact_form.html", {"form": form})
 
 
+@require_http_methods(["GET"])
+def impact_view(request):
+    """
+    Impact page, with live figures for the last 12 months from the impact rollups.
+    """
+    start = timezone.localdate() - timedelta(days=365)
+    totals = get_issue_totals(
+        start=start, group_by=["topic"], provided_legal_services=True
+    )
+    if totals:
+        helped = {t["topic"]: t["num_issues"] for t in totals}
+    else:
+        # The rollups haven't been built, eg. in development.
+        helped = IMPACT_FALLBACK
+
+    context = {
+        "helped": {
+            "repairs": helped.get(CaseTopic.REPAIRS, 0),
+            "rent_reduction": helped.get(CaseTopic.RENT_REDUCTION, 0),
+            "eviction": helped.get(CaseTopic.EVICTION, 0),
+        }
+    }
+    return render(request, "web/about/impact.html", context)
+
+
 @require_http_methods(["GET"])
 def team_view(request):
     return render(
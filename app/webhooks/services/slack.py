@@ -3,11 +3,13 @@ import logging
 from django.conf import settings
 
 from slack.services import send_slack_message
+from utils.tasks import task_options
 from webhooks.models import WebflowContact
 
 logger = logging.getLogger(__name__)
 
 
+@task_options(lane="alerts", max_attempts=5)
 def send_webflow_contact_slack(webflow_contact_pk: str):
     webflow_contact = WebflowContact.objects.get(pk=webflow_contact_pk)
     text = get_text(webflow_contact)
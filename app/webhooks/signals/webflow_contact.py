@@ -2,8 +2,8 @@ import logging
 
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from django_q.tasks import async_task
 
+from utils.tasks import async_task
 from webhooks.models import WebflowContact
 from webhooks.services.slack import send_webflow_contact_slack
 
@@ -16,6 +16,7 @@ run_docker ./manage.py reset_db --close-sessions --noinput
 # Setup latest data
 echo -e "\nRunning migrations"
 run_docker ./manage.py migrate
+run_docker ./manage.py createcachetable
 
 echo -e "\nCreating new superuser 'admin'"
 run_docker ./manage.py createsuperuser \